@@ -7,9 +7,12 @@ import numpy as np
 import re
 from datetime import datetime, timedelta
 import os
+import threading
 from database.dashboard_db import DatabaseManager, load_data_from_db, get_sentiment_stats, get_recent_posts_db
 from database.config import APP_CONFIG
 from database.chatbot import render_chatbot_interface
+from database.retrieval import SearchIndex
+from database.text_cleaning import clean_text_for_display
 
 # Set page config
 st.set_page_config(
@@ -136,47 +139,230 @@ def display_database_status():
         st.error("Please ensure PostgreSQL is running and database credentials are correct in .env file")
         return False
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds only
+@st.cache_resource(max_entries=1)
+def start_background_refresh(data_version):
+    """
+    Bring derived data up to date in the background, re-checked whenever the data version changes:
+    re-clean stored display text when the cleaning rules have changed, and index posts the search
+    index has not seen yet (e.g. on a database upgraded without re-running the migration).
+    Returns (thread or None, posts waiting to be indexed or None when the index tables are missing).
+    """
+    db_manager = init_database()
+    stale_rows = db_manager.count_stale_display_rows()
+    index_pending = SearchIndex(db_manager).pending()
+    if not stale_rows and not index_pending:
+        return None, index_pending
+    
+    # Own manager so the background work does not share the dashboard's connection
+    refresh_manager = DatabaseManager()
+    
+    def reclean_and_reindex():
+        reindex = bool(index_pending)
+        if stale_rows:
+            # Re-cleaned rows get a new updated_at, so the search index picks them up
+            reindex = refresh_manager.reclean_display_text() > 0 or reindex
+        if reindex and index_pending is not None:
+            SearchIndex(refresh_manager).update()
+    
+    thread = threading.Thread(target=reclean_and_reindex, name="background-refresh", daemon=True)
+    thread.start()
+    return thread, index_pending
+
+def show_search_index_status(refresh):
+    """Tell the user when chatbot search cannot see every post yet"""
+    thread, index_pending = refresh
+    if index_pending is None:
+        st.warning("🔍 The search index is not set up, so the assistant cannot search posts. "
+                   "Run `python setup_database.py`, then `python -m database.retrieval`.")
+    elif index_pending and thread is not None and thread.is_alive():
+        st.info(f"🔍 Indexing {index_pending:,} posts in the background; "
+                "answers may miss them until it finishes.")
+
+@st.cache_data(ttl=APP_CONFIG['data_version_check_ttl'])
+def get_data_version():
+    """Current data-version stamp, re-checked every few seconds"""
+    return init_database().get_data_version()
+
 def load_data_from_database(platform='All Platforms', topic='Education'):
-    """Load data from PostgreSQL database and clean HTML content"""
+    """Load display-ready data from PostgreSQL database (text is cleaned at ingest)"""
     try:
-        db_manager = init_database()
-        
-        # Simple logic: 
-        # - If "All Platforms" is selected, show ALL posts from ALL platforms (no filtering)
-        # - If a specific platform is selected, show ALL posts from that platform
-        
-        if platform == 'All Platforms':
-            # Show ALL posts from ALL platforms - no filtering at all
-            df = db_manager.get_platform_data(platform=None, topic=None)
-        else:
-            # Specific platform selected - show all posts from that platform
-            df = db_manager.get_platform_data(platform, topic=None)
-            
-        if df is None or df.empty:
-            st.warning("No data found in database. Please run the migration script first.")
-            return pd.DataFrame()
-        
-        # Convert date column if it exists
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
-        
-        # Clean HTML content from all text fields
-        text_columns = ['title', 'content', 'summary', 'author']
-        for col in text_columns:
-            if col in df.columns:
-                df[col] = df[col].apply(lambda x: clean_text_for_display(x) if pd.notna(x) else '')
-        
-        # Special handling for comment field if it exists (for Reddit/Quora)
-        if 'comment' in df.columns:
-            df['comment'] = df['comment'].apply(lambda x: clean_text_for_display(x) if pd.notna(x) else '')
-        
-        return df
-    
+        return load_data_for_version(platform, topic, get_data_version())
     except Exception as e:
         st.error(f"Error loading data from database: {e}")
         return pd.DataFrame()
 
+# Compact dtypes for the cached frames: low-cardinality labels as categoricals, DECIMAL scores as float32
+CATEGORY_COLUMNS = ['platform', 'sentiment_predicted', 'comment_sentiment']
+SCORE_COLUMNS = ['relevance_score', 'sentiment_negative', 'sentiment_neutral', 'sentiment_positive',
+                 'sentiment_confidence']
+TEXT_COLUMNS = ['title', 'url', 'summary', 'content', 'comment', 'author']
+
+# Memory of the frames last computed by the cached loaders: (name, data version) -> frame_memory_report().
+# st.cache_data does not report evictions, so each loader keeps at most as many entries as its cache holds.
+CACHED_FRAME_MEMORY = {}
+
+@st.cache_data(max_entries=APP_CONFIG['data_cache_max_entries'])
+def load_data_for_version(platform, topic, data_version):
+    """
+    Cached load shared by all sessions, reloaded only when the data version changes.
+    Holds ids, labels, scores and dates only; text is fetched per page with with_display_text().
+    """
+    db_manager = init_database()
+    
+    # Simple logic: 
+    # - If "All Platforms" is selected, show ALL posts from ALL platforms (no filtering)
+    # - If a specific platform is selected, show ALL posts from that platform
+    
+    if platform == 'All Platforms':
+        # Show ALL posts from ALL platforms - no filtering at all
+        df = db_manager.get_display_data(platform=None, include_text=False)
+    else:
+        # Specific platform selected - show all posts from that platform
+        df = db_manager.get_display_data(platform, include_text=False)
+        
+    if df is None or df.empty:
+        st.warning("No data found in database. Please run the migration script first.")
+        return pd.DataFrame()
+    
+    df = prepare_display_frame(df)
+    record_frame_memory('load_data_for_version', f"{platform} posts", data_version, df)
+    return df
+
+@st.cache_data(max_entries=APP_CONFIG['page_cache_max_entries'])
+def load_display_text(post_ids, data_version):
+    """Display text of the given posts, fetched only for the rows on screen"""
+    df = init_database().get_display_text(list(post_ids))
+    if df is None:
+        return pd.DataFrame()
+    return df
+
+def with_display_text(df, data_version):
+    """Rows of a compact frame joined with their display text, in the same order"""
+    if df.empty or 'title' in df.columns:
+        return df
+    text = load_display_text(tuple(int(post_id) for post_id in df['id']), data_version)
+    if text.empty:
+        return df.assign(**{col: '' for col in TEXT_COLUMNS})
+    df = df.merge(text, on='id', how='left')
+    for col in TEXT_COLUMNS:
+        df[col] = df[col].fillna('')
+    return df
+
+def prepare_display_frame(df):
+    """Parse dates and fill missing display text on a frame read from the database"""
+    if df is None or df.empty:
+        return pd.DataFrame()
+    
+    # Convert date column if it exists
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'])
+    
+    # Display columns are already cleaned, only fill missing values
+    text_columns = ['title', 'content', 'summary', 'author', 'comment']
+    for col in text_columns:
+        if col in df.columns:
+            df[col] = df[col].fillna('')
+    
+    # psycopg2 returns DECIMAL as Python Decimal objects; float32 is plenty for scores in [0, 1]
+    for col in SCORE_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if 'quora_question_id' in df.columns:
+        df['quora_question_id'] = df['quora_question_id'].astype('Int32')
+    
+    return df
+
+def frame_memory_report(df):
+    """Rows, deep memory use and the largest columns of a frame"""
+    usage = df.memory_usage(deep=True)
+    columns = usage.drop('Index').sort_values(ascending=False)
+    return {
+        'rows': len(df),
+        'bytes': int(usage.sum()),
+        'largest_columns': ', '.join(f"{col} {size / 1024 ** 2:.1f} MB" for col, size in columns.head(3).items())
+    }
+
+def record_frame_memory(loader, name, data_version, df):
+    """
+    Remember the memory of a frame a cached loader just computed. Entries of older data
+    versions are dropped, and each loader keeps only its latest data_cache_max_entries.
+    """
+    for key in [key for key in list(CACHED_FRAME_MEMORY) if key[1] != data_version]:
+        CACHED_FRAME_MEMORY.pop(key, None)
+    CACHED_FRAME_MEMORY.pop((name, data_version), None)
+    CACHED_FRAME_MEMORY[(name, data_version)] = dict(frame_memory_report(df), loader=loader)
+    
+    from_loader = [key for key, entry in list(CACHED_FRAME_MEMORY.items()) if entry['loader'] == loader]
+    for key in from_loader[:-APP_CONFIG['data_cache_max_entries']]:
+        CACHED_FRAME_MEMORY.pop(key, None)
+
+def show_cache_memory():
+    """Table of the memory used by the data frames this process last computed for its caches"""
+    st.subheader("🧠 Cached Data Memory (last computed)")
+    if not CACHED_FRAME_MEMORY:
+        st.info("No data frames cached yet.")
+        return
+    st.caption("Frames as this process last computed them; Streamlit may have evicted some of them since.")
+    
+    report = pd.DataFrame([
+        {'Frame': name, 'Data version': version, 'Rows': entry['rows'],
+         'Memory (MB)': round(entry['bytes'] / 1024 ** 2, 2), 'Largest columns': entry['largest_columns']}
+        for (name, version), entry in list(CACHED_FRAME_MEMORY.items())
+    ])
+    st.dataframe(report, use_container_width=True, hide_index=True)
+    st.write(f"📊 Total: {report['Memory (MB)'].sum():.1f} MB in {len(report)} last computed frames")
+
+# Dashboard sections each issue their own small query, cached per data version,
+# so the page paints section by section instead of waiting on the full table.
+# The aggregates are read from the precompute worker's table when it has caught up
+# with the current data version (scripts/precompute_worker.py), otherwise queried live.
+
+@st.cache_data(max_entries=APP_CONFIG['data_cache_max_entries'])
+def load_post_count(platform, data_version):
+    """Number of posts for the header and sidebar, read from the loader's per-platform counters"""
+    return init_database().get_post_count(platform)
+
+@st.cache_data(max_entries=APP_CONFIG['data_cache_max_entries'])
+def load_sentiment_counts(platform, data_version):
+    """Post counts per sentiment as a Series indexed by sentiment"""
+    result = init_database().get_aggregate('sentiment_counts', platform, data_version)
+    if result is None or result.empty:
+        return pd.Series(dtype='int64')
+    result = result.dropna(subset=['sentiment_predicted'])
+    return result.set_index('sentiment_predicted')['count']
+
+@st.cache_data(max_entries=APP_CONFIG['data_cache_max_entries'])
+def load_chart_aggregates(platform, data_version):
+    """Platform x sentiment and day x sentiment count tables for the charts"""
+    db_manager = init_database()
+    
+    platform_sentiment = db_manager.get_aggregate('platform_sentiment_counts', platform, data_version)
+    if platform_sentiment is None or platform_sentiment.empty:
+        platform_sentiment = pd.DataFrame()
+    else:
+        platform_sentiment = platform_sentiment.pivot_table(index='platform', columns='sentiment_predicted',
+                                                            values='count', fill_value=0)
+    
+    daily_sentiment = db_manager.get_aggregate('daily_sentiment_counts', platform, data_version)
+    if daily_sentiment is None or daily_sentiment.empty:
+        daily_sentiment = pd.DataFrame()
+    else:
+        # Precomputed days come back as ISO strings
+        daily_sentiment['day'] = pd.to_datetime(daily_sentiment['day']).dt.date
+        daily_sentiment = daily_sentiment.pivot_table(index='day', columns='sentiment_predicted',
+                                                      values='count', fill_value=0)
+    
+    return platform_sentiment, daily_sentiment
+
+@st.cache_data(max_entries=APP_CONFIG['page_cache_max_entries'])
+def load_posts_page(platform, data_version, offset, limit):
+    """One page of display-ready posts, newest first"""
+    df = init_database().get_display_data(platform, limit=limit, offset=offset)
+    return prepare_display_frame(df)
+
 def create_sidebar():
     """Create sidebar with navigation and filters"""
     with st.sidebar:
@@ -210,31 +396,16 @@ def create_sidebar():
         # Show appropriate message based on selection
         if selected_platform == 'All Platforms':
             st.success("📄 Showing ALL posts from ALL platforms")
-            
-            # Show total count across all platforms
-            try:
-                db_manager = init_database()
-                total_query = "SELECT COUNT(*) as count FROM social_media_data"
-                result = db_manager.execute_query(total_query)
-                if result is not None and not result.empty:
-                    count = result.iloc[0]['count']
-                    st.metric("Total Posts", f"{count:,}")
-            except:
-                pass  # Ignore errors in quick stats
         else:
             # For specific platforms, show info about what will be displayed
             st.success(f"📄 Showing ALL {selected_platform} posts")
-            
-            # Show quick stats for the selected platform
-            try:
-                db_manager = init_database()
-                platform_query = f"SELECT COUNT(*) as count FROM social_media_data WHERE platform = '{selected_platform}'"
-                result = db_manager.execute_query(platform_query)
-                if result is not None and not result.empty:
-                    count = result.iloc[0]['count']
-                    st.metric("Total Posts", f"{count:,}")
-            except:
-                pass  # Ignore errors in quick stats
+        
+        # Quick post count, cached per data version so reruns do not query
+        try:
+            count = load_post_count(selected_platform, get_data_version())
+            st.metric("Total Posts", f"{count:,}")
+        except:
+            pass  # Ignore errors in quick stats
         
         # Topic filter is removed completely - no topic filtering anywhere
         selected_topic = 'Education'  # Default value, but not used for filtering
@@ -252,7 +423,7 @@ def create_sidebar():
             if st.button("📊 Show Platform Breakdown"):
                 try:
                     db_manager = init_database()
-                    stats = db_manager.get_platform_stats()
+                    stats = db_manager.get_aggregate('platform_stats', None, get_data_version())
                     if stats is not None and not stats.empty:
                         st.write("**Platform Statistics:**")
                         st.dataframe(stats, use_container_width=True)
@@ -291,16 +462,12 @@ def create_header(total_posts, platform, topic):
         </div>
         """, unsafe_allow_html=True)
 
-def create_sentiment_cards(df):
+def create_sentiment_cards(sentiment_counts, total_posts):
     """Create sentiment summary cards"""
-    if df.empty:
+    if sentiment_counts.empty:
         st.warning("No data available for sentiment analysis")
         return
     
-    # Calculate sentiment distribution
-    sentiment_counts = df['sentiment_predicted'].value_counts()
-    total_posts = len(df)
-    
     # Get sentiment percentages
     positive_pct = (sentiment_counts.get('positive', 0) / total_posts * 100) if total_posts > 0 else 0
     neutral_pct = (sentiment_counts.get('neutral', 0) / total_posts * 100) if total_posts > 0 else 0
@@ -336,9 +503,9 @@ def create_sentiment_cards(df):
         </div>
         """, unsafe_allow_html=True)
 
-def create_charts(df):
-    """Create sentiment analysis charts"""
-    if df.empty:
+def create_charts(sentiment_counts, platform_sentiment, daily_sentiment):
+    """Create sentiment analysis charts from pre-aggregated counts"""
+    if sentiment_counts.empty:
         st.warning("No data available for charts")
         return
     
@@ -348,8 +515,6 @@ def create_charts(df):
         st.subheader("📊 Sentiment Distribution")
         
         # Pie chart for sentiment distribution
-        sentiment_counts = df['sentiment_predicted'].value_counts()
-        
         colors = {
             'positive': '#48bb78',
             'neutral': '#ed8936', 
@@ -376,8 +541,6 @@ def create_charts(df):
         st.subheader("📈 Platform Comparison")
         
         # Bar chart by platform
-        platform_sentiment = df.groupby(['platform', 'sentiment_predicted']).size().unstack(fill_value=0)
-        
         fig_bar = px.bar(
             platform_sentiment,
             title="Sentiment by Platform",
@@ -393,12 +556,9 @@ def create_charts(df):
         st.plotly_chart(fig_bar, use_container_width=True)
     
     # Time series chart if date data is available
-    if 'date' in df.columns and not df['date'].isna().all():
+    if not daily_sentiment.empty:
         st.subheader("📅 Sentiment Over Time")
         
-        # Group by date and sentiment
-        daily_sentiment = df.groupby([df['date'].dt.date, 'sentiment_predicted']).size().unstack(fill_value=0)
-        
         fig_time = px.line(
             daily_sentiment,
             title="Sentiment Trends Over Time",
@@ -470,74 +630,6 @@ def clean_linkedin_title(text):
     else:
         return clean_text.rstrip('.,!?;: ')
 
-def clean_text_for_display(text):
-    """Clean text for display by removing HTML tags and special characters"""
-    if not text or str(text).strip() == '':
-        return ""
-    
-    text_str = str(text)
-    
-    # First pass: Remove obvious HTML tags (including standalone closing tags)
-    text_str = re.sub(r'<[^>]*>', '', text_str)
-    text_str = re.sub(r'<[^>]*$', '', text_str)  # Remove incomplete tags at end
-    text_str = re.sub(r'^[^<]*>', '', text_str)  # Remove incomplete tags at start
-    
-    # Specifically handle common standalone HTML artifacts
-    text_str = re.sub(r'</p>\s*', ' ', text_str)  # Remove </p> tags
-    text_str = re.sub(r'</div>\s*', ' ', text_str)  # Remove </div> tags
-    text_str = re.sub(r'</span>\s*', ' ', text_str)  # Remove </span> tags
-    
-    # Replace HTML entities
-    html_entities = {
-        '&lt;': '<', '&gt;': '>', '&amp;': '&', '&quot;': '"', 
-        '&#x27;': "'", '&nbsp;': ' ', '&#39;': "'", '&apos;': "'",
-        '&ldquo;': '"', '&rdquo;': '"', '&lsquo;': "'", '&rsquo;': "'",
-        '&hellip;': '...', '&mdash;': '—', '&ndash;': '–', '&copy;': '©',
-        '&reg;': '®', '&trade;': '™', '&deg;': '°', '&plusmn;': '±'
-    }
-    
-    for entity, replacement in html_entities.items():
-        text_str = text_str.replace(entity, replacement)
-    
-    # Remove any remaining HTML entities
-    text_str = re.sub(r'&[a-zA-Z0-9#]+;', '', text_str)
-    
-    # Remove CSS style attributes and other HTML attributes
-    text_str = re.sub(r'style\s*=\s*["\'][^"\']*["\']', '', text_str)
-    text_str = re.sub(r'\w+\s*=\s*["\'][^"\']*["\']', '', text_str)
-    
-    # If the text still contains HTML-like content, do aggressive cleaning
-    if '<' in text_str or '>' in text_str or 'style=' in text_str.lower():
-        # Split by angle brackets and keep only text content
-        parts = re.split(r'[<>]', text_str)
-        clean_parts = []
-        
-        for part in parts:
-            part = part.strip()
-            # Skip empty parts and HTML tag-like content
-            if not part:
-                continue
-            if re.match(r'^/?[a-zA-Z][a-zA-Z0-9]*(\s|$)', part):  # Looks like a tag
-                continue
-            if 'style=' in part.lower() or 'class=' in part.lower():  # Contains attributes
-                continue
-            if part.count('=') > 1 and part.count('"') > 1:  # Looks like attributes
-                continue
-                
-            clean_parts.append(part)
-        
-        text_str = ' '.join(clean_parts)
-    
-    # Final cleanup
-    text_str = re.sub(r'\s+', ' ', text_str)
-    text_str = re.sub(r'[\r\n\t]+', ' ', text_str)
-    text_str = text_str.strip()
-    
-    # Remove any remaining problematic characters that might be HTML artifacts
-    text_str = text_str.replace('nan', '').strip()
-    
-    return text_str
-
 def merge_linkedin_posts_by_post_text(df):
     """Group LinkedIn posts by title (post_text) and collect comments for each post"""
     if df.empty:
@@ -546,56 +638,45 @@ def merge_linkedin_posts_by_post_text(df):
     try:
         # For LinkedIn data from database:
         # - title contains the cleaned post_text (the main LinkedIn post)
-        # - content contains the comment_text (comments on the post)
-        
-        merged_posts = []
-        
-        # Group by title (which contains the main post text)
-        grouped = df.groupby('title')
-        
-        for post_title, group in grouped:
-            # Get the first entry as the main post
-            main_post = group.iloc[0].copy()
-            
-            # Collect all non-null comments for this post
-            comments = []
-            for _, row in group.iterrows():
-                comment = row.get('content', '')  # content field contains comment_text
-                if pd.notna(comment) and str(comment).strip() and str(comment).strip().lower() != 'nan':
-                    clean_comment = clean_text_for_display(str(comment))
-                    if clean_comment and len(clean_comment.strip()) > 5:
-                        comments.append(clean_comment)
-            
-            # Create the merged post structure
-            merged_post = {
-                'title': post_title,  # Already cleaned title
-                'content': post_title,  # Use the post title as the main content
-                'platform': 'LinkedIn',
-                'comments': comments,  # List of comments
-                'comment_count': len(comments),
-                'has_comments': len(comments) > 0,
-                'sentiment_predicted': main_post.get('sentiment_predicted', 'neutral'),
-                'sentiment_confidence': main_post.get('sentiment_confidence', 0.0),
-                'date': main_post.get('date'),
-                'relevance_score': main_post.get('relevance_score', 0.0),
-                'relevant_to_education_in_uae': main_post.get('relevant_to_education_in_uae', False),
-                'sentiment_negative': main_post.get('sentiment_negative', 0.0),
-                'sentiment_neutral': main_post.get('sentiment_neutral', 0.0),
-                'sentiment_positive': main_post.get('sentiment_positive', 0.0),
-                'url': main_post.get('url', ''),
-                'author': main_post.get('author', ''),
-                'summary': main_post.get('summary', ''),
-                'combined_text': main_post.get('combined_text', ''),
-                'is_merged': True  # Flag to indicate this is a merged post
-            }
-            
-            merged_posts.append(merged_post)
-        
-        merged_df = pd.DataFrame(merged_posts)
-        
-        # Restore the original index structure
-        if not merged_df.empty:
-            merged_df.index = range(len(merged_df))
+        # - content contains the comment_text (comments on the post), already cleaned at ingest
+        
+        # The first row of each post supplies the post-level attributes
+        main_posts = df.drop_duplicates('title').set_index('title')
+        
+        # List-aggregate the non-trivial comments of each post in one grouped pass
+        comments = df['content'].fillna('').astype(str).str.strip()
+        has_comment = (comments.str.len() > 5) & (comments.str.lower() != 'nan')
+        comment_lists = comments[has_comment].groupby(df.loc[has_comment, 'title'], sort=False).agg(list)
+        comment_lists = comment_lists.reindex(main_posts.index)
+        comment_lists = comment_lists.apply(lambda value: value if isinstance(value, list) else [])
+        comment_counts = comment_lists.str.len()
+        
+        def main_post_column(column, default):
+            if column in main_posts.columns:
+                return main_posts[column].values
+            return default
+        
+        merged_df = pd.DataFrame({
+            'title': main_posts.index,  # Already cleaned title
+            'content': main_posts.index,  # Use the post title as the main content
+            'platform': 'LinkedIn',
+            'comments': comment_lists.values,  # List of comments
+            'comment_count': comment_counts.values,
+            'has_comments': (comment_counts > 0).values,
+            'sentiment_predicted': main_post_column('sentiment_predicted', 'neutral'),
+            'sentiment_confidence': main_post_column('sentiment_confidence', 0.0),
+            'date': main_post_column('date', None),
+            'relevance_score': main_post_column('relevance_score', 0.0),
+            'relevant_to_education_in_uae': main_post_column('relevant_to_education_in_uae', False),
+            'sentiment_negative': main_post_column('sentiment_negative', 0.0),
+            'sentiment_neutral': main_post_column('sentiment_neutral', 0.0),
+            'sentiment_positive': main_post_column('sentiment_positive', 0.0),
+            'url': main_post_column('url', ''),
+            'author': main_post_column('author', ''),
+            'summary': main_post_column('summary', ''),
+            'combined_text': main_post_column('combined_text', ''),
+            'is_merged': True  # Flag to indicate this is a merged post
+        })
         
         return merged_df
         
@@ -604,6 +685,15 @@ def merge_linkedin_posts_by_post_text(df):
         # Fallback to original dataframe
         return df
 
+@st.cache_data(max_entries=APP_CONFIG['data_cache_max_entries'])
+def load_linkedin_threads(topic, data_version):
+    """LinkedIn posts grouped with their comments, built once per data version"""
+    # Grouping needs every post's text, so this one frame is read with it
+    df = prepare_display_frame(init_database().get_display_data('LinkedIn'))
+    threads = merge_linkedin_posts_by_post_text(df)
+    record_frame_memory('load_linkedin_threads', "LinkedIn threads", data_version, threads)
+    return threads
+
 def merge_duplicate_posts(df, platform):
     """Merge posts with same title for LinkedIn only (Quora handled separately)"""
     if platform not in ['LinkedIn'] or df.empty:
@@ -618,6 +708,20 @@ def create_recent_posts(df):
         st.warning("No posts available")
         return
     
+    # Sort by date if available, otherwise by index
+    if 'date' in df.columns:
+        sorted_posts = df.sort_values('date', ascending=False)
+    else:
+        sorted_posts = df.copy()
+    
+    render_recent_posts(len(sorted_posts), lambda start_idx, count: sorted_posts.iloc[start_idx:start_idx + count])
+
+def render_recent_posts(total_posts, get_page):
+    """Paginated posts list; get_page(start_idx, count) returns only the rows of the current page"""
+    if total_posts == 0:
+        st.warning("No posts available")
+        return
+    
     st.subheader("📝 All Posts")
     
     # Initialize session state for pagination
@@ -626,13 +730,6 @@ def create_recent_posts(df):
     if 'current_page' not in st.session_state:
         st.session_state.current_page = 1
     
-    # Sort by date if available, otherwise by index
-    if 'date' in df.columns:
-        sorted_posts = df.sort_values('date', ascending=False)
-    else:
-        sorted_posts = df.copy()
-    
-    total_posts = len(sorted_posts)
     total_pages = (total_posts + st.session_state.posts_per_page - 1) // st.session_state.posts_per_page
     
     # Posts per page selector and pagination info
@@ -651,14 +748,20 @@ def create_recent_posts(df):
     
     # Get posts for current page
     start_idx = (st.session_state.current_page - 1) * st.session_state.posts_per_page
-    end_idx = start_idx + st.session_state.posts_per_page
-    recent_posts = sorted_posts.iloc[start_idx:end_idx]
+    recent_posts = get_page(start_idx, st.session_state.posts_per_page)
     
     # Check if we need to merge duplicate titles (only LinkedIn, Quora handled separately)
     platform = recent_posts['platform'].iloc[0] if not recent_posts.empty else None
-    if platform in ['LinkedIn']:
+    if platform in ['LinkedIn'] and 'is_merged' not in recent_posts.columns:
         recent_posts = merge_duplicate_posts(recent_posts, platform)
     
+    # Answer counts for all Quora questions on this page in one indexed lookup
+    quora_answer_counts = {}
+    if 'quora_question_id' in recent_posts.columns:
+        quora_ids = recent_posts['quora_question_id'].dropna().astype(int).unique().tolist()
+        if quora_ids:
+            quora_answer_counts = init_database().get_quora_answer_counts(quora_ids)
+    
     for idx, post in recent_posts.iterrows():
         sentiment_color = {
             'positive': '#48bb78',
@@ -696,26 +799,9 @@ def create_recent_posts(df):
             raw_title = post.get('title', 'No Title')
             clean_title = clean_text_for_display(raw_title)
             
-            # Get answer count for this question from database
-            from database.dashboard_db import DatabaseManager
-            db = DatabaseManager()
-            answer_count = 1  # Default to 1
-            
-            if db.connect():
-                count_query = """
-                SELECT COUNT(*) as count 
-                FROM social_media_data 
-                WHERE platform = 'Quora' AND title = %(title)s
-                """
-                try:
-                    result = db.execute_query(count_query, {'title': raw_title})
-                    if result is not None and not result.empty:
-                        total_count = result.iloc[0]['count']
-                        # Subtract 1 because first answer contains question merged with answer
-                        answer_count = max(0, total_count - 1)
-                except:
-                    pass
-                db.disconnect()
+            # Answer count comes from the materialized Quora thread table
+            question_id = post.get('quora_question_id')
+            answer_count = quora_answer_counts.get(int(question_id), 0) if pd.notna(question_id) else 0
             
             if answer_count > 0:
                 clean_content = f"📚 {answer_count} answers available - Click to view all"
@@ -858,8 +944,6 @@ def show_post_detail(post, platform, clean_title, full_content):
     
     if platform == 'Quora':
         # Special handling for Quora - show question details and all answers
-        from database.dashboard_db import DatabaseManager
-        
         # Show question details if available
         question_details = post.get('summary', '')
         if question_details and str(question_details).strip() and str(question_details).strip().lower() not in ['nan', '']:
@@ -868,65 +952,29 @@ def show_post_detail(post, platform, clean_title, full_content):
             st.write(clean_details)
             st.markdown("---")
         
-        db = DatabaseManager()
-        if db.connect():
-            # Get all unique answers for this Quora question
-            query = """
-            SELECT DISTINCT content, sentiment_predicted, date, url, summary
-            FROM social_media_data 
-            WHERE platform = 'Quora' AND title = %(title)s
-            ORDER BY date DESC
-            """
-            # Use the original full title for the query, not the truncated one
-            original_title = post.get('title', 'No Title')
-            answers = db.execute_query(query, {'title': original_title})
-            
-            if answers is not None and not answers.empty:
-                # Skip the first answer as it contains the question merged with answer
-                actual_answers = answers.iloc[1:] if len(answers) > 1 else pd.DataFrame()
+        # Answers come pre-deduplicated and ordered from the materialized thread table
+        question_id = post.get('quora_question_id')
+        answers = init_database().get_quora_thread(question_id) if pd.notna(question_id) else None
+        
+        if answers is not None and not answers.empty:
+            st.markdown(f"**📚 {len(answers)} Answer(s):**")
+            for answer_num, answer_row in enumerate(answers.itertuples(index=False), 1):
+                answer_sentiment = answer_row.sentiment_predicted or 'Unknown'
+                answer_date = answer_row.date or 'Unknown'
                 
-                if not actual_answers.empty:
-                    # Further filter to remove duplicate content
-                    unique_answers = []
-                    seen_content = set()
-                    
-                    for i, answer_row in actual_answers.iterrows():
-                        answer_content = answer_row.get('content', 'No answer available')
-                        if answer_content and str(answer_content).strip() and str(answer_content).strip().lower() != 'nan':
-                            # Create a short hash of the content to check for duplicates
-                            content_hash = str(answer_content).strip()[:100].lower()
-                            if content_hash not in seen_content:
-                                seen_content.add(content_hash)
-                                unique_answers.append(answer_row)
-                    
-                    if unique_answers:
-                        st.markdown(f"**📚 {len(unique_answers)} Answer(s):**")
-                        for answer_num, answer_row in enumerate(unique_answers, 1):
-                            answer_content = answer_row.get('content', 'No answer available')
-                            answer_sentiment = answer_row.get('sentiment_predicted', 'Unknown')
-                            answer_date = answer_row.get('date', 'Unknown')
-                            
-                            clean_answer = clean_text_for_display(str(answer_content))
-                            # Don't call clean_quora_comment to avoid duplication
-                            
-                            # Create expandable box for each unique answer
-                            with st.expander(f"💡 Answer {answer_num} - {answer_sentiment.title()} ({answer_date})", expanded=answer_num==1):
-                                st.markdown(clean_answer)
-                                if answer_row.get('url'):
-                                    st.markdown(f"[View on Quora]({answer_row.get('url')})")
-                    else:
-                        st.markdown("**No unique answers available for this question.**")
-                else:
-                    st.markdown("**No clean answers available for this question.**")
-            else:
-                # Fallback to single answer
-                single_answer = post.get('content', 'No answer available')
-                if single_answer and str(single_answer).strip():
-                    clean_answer = clean_text_for_display(str(single_answer))
-                    st.markdown("**Answer:**")
-                    st.write(clean_answer)
-            
-            db.disconnect()
+                # Create expandable box for each unique answer
+                with st.expander(f"💡 Answer {answer_num} - {answer_sentiment.title()} ({answer_date})", expanded=answer_num==1):
+                    st.markdown(answer_row.content)
+                    if answer_row.url:
+                        st.markdown(f"[View on Quora]({answer_row.url})")
+        elif answers is not None:
+            st.markdown("**No unique answers available for this question.**")
+        else:
+            # Fallback to single answer
+            single_answer = post.get('content', 'No answer available')
+            if single_answer and str(single_answer).strip():
+                st.markdown("**Answer:**")
+                st.write(single_answer)
             
     elif platform == 'Reddit':
         # Special handling for Reddit posts with responses
@@ -1115,35 +1163,36 @@ def main():
         """)
         return
     
+    # Kick off a background re-clean / re-index if the cleaning rules or the data changed since the last check
+    refresh = start_background_refresh(get_data_version())
+    
     if selected_page == "📊 Dashboard":
-        # Load data from database
-        df = load_data_from_database(platform, topic)
+        # Each section loads only what it shows: a count, aggregates, then one page of posts
+        data_version = get_data_version()
+        total_posts = load_post_count(platform, data_version)
         
-        if df.empty:
+        if total_posts == 0:
             st.warning("No data found. Please run the migration script to import your CSV/Excel data.")
             st.code("python migrate_data.py", language="bash")
             return
         
-        # Additional cleaning for Quora data to ensure HTML is removed
-        if 'comment' in df.columns:
-            quora_mask = df['platform'] == 'Quora'
-            if quora_mask.any():
-                # Apply aggressive cleaning to Quora comments
-                df.loc[quora_mask, 'comment'] = df.loc[quora_mask, 'comment'].apply(
-                    lambda x: clean_text_for_display(str(x)) if pd.notna(x) and str(x).strip() != '' else ''
-                )
-        
         # Create header
-        create_header(len(df), platform, topic)
+        create_header(total_posts, platform, topic)
         
         # Create sentiment cards
-        create_sentiment_cards(df)
+        sentiment_counts = load_sentiment_counts(platform, data_version)
+        create_sentiment_cards(sentiment_counts, total_posts)
         
         # Create charts
-        create_charts(df)
+        platform_sentiment, daily_sentiment = load_chart_aggregates(platform, data_version)
+        create_charts(sentiment_counts, platform_sentiment, daily_sentiment)
         
-        # Create recent posts
-        create_recent_posts(df)
+        # Create recent posts (LinkedIn posts are listed as cached post/comment threads)
+        if platform == 'LinkedIn':
+            create_recent_posts(load_linkedin_threads(topic, data_version))
+        else:
+            render_recent_posts(total_posts,
+                                lambda start_idx, count: load_posts_page(platform, data_version, start_idx, count))
         
     elif selected_page == "📝 Posts":
         st.header("📝 All Posts")
@@ -1161,7 +1210,8 @@ def main():
             sentiment_filter = st.selectbox("Filter by Sentiment (Optional)", 
                                           ['All', 'positive', 'neutral', 'negative'])
         
-        # Load data based on Posts page platform selection
+        # Load data based on Posts page platform selection (text is fetched per page below)
+        data_version = get_data_version()
         df = load_data_from_database(posts_platform, topic)
         
         if not df.empty:
@@ -1217,7 +1267,7 @@ def main():
                 # Get posts for current page
                 start_idx = (current_page - 1) * posts_per_page
                 end_idx = start_idx + posts_per_page
-                paginated_df = filtered_df.iloc[start_idx:end_idx]
+                paginated_df = with_display_text(filtered_df.iloc[start_idx:end_idx], data_version)
                 
                 # Prepare dataframe with cleaned comments for Quora
                 display_df = prepare_posts_dataframe(paginated_df)
@@ -1271,10 +1321,15 @@ def main():
     elif selected_page == "🤖 AI Assistant":
         st.header("🤖 AI Assistant")
         st.markdown("Ask me anything about your dashboard data and social media analytics!")
+        show_search_index_status(refresh)
         
         # Render the chatbot interface, passing the current platform for context
         render_chatbot_interface(platform)
     
+    elif selected_page == "⚙️ Settings":
+        st.header(f"{selected_page}")
+        show_cache_memory()
+    
     else:
         st.header(f"{selected_page}")
         st.info("This section is under development.")
@@ -2,78 +2,78 @@ import streamlit as st
 import pandas as pd
 from typing import List, Dict, Any, Optional
 import json
-from together import Together
-from database.config import TOGETHER_AI_CONFIG
-from database.dashboard_db import DatabaseManager
+import time
+from database.config import TOGETHER_AI_CONFIG, LLM_CONFIG, QUERY_PLANNER_CONFIG
+from database.dashboard_db import DatabaseManager, get_cached_data_version, get_data_summaries
+from database.retrieval import SearchIndex
+from database.llm_backends import StreamStats, get_backend
+from database.response_cache import create_response_cache
+from database.prompt_builder import PromptBuilder
+from database.query_planner import QueryPlanner
 import plotly.express as px
 import plotly.graph_objects as go
 
 
+@st.cache_resource
+def get_response_cache():
+    """Response cache shared by every session of this dashboard process"""
+    return create_response_cache()
+
+
 class DashboardChatbot:
     """
     Intelligent chatbot for the dashboard that can analyze data and answer questions
-    using Together AI's EXAONE 3.5 32B Instruct model
+    using the configured LLM backend (Together AI by default, see LLM_BACKEND)
     """
     
     def __init__(self):
-        self.client = None
+        self.backend = None
         self.db_manager = None
+        self.search_index = None
+        # Timing of the most recent streamed reply
+        self.last_stats = None
+        self.response_cache = get_response_cache()
+        self.prompt_builder = PromptBuilder()
+        self.query_planner = QueryPlanner()
+        # Token counts of the most recent prompt, per part
+        self.last_prompt_sizes = None
         self.initialize_client()
     
     def initialize_client(self):
-        """Initialize the Together AI client"""
+        """Initialize the LLM backend"""
         try:
-            if TOGETHER_AI_CONFIG['api_key']:
-                self.client = Together(api_key=TOGETHER_AI_CONFIG['api_key'])
+            self.backend = get_backend()
+            if self.backend:
                 self.db_manager = DatabaseManager()
+                self.search_index = SearchIndex(self.db_manager)
             else:
                 st.error("Together AI API key not found. Please add TOGETHER_API_KEY to your .env file.")
         except Exception as e:
-            st.error(f"Failed to initialize Together AI client: {e}")
+            st.error(f"Failed to initialize the {LLM_CONFIG['backend']} chat backend: {e}")
     
     def get_data_context(self, platform: str = 'All Platforms') -> str:
-        """Get current dashboard data context for the AI"""
+        """Get current dashboard data context for the AI from the cached per-platform summaries"""
         try:
             if not self.db_manager:
                 return "Database not available."
             
-            # Get basic stats
-            if platform == 'All Platforms':
-                df = self.db_manager.get_platform_data(platform=None, topic=None)
-            else:
-                df = self.db_manager.get_platform_data(platform, topic=None)
-            
-            if df is None or df.empty:
+            summary = get_data_summaries(get_cached_data_version()).get(platform)
+            if not summary:
                 return "No data available in the dashboard."
             
-            # Create data summary
-            total_posts = len(df)
-            platforms = df['platform'].value_counts().to_dict() if 'platform' in df.columns else {}
-            
-            sentiment_stats = {}
-            if 'sentiment_predicted' in df.columns:
-                sentiment_stats = df['sentiment_predicted'].value_counts().to_dict()
-            elif 'sentiment' in df.columns:
-                sentiment_stats = df['sentiment'].value_counts().to_dict()
-            
-            # Get date range
+            total_posts = summary['total_posts']
             date_range = ""
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
-                date_range = f"from {df['date'].min().strftime('%Y-%m-%d')} to {df['date'].max().strftime('%Y-%m-%d')}"
-            
-            # Store the full dataframe for content analysis
-            self.current_data = df
+            if summary['first_date']:
+                date_range = f"from {summary['first_date']} to {summary['last_date']}"
             
             context = f"""
             Current Dashboard Data Summary:
             - Total Posts: {total_posts}
             - Date Range: {date_range}
-            - Platforms: {platforms}
-            - Sentiment Distribution: {sentiment_stats}
-            - Available Columns: {list(df.columns)}
+            - Platforms: {summary['platforms']}
+            - Sentiment Distribution: {summary['sentiment']}
             
-            I have access to the full content of all {total_posts} posts and can analyze specific topics, 
+            I can search the full content of all {total_posts} posts and can analyze specific topics, 
             search for keywords, summarize content, and provide detailed insights about the actual post content.
             """
             
@@ -82,60 +82,42 @@ class DashboardChatbot:
         except Exception as e:
             return f"Error getting data context: {e}"
     
-    def search_posts_content(self, keywords: List[str], max_posts: int = 20) -> str:
-        """Search for posts containing specific keywords and return relevant content"""
+    def find_relevant_posts(self, keywords: List[str], max_posts: int = 20, platform: str = 'All Platforms') -> List[str]:
+        """Search the post index for the keywords; returns one formatted block per post, best first"""
+        if not self.search_index:
+            return []
+        
+        matching_posts = self.search_index.search(' '.join(keywords), platform=platform, k=max_posts)
+        
+        # Format the results
+        results = []
+        for idx, post in matching_posts.iterrows():
+            result = f"POST {len(results) + 1}:\n"
+            result += f"Platform: {post.get('platform', 'Unknown')}\n"
+            if 'title' in post and pd.notna(post['title']):
+                result += f"Title: {post['title'][:200]}...\n" if len(str(post['title'])) > 200 else f"Title: {post['title']}\n"
+            if 'content' in post and pd.notna(post['content']):
+                result += f"Content: {post['content'][:300]}...\n" if len(str(post['content'])) > 300 else f"Content: {post['content']}\n"
+            if 'sentiment_predicted' in post:
+                result += f"Sentiment: {post['sentiment_predicted']}\n"
+            if 'date' in post and pd.notna(post['date']):
+                result += f"Date: {post['date']}\n"
+            result += "---\n"
+            results.append(result)
+        
+        return results
+    
+    def search_posts_content(self, keywords: List[str], max_posts: int = 20, platform: str = 'All Platforms') -> str:
+        """Search the post index for the keywords and return the best-matching content"""
         try:
-            if not hasattr(self, 'current_data') or self.current_data is None or self.current_data.empty:
+            if not self.search_index:
                 return "No data available for content search."
             
-            df = self.current_data.copy()
-            
-            # Combine title and content for searching
-            search_columns = []
-            if 'title' in df.columns:
-                search_columns.append('title')
-            if 'content' in df.columns:
-                search_columns.append('content')
-            if 'comment' in df.columns:
-                search_columns.append('comment')
-            
-            if not search_columns:
-                return "No searchable text content found in the data."
-            
-            # Create combined search text
-            df['search_text'] = ''
-            for col in search_columns:
-                df['search_text'] += ' ' + df[col].fillna('').astype(str)
-            
-            # Search for keywords (case insensitive)
-            mask = pd.Series([False] * len(df))
-            for keyword in keywords:
-                mask = mask | df['search_text'].str.contains(keyword, case=False, na=False)
-            
-            matching_posts = df[mask].head(max_posts)
-            
-            if matching_posts.empty:
+            results = self.find_relevant_posts(keywords, max_posts, platform)
+            if not results:
                 return f"No posts found containing the keywords: {', '.join(keywords)}"
             
-            # Format the results
-            results = []
-            for idx, post in matching_posts.iterrows():
-                result = f"POST {len(results) + 1}:\n"
-                result += f"Platform: {post.get('platform', 'Unknown')}\n"
-                if 'title' in post and pd.notna(post['title']):
-                    result += f"Title: {post['title'][:200]}...\n" if len(str(post['title'])) > 200 else f"Title: {post['title']}\n"
-                if 'content' in post and pd.notna(post['content']):
-                    result += f"Content: {post['content'][:300]}...\n" if len(str(post['content'])) > 300 else f"Content: {post['content']}\n"
-                if 'sentiment_predicted' in post:
-                    result += f"Sentiment: {post['sentiment_predicted']}\n"
-                elif 'sentiment' in post:
-                    result += f"Sentiment: {post['sentiment']}\n"
-                if 'date' in post and pd.notna(post['date']):
-                    result += f"Date: {post['date']}\n"
-                result += "---\n"
-                results.append(result)
-            
-            summary = f"Found {len(matching_posts)} posts containing keywords: {', '.join(keywords)}\n\n"
+            summary = f"Found {len(results)} posts most relevant to keywords: {', '.join(keywords)}\n\n"
             summary += '\n'.join(results)
             
             return summary
@@ -164,72 +146,135 @@ class DashboardChatbot:
         Keep responses concise but informative. Use emojis occasionally to make responses more engaging.
         """
     
-    def chat_with_ai(self, user_message: str, platform: str = 'All Platforms', chat_history: List[Dict] = None) -> str:
-        """Send message to Together AI and get response"""
-        if not self.client:
-            return "❌ Chatbot not available. Please check your Together AI API key configuration."
+    def generate_analytics_prompt(self, plan, table) -> str:
+        """System prompt for an analytics question: the exact query result instead of the data summary"""
+        return f"""You are an intelligent assistant for a social media sentiment analysis dashboard.
+        The user's question was answered with a database query. These figures are exact and complete:
+
+        {plan.as_text(table)}
+
+        Answer using only these figures. Do not estimate or invent other numbers.
+        Keep responses concise but informative. Use emojis occasionally to make responses more engaging.
+        """
+    
+    def run_query_plan(self, user_message: str, platform: str = 'All Platforms'):
+        """(plan, result table) for an analytics question, or (None, None) if it is not one or the query fails"""
+        plan = self.query_planner.plan(user_message, platform)
+        if not plan or not self.db_manager:
+            return None, None
+        table = plan.run(self.db_manager)
+        if table is None or table.empty:
+            return None, None
+        return plan, table
+    
+    def instant_reply(self, source: str, reply: str, stats: StreamStats = None) -> str:
+        """Record timing for a reply that needs no LLM call (from `stats` if work started earlier)"""
+        self.last_stats = stats or StreamStats(source)
+        self.last_stats.backend_name = source
+        self.last_stats.first_token = self.last_stats.finished = time.perf_counter()
+        self.last_stats.chunks = 1
+        return reply
+    
+    def build_messages(self, user_message: str, platform: str = 'All Platforms', chat_history: List[Dict] = None,
+                       analytics=None) -> List[Dict]:
+        """Assemble the system prompt, relevant posts, recent history and the new message"""
+        if analytics:
+            # Analytics questions only need the query result, not the data summary or posts
+            messages, self.last_prompt_sizes = self.prompt_builder.build(
+                self.generate_analytics_prompt(*analytics), user_message, history=chat_history
+            )
+            return messages
         
-        try:
-            # Check if user is asking for content analysis
-            content_keywords = ['summarize posts', 'posts about', 'find posts', 'search posts', 'posts containing', 'analyze posts']
-            is_content_request = any(keyword in user_message.lower() for keyword in content_keywords)
-            
-            additional_context = ""
-            if is_content_request:
-                # Try to extract keywords from the user's question
-                import re
-                # Look for common patterns like "posts about X", "summarize posts about X"
-                patterns = [
-                    r'posts about (.+?)(?:\s|$)',
-                    r'summarize posts about (.+?)(?:\s|$)',
-                    r'find posts containing (.+?)(?:\s|$)',
-                    r'posts containing (.+?)(?:\s|$)',
-                    r'analyze posts about (.+?)(?:\s|$)'
-                ]
-                
-                keywords = []
-                for pattern in patterns:
-                    match = re.search(pattern, user_message.lower())
-                    if match:
-                        # Extract and clean the keywords
-                        keyword_text = match.group(1).strip()
-                        # Remove common stop words and clean up
-                        keyword_text = re.sub(r'\bthat\b|\bfound\b|\bin\b|\bthis\b|\bdashboard\b', '', keyword_text).strip()
-                        if keyword_text:
-                            keywords.extend([kw.strip() for kw in keyword_text.split() if len(kw.strip()) > 2])
-                
-                # If we found keywords, search for relevant posts
-                if keywords:
-                    # Remove duplicates and take first few keywords
-                    keywords = list(set(keywords))[:5]
-                    search_results = self.search_posts_content(keywords, max_posts=15)
-                    additional_context = f"\n\nRELEVANT POSTS FOUND:\n{search_results}"
-            
-            # Prepare messages
-            system_prompt = self.generate_system_prompt(platform) + additional_context
-            messages = [
-                {"role": "system", "content": system_prompt}
+        # Check if user is asking for content analysis
+        content_keywords = ['summarize posts', 'posts about', 'find posts', 'search posts', 'posts containing', 'analyze posts']
+        is_content_request = any(keyword in user_message.lower() for keyword in content_keywords)
+        
+        posts = []
+        if is_content_request:
+            # Try to extract keywords from the user's question
+            import re
+            # Look for common patterns like "posts about X", "summarize posts about X"
+            patterns = [
+                r'posts about (.+?)(?:\s|$)',
+                r'summarize posts about (.+?)(?:\s|$)',
+                r'find posts containing (.+?)(?:\s|$)',
+                r'posts containing (.+?)(?:\s|$)',
+                r'analyze posts about (.+?)(?:\s|$)'
             ]
             
-            # Add chat history if available
-            if chat_history:
-                messages.extend(chat_history[-10:])  # Keep last 10 messages for context
-            
-            # Add current user message
-            messages.append({"role": "user", "content": user_message})
+            keywords = []
+            for pattern in patterns:
+                match = re.search(pattern, user_message.lower())
+                if match:
+                    # Extract and clean the keywords
+                    keyword_text = match.group(1).strip()
+                    # Remove common stop words and clean up
+                    keyword_text = re.sub(r'\bthat\b|\bfound\b|\bin\b|\bthis\b|\bdashboard\b', '', keyword_text).strip()
+                    if keyword_text:
+                        keywords.extend([kw.strip() for kw in keyword_text.split() if len(kw.strip()) > 2])
             
-            # Make API call
-            response = self.client.chat.completions.create(
-                model=TOGETHER_AI_CONFIG['model'],
-                messages=messages,
-                max_tokens=TOGETHER_AI_CONFIG['max_tokens'],
-                temperature=TOGETHER_AI_CONFIG['temperature']
-            )
+            # If we found keywords, search for relevant posts
+            if keywords:
+                # Remove duplicates and take first few keywords
+                keywords = list(set(keywords))[:5]
+                try:
+                    posts = self.find_relevant_posts(keywords, max_posts=15, platform=platform)
+                    if not posts:
+                        posts = [f"No posts found containing the keywords: {', '.join(keywords)}"]
+                except Exception as e:
+                    posts = [f"Error searching posts: {e}"]
+        
+        # Fit the system prompt, the posts and as much history as the token budget allows
+        messages, self.last_prompt_sizes = self.prompt_builder.build(
+            self.generate_system_prompt(platform), user_message, posts=posts, history=chat_history
+        )
+        return messages
+    
+    def stream_chat(self, user_message: str, platform: str = 'All Platforms', chat_history: List[Dict] = None):
+        """Yield the AI response as it is generated; timing is kept on self.last_stats"""
+        if not self.backend:
+            yield "❌ Chatbot not available. Please check your Together AI API key configuration."
+            return
+        
+        # Only opening questions are cached: later answers depend on the conversation so far
+        cacheable = not chat_history
+        data_version = get_cached_data_version() if cacheable else None
+        # Switching backend or model must not serve the previous model's answers
+        model = f"{self.backend.name}/{self.backend.model}"
+        if cacheable:
+            cached = self.response_cache.get(user_message, platform, data_version, model)
+            if cached is not None:
+                yield self.instant_reply('response cache', cached)
+                return
+        
+        try:
+            # Started before the prompt is built, so first-token time is what the user waits for
+            started = StreamStats(self.backend.name)
             
-            return response.choices[0].message.content
+            # Analytics questions are answered from aggregate SQL, directly or through the LLM
+            plan, table = self.run_query_plan(user_message, platform)
+            if plan and QUERY_PLANNER_CONFIG['direct_answers']:
+                reply = self.instant_reply('query planner', plan.answer(table), started)
+                if cacheable:
+                    self.response_cache.put(user_message, platform, data_version, model, reply)
+                yield reply
+                return
             
+            self.last_stats = started
+            messages = self.build_messages(user_message, platform, chat_history,
+                                           analytics=(plan, table) if plan else None)
+            chunks = []
+            for chunk in self.backend.timed_stream(messages, self.last_stats):
+                chunks.append(chunk)
+                yield chunk
+            if cacheable and chunks:
+                self.response_cache.put(user_message, platform, data_version, model, ''.join(chunks))
         except Exception as e:
-            return f"❌ Error communicating with AI: {e}"
+            yield f"❌ Error communicating with AI: {e}"
+    
+    def chat_with_ai(self, user_message: str, platform: str = 'All Platforms', chat_history: List[Dict] = None) -> str:
+        """Send message to the LLM backend and get the whole response"""
+        return ''.join(self.stream_chat(user_message, platform, chat_history))
     
     def get_suggested_questions(self, platform: str = 'All Platforms') -> List[str]:
         """Get suggested questions based on current data"""
@@ -254,6 +299,24 @@ class DashboardChatbot:
         return base_questions
 
 
+def message_html(message: Dict, streaming: bool = False) -> str:
+    """Chat bubble for one message (a cursor is shown while a reply is still streaming)"""
+    if message["role"] == "user":
+        return f"""
+        <div style="background-color: #4a5568; padding: 0.75rem; border-radius: 10px; margin: 0.5rem 0; margin-left: 2rem;">
+            <strong style="color: #ffd700;">You:</strong> <span style="color: #ffffff;">{message["content"]}</span>
+        </div>
+        """
+    cursor = "▌" if streaming else ""
+    # Keep line breaks of multi-line replies (e.g. the query planner's lists)
+    content = message["content"].replace("\n", "<br>")
+    return f"""
+    <div style="background-color: #2d3748; padding: 0.75rem; border-radius: 10px; margin: 0.5rem 0; margin-right: 2rem; border-left: 3px solid #667eea;">
+        <strong style="color: #667eea;">🤖 AI Assistant:</strong> <span style="color: #ffffff;">{content}{cursor}</span>
+    </div>
+    """
+
+
 def render_chatbot_interface(platform: str = 'All Platforms'):
     """Render the chatbot interface in Streamlit"""
     
@@ -274,8 +337,8 @@ def render_chatbot_interface(platform: str = 'All Platforms'):
     </div>
     """, unsafe_allow_html=True)
     
-    # Check if API key is configured
-    if not TOGETHER_AI_CONFIG['api_key']:
+    # Check if API key is configured (only the Together backend needs one)
+    if LLM_CONFIG['backend'] == 'together' and not TOGETHER_AI_CONFIG['api_key']:
         st.error("🔑 Together AI API key not configured. Please add TOGETHER_API_KEY to your .env file.")
         st.info("Get your API key from: https://api.together.xyz/")
         return
@@ -301,18 +364,7 @@ def render_chatbot_interface(platform: str = 'All Platforms'):
         
         with chat_container:
             for i, message in enumerate(st.session_state.chat_history):
-                if message["role"] == "user":
-                    st.markdown(f"""
-                    <div style="background-color: #4a5568; padding: 0.75rem; border-radius: 10px; margin: 0.5rem 0; margin-left: 2rem;">
-                        <strong style="color: #ffd700;">You:</strong> <span style="color: #ffffff;">{message["content"]}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div style="background-color: #2d3748; padding: 0.75rem; border-radius: 10px; margin: 0.5rem 0; margin-right: 2rem; border-left: 3px solid #667eea;">
-                        <strong style="color: #667eea;">🤖 AI Assistant:</strong> <span style="color: #ffffff;">{message["content"]}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
+                st.markdown(message_html(message), unsafe_allow_html=True)
     
     # Chat input
     user_input = st.chat_input("Ask me anything about your dashboard data...")
@@ -324,22 +376,32 @@ def render_chatbot_interface(platform: str = 'All Platforms'):
     
     # Process user input
     if user_input:
-        # Add user message to history
+        # Add user message to history and show it below the earlier messages
         st.session_state.chat_history.append({"role": "user", "content": user_input})
+        st.markdown(message_html(st.session_state.chat_history[-1]), unsafe_allow_html=True)
         
-        # Get AI response
-        with st.spinner("🤔 Thinking..."):
-            ai_response = st.session_state.chatbot.chat_with_ai(
-                user_input, 
-                platform, 
-                st.session_state.chat_history[:-1]  # Exclude the current message
-            )
+        # Stream the AI response into a placeholder as it arrives
+        placeholder = st.empty()
+        placeholder.markdown(message_html({"role": "assistant", "content": "🤔 Thinking..."}), unsafe_allow_html=True)
+        chatbot = st.session_state.chatbot
+        ai_response = ""
+        for chunk in chatbot.stream_chat(
+            user_input, 
+            platform, 
+            st.session_state.chat_history[:-1]  # Exclude the current message
+        ):
+            ai_response += chunk
+            placeholder.markdown(message_html({"role": "assistant", "content": ai_response}, streaming=True),
+                                 unsafe_allow_html=True)
         
-        # Add AI response to history
+        # Add AI response to history; it is already on screen, so no rerun is needed
         st.session_state.chat_history.append({"role": "assistant", "content": ai_response})
-        
-        # Rerun to update the display
-        st.rerun()
+        placeholder.markdown(message_html(st.session_state.chat_history[-1]), unsafe_allow_html=True)
+        if chatbot.last_stats:
+            prompt_size = ""
+            if chatbot.last_prompt_sizes and chatbot.last_stats.backend_name not in ('response cache', 'query planner'):
+                prompt_size = f" · 📝 Prompt: {chatbot.last_prompt_sizes['total']:,} tokens"
+            st.caption(f"⏱️ {chatbot.last_stats.report()}{prompt_size} · 💾 Response cache: {chatbot.response_cache.report()}")
     
     # Clear chat button
     if st.session_state.chat_history:
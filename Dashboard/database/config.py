@@ -37,9 +37,64 @@ TOGETHER_AI_CONFIG = {
     'temperature': 0.7
 }
 
+# Chat backend: 'together', 'openai' (any OpenAI-compatible server, e.g. a local vLLM/llama.cpp/Ollama)
+# or 'mock' (deterministic offline replies for UI and latency testing)
+LLM_CONFIG = {
+    'backend': os.getenv('LLM_BACKEND', 'together'),
+    'base_url': os.getenv('LLM_BASE_URL', 'http://localhost:8000/v1'),
+    'api_key': os.getenv('LLM_API_KEY', ''),
+    # Empty uses the Together model name above
+    'model': os.getenv('LLM_MODEL', ''),
+    'timeout': int(os.getenv('LLM_TIMEOUT', '60')),
+    'mock_token_delay': float(os.getenv('LLM_MOCK_TOKEN_DELAY', '0.02')),
+    'mock_first_token_delay': float(os.getenv('LLM_MOCK_FIRST_TOKEN_DELAY', '0.2'))
+}
+
+# Shared cache of chatbot answers, keyed by question, platform, data version and LLM model
+RESPONSE_CACHE_CONFIG = {
+    'max_entries': int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '256')),
+    'ttl': int(os.getenv('RESPONSE_CACHE_TTL', '3600')),
+    # Cosine similarity needed to serve a paraphrase (only with RETRIEVAL_EMBEDDING_MODEL set)
+    'similarity_threshold': float(os.getenv('RESPONSE_CACHE_SIMILARITY', '0.92'))
+}
+
+# Chatbot prompt budget (tokens counted with tiktoken when installed, estimated otherwise)
+PROMPT_CONFIG = {
+    'max_prompt_tokens': int(os.getenv('PROMPT_MAX_TOKENS', '6000')),
+    # Share of the budget left after the system prompt and question that retrieved posts may use
+    'posts_share': float(os.getenv('PROMPT_POSTS_SHARE', '0.6')),
+    # Share of the whole budget the user's question may take; longer questions are cut
+    'user_share': float(os.getenv('PROMPT_USER_SHARE', '0.25')),
+    'max_history_messages': int(os.getenv('PROMPT_MAX_HISTORY_MESSAGES', '10')),
+    # Size of the note that stands in for older turns that no longer fit
+    'summary_tokens': int(os.getenv('PROMPT_SUMMARY_TOKENS', '150'))
+}
+
+# Analytics questions ("which platform...", "sentiment trends") are answered from aggregate SQL
+QUERY_PLANNER_CONFIG = {
+    # True: reply with the query result directly; False: let the LLM phrase the exact figures
+    'direct_answers': os.getenv('CHATBOT_DIRECT_ANSWERS', 'False').lower() == 'true'
+}
+
 # Application settings
 APP_CONFIG = {
     'debug': os.getenv('DEBUG', 'False').lower() == 'true',
     'page_title': 'Socio-Economic Platform',
-    'page_icon': '📊'
+    'page_icon': '📊',
+    # Dashboard data caches are keyed on the data-version stamp and hold at most this many entries
+    'data_cache_max_entries': int(os.getenv('DATA_CACHE_MAX_ENTRIES', '12')),
+    # How often (seconds) to check the data-version stamp for newly loaded data
+    'data_version_check_ttl': int(os.getenv('DATA_VERSION_CHECK_TTL', '10')),
+    # Posts pages (one small query each) kept in the per-page cache
+    'page_cache_max_entries': int(os.getenv('PAGE_CACHE_MAX_ENTRIES', '64'))
+}
+
+# Chatbot post retrieval (BM25 index in PostgreSQL, see database/retrieval.py)
+RETRIEVAL_CONFIG = {
+    # Local sentence-transformers model used to rerank BM25 hits; empty disables reranking
+    'embedding_model': os.getenv('RETRIEVAL_EMBEDDING_MODEL', ''),
+    # BM25 candidates fetched per requested post when reranking
+    'rerank_factor': int(os.getenv('RETRIEVAL_RERANK_FACTOR', '4')),
+    # Share of the reranked score taken from embedding similarity (the rest is BM25)
+    'embedding_weight': float(os.getenv('RETRIEVAL_EMBEDDING_WEIGHT', '0.5'))
 } 
\ No newline at end of file
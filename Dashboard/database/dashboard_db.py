@@ -1,19 +1,72 @@
 import psycopg2
+import json
+import threading
+from decimal import Decimal
 import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 import streamlit as st
-from .config import DATABASE_CONFIG, DATABASE_URL
+from .config import DATABASE_CONFIG, DATABASE_URL, APP_CONFIG
+from .text_cleaning import CLEAN_TEXT_VERSION, DISPLAY_COLUMNS, build_display_values
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Channel notified whenever a new data version is stamped (see scripts/precompute_worker.py)
+DATA_LOADED_CHANNEL = 'dashboard_data_loaded'
+
+# Aggregates the precompute worker stores per platform -> DatabaseManager method computing them live
+PRECOMPUTED_AGGREGATES = {
+    'sentiment_counts': 'get_sentiment_counts',
+    'platform_sentiment_counts': 'get_platform_sentiment_counts',
+    'daily_sentiment_counts': 'get_daily_sentiment_counts',
+    'platform_stats': 'get_platform_stats'
+}
+
+# Named server-side prepared statements for single-value queries: name -> (parameter types, SQL)
+PREPARED_STATEMENTS = {
+    'total_post_count': ([], "SELECT COALESCE(SUM(post_count), 0) FROM platform_post_counts"),
+    'platform_post_count': (['VARCHAR'], "SELECT COALESCE(SUM(post_count), 0) FROM platform_post_counts WHERE platform = $1")
+}
+
+# Text columns of a display row (cleaned at ingest; raw text for rows not cleaned yet)
+DISPLAY_TEXT_SELECT = """
+            COALESCE(title_display, title) AS title,
+            url,
+            COALESCE(summary_display, summary) AS summary,
+            COALESCE(content_display, content) AS content,
+            COALESCE(comment_display, comment) AS comment,
+            COALESCE(author_display, author) AS author"""
+
+def _json_default(value):
+    """JSON encoding for values read from PostgreSQL (DECIMAL, DATE, TIMESTAMP)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+def frame_to_payload(df):
+    """JSON-ready {'columns', 'data'} form of a small result frame"""
+    df = df.astype(object).where(pd.notna(df), None)
+    return {'columns': list(df.columns), 'data': df.values.tolist()}
+
+def payload_to_frame(payload):
+    """DataFrame back from frame_to_payload()"""
+    return pd.DataFrame(payload['data'], columns=payload['columns'])
+
 class DatabaseManager:
     def __init__(self):
         self.engine = None
         self.connection = None
+        # Whether precomputed_aggregates exists (older schemas lack it until the next migration)
+        self.precomputed_available = None
+        # Plain psycopg2 connection for execute_scalar and the statements prepared on it
+        self.raw_connection = None
+        self.prepared_statements = set()
+        self.scalar_lock = threading.Lock()
         
     def connect(self):
         """Establish database connection"""
@@ -33,6 +86,9 @@ class DatabaseManager:
             self.connection.close()
         if self.engine:
             self.engine.dispose()
+        if self.raw_connection:
+            self.raw_connection.close()
+            self.raw_connection = None
         logger.info("Database connection closed")
     
     def execute_query(self, query, params=None):
@@ -49,6 +105,38 @@ class DatabaseManager:
             st.error(f"Query execution failed: {e}")
             return None
     
+    def execute_scalar(self, name, *params):
+        """
+        Run one of PREPARED_STATEMENTS and return its single value (None on error).
+        
+        Skips pandas: the statement is prepared once per connection and executed
+        with bound parameters through a plain psycopg2 cursor.
+        """
+        try:
+            with self.scalar_lock:
+                if self.raw_connection is None or self.raw_connection.closed:
+                    self.raw_connection = psycopg2.connect(**DATABASE_CONFIG)
+                    self.raw_connection.autocommit = True
+                    self.prepared_statements = set()
+                
+                cursor = self.raw_connection.cursor()
+                try:
+                    if name not in self.prepared_statements:
+                        types, query = PREPARED_STATEMENTS[name]
+                        type_list = f"({', '.join(types)})" if types else ""
+                        cursor.execute(f"PREPARE {name}{type_list} AS {query}")
+                        self.prepared_statements.add(name)
+                    
+                    arguments = f"({', '.join(['%s'] * len(params))})" if params else ""
+                    cursor.execute(f"EXECUTE {name}{arguments}", params or None)
+                    row = cursor.fetchone()
+                finally:
+                    cursor.close()
+            return row[0] if row else None
+        except Exception as e:
+            logger.error(f"Scalar query {name} failed: {e}")
+            return None
+    
     def insert_data(self, df, table_name, if_exists='append'):
         """Insert DataFrame data into database table"""
         try:
@@ -84,6 +172,326 @@ class DatabaseManager:
         
         return self.execute_query(query, params)
     
+    def get_display_data(self, platform=None, limit=None, offset=0, include_text=True):
+        """
+        Get display-ready rows (text cleaned at ingest) filtered by platform, optionally one page.
+        With include_text=False only ids, labels, scores and dates are read (see get_display_text).
+        """
+        text_select = f"{DISPLAY_TEXT_SELECT}," if include_text else ""
+        query = f"""
+        SELECT
+            id,{text_select}
+            comment_sentiment,
+            relevance_score,
+            relevant_to_education_in_uae,
+            sentiment_negative,
+            sentiment_neutral,
+            sentiment_positive,
+            sentiment_predicted,
+            sentiment_confidence,
+            date,
+            platform,
+            quora_question_id
+        FROM social_media_data 
+        WHERE 1=1
+        """
+        params = {}
+        
+        if platform and platform != 'All Platforms':
+            query += " AND platform = %(platform)s"
+            params['platform'] = platform
+        
+        query += " ORDER BY date DESC NULLS LAST, id"
+        
+        if limit is not None:
+            query += " LIMIT %(limit)s OFFSET %(offset)s"
+            params['limit'] = int(limit)
+            params['offset'] = int(offset)
+        
+        return self.execute_query(query, params)
+    
+    def get_display_text(self, post_ids):
+        """Get the display text columns of the given posts"""
+        if not post_ids:
+            return pd.DataFrame()
+        
+        query = f"""
+        SELECT id,{DISPLAY_TEXT_SELECT}
+        FROM social_media_data
+        WHERE id = ANY(%(ids)s)
+        """
+        return self.execute_query(query, {'ids': [int(post_id) for post_id in post_ids]})
+    
+    def _platform_filter(self, platform):
+        """WHERE clause and params restricting a query to one platform"""
+        if platform and platform != 'All Platforms':
+            return "WHERE platform = %(platform)s", {'platform': platform}
+        return "", {}
+    
+    def count_posts(self, platform=None):
+        """Count posts for a platform (all platforms if None)"""
+        where, params = self._platform_filter(platform)
+        result = self.execute_query(f"SELECT COUNT(*) as count FROM social_media_data {where}", params)
+        if result is None or result.empty:
+            return 0
+        return int(result.iloc[0]['count'])
+    
+    def get_post_count(self, platform=None):
+        """Post count from the loader's platform_post_counts table, counted live if it is unavailable"""
+        if platform and platform != 'All Platforms':
+            count = self.execute_scalar('platform_post_count', platform)
+        else:
+            count = self.execute_scalar('total_post_count')
+        if count is None:
+            return self.count_posts(platform)
+        return int(count)
+    
+    def refresh_platform_counts(self):
+        """Recount posts per platform into platform_post_counts (run by the loader after inserting)"""
+        try:
+            if not self.engine and not self.connect():
+                return False
+            
+            with self.engine.begin() as conn:
+                conn.execute(text("DELETE FROM platform_post_counts"))
+                conn.execute(text("""
+                INSERT INTO platform_post_counts (platform, post_count, updated_at)
+                SELECT platform, COUNT(*), CURRENT_TIMESTAMP
+                FROM social_media_data
+                WHERE platform IS NOT NULL
+                GROUP BY platform
+                """))
+            return True
+        except Exception as e:
+            logger.error(f"Platform count refresh failed: {e}")
+            return False
+    
+    def get_sentiment_counts(self, platform=None):
+        """Get post counts per predicted sentiment"""
+        where, params = self._platform_filter(platform)
+        query = f"""
+        SELECT sentiment_predicted, COUNT(*) as count
+        FROM social_media_data {where}
+        GROUP BY sentiment_predicted
+        ORDER BY count DESC
+        """
+        return self.execute_query(query, params)
+    
+    def get_platform_sentiment_counts(self, platform=None):
+        """Get post counts per platform and predicted sentiment"""
+        where, params = self._platform_filter(platform)
+        query = f"""
+        SELECT platform, sentiment_predicted, COUNT(*) as count
+        FROM social_media_data {where}
+        GROUP BY platform, sentiment_predicted
+        """
+        return self.execute_query(query, params)
+    
+    def get_daily_sentiment_counts(self, platform=None):
+        """Get post counts per day and predicted sentiment (undated posts excluded)"""
+        where, params = self._platform_filter(platform)
+        where = f"{where} AND date IS NOT NULL" if where else "WHERE date IS NOT NULL"
+        query = f"""
+        SELECT DATE(date) as day, sentiment_predicted, COUNT(*) as count
+        FROM social_media_data {where}
+        GROUP BY DATE(date), sentiment_predicted
+        ORDER BY day
+        """
+        return self.execute_query(query, params)
+    
+    def get_data_summaries(self):
+        """
+        Summary statistics per platform (plus 'All Platforms') from one aggregate query:
+        {platform: {'total_posts', 'platforms', 'sentiment', 'first_date', 'last_date'}}
+        """
+        query = """
+        SELECT platform, sentiment_predicted, COUNT(*) as count, MIN(date) as first_date, MAX(date) as last_date
+        FROM social_media_data
+        GROUP BY platform, sentiment_predicted
+        """
+        result = self.execute_query(query)
+        if result is None or result.empty:
+            return {}
+        
+        result['first_date'] = pd.to_datetime(result['first_date'])
+        result['last_date'] = pd.to_datetime(result['last_date'])
+        
+        def summarize(rows):
+            first_date, last_date = rows['first_date'].min(), rows['last_date'].max()
+            return {
+                'total_posts': int(rows['count'].sum()),
+                'platforms': {platform: int(count) for platform, count in
+                              rows.groupby('platform')['count'].sum().sort_values(ascending=False).items()},
+                'sentiment': {sentiment: int(count) for sentiment, count in
+                              rows.groupby('sentiment_predicted')['count'].sum().sort_values(ascending=False).items()},
+                'first_date': first_date.strftime('%Y-%m-%d') if pd.notna(first_date) else None,
+                'last_date': last_date.strftime('%Y-%m-%d') if pd.notna(last_date) else None
+            }
+        
+        summaries = {'All Platforms': summarize(result)}
+        for platform, rows in result.groupby('platform'):
+            summaries[platform] = summarize(rows)
+        return summaries
+    
+    def get_quora_answer_counts(self, question_ids):
+        """Get answer counts for a list of Quora question ids as {question_id: count}"""
+        if not question_ids:
+            return {}
+        
+        query = """
+        SELECT id, answer_count FROM quora_questions
+        WHERE id = ANY(%(ids)s)
+        """
+        result = self.execute_query(query, {'ids': [int(qid) for qid in question_ids]})
+        if result is None or result.empty:
+            return {}
+        return dict(zip(result['id'].astype(int), result['answer_count'].astype(int)))
+    
+    def get_quora_thread(self, question_id):
+        """Get the stored answers of a Quora question in scrape order"""
+        query = """
+        SELECT ordinal, content, sentiment_predicted, date, url
+        FROM quora_answers
+        WHERE question_id = %(question_id)s
+        ORDER BY ordinal
+        """
+        return self.execute_query(query, {'question_id': int(question_id)})
+    
+    def get_data_version(self):
+        """Return the data-version stamp written by the loader (0 if never stamped)"""
+        result = self.execute_query("SELECT version FROM data_version WHERE id = 1")
+        if result is None or result.empty:
+            return 0
+        return int(result.iloc[0]['version'])
+    
+    def bump_data_version(self):
+        """Mark that new data has landed so version-keyed caches reload"""
+        try:
+            if not self.engine and not self.connect():
+                return None
+            
+            with self.engine.begin() as conn:
+                version = conn.execute(text("""
+                INSERT INTO data_version (id, version, updated_at) VALUES (1, 1, CURRENT_TIMESTAMP)
+                ON CONFLICT (id) DO UPDATE
+                SET version = data_version.version + 1, updated_at = CURRENT_TIMESTAMP
+                RETURNING version
+                """)).scalar()
+                # Delivered on commit, so listeners never see a version before its data
+                conn.execute(text("SELECT pg_notify(:channel, :version)"),
+                             {'channel': DATA_LOADED_CHANNEL, 'version': str(version)})
+            
+            logger.info(f"Data version bumped to {version}")
+            return version
+        except Exception as e:
+            logger.error(f"Data version bump failed: {e}")
+            return None
+    
+    def store_precomputed(self, name, platform, data_version, payload):
+        """Save a precomputed artifact (JSON-serializable) for a platform and data version"""
+        if not self.engine and not self.connect():
+            return False
+        
+        with self.engine.begin() as conn:
+            conn.execute(text("""
+            INSERT INTO precomputed_aggregates (name, platform, data_version, payload, computed_at)
+            VALUES (:name, :platform, :data_version, CAST(:payload AS JSONB), CURRENT_TIMESTAMP)
+            ON CONFLICT (name, platform) DO UPDATE
+            SET data_version = EXCLUDED.data_version, payload = EXCLUDED.payload, computed_at = EXCLUDED.computed_at
+            """), {
+                'name': name,
+                'platform': platform,
+                'data_version': data_version,
+                'payload': json.dumps(payload, default=_json_default)
+            })
+        return True
+    
+    def get_precomputed(self, name, platform, data_version):
+        """A precomputed artifact for the platform if it was computed for this data version, else None"""
+        if not self.precomputed_available:
+            result = self.execute_query("SELECT to_regclass('precomputed_aggregates') IS NOT NULL as available")
+            self.precomputed_available = bool(result is not None and not result.empty and result.iloc[0]['available'])
+        if not self.precomputed_available:
+            return None
+        
+        query = """
+        SELECT payload FROM precomputed_aggregates
+        WHERE name = %(name)s AND platform = %(platform)s AND data_version = %(data_version)s
+        """
+        result = self.execute_query(query, {'name': name, 'platform': platform or 'All Platforms',
+                                            'data_version': int(data_version)})
+        if result is None or result.empty:
+            return None
+        payload = result.iloc[0]['payload']
+        return json.loads(payload) if isinstance(payload, str) else payload
+    
+    def get_aggregate(self, name, platform, data_version):
+        """
+        Result frame of one of PRECOMPUTED_AGGREGATES, read from the worker's table when it
+        was computed for this data version, otherwise queried live
+        """
+        payload = self.get_precomputed(name, platform, data_version)
+        if payload is not None:
+            return payload_to_frame(payload)
+        return getattr(self, PRECOMPUTED_AGGREGATES[name])(platform)
+    
+    def count_stale_display_rows(self):
+        """Count rows whose display text was cleaned with older rules (or never)"""
+        query = """
+        SELECT COUNT(*) as count FROM social_media_data
+        WHERE display_version IS DISTINCT FROM %(version)s
+        """
+        result = self.execute_query(query, {'version': CLEAN_TEXT_VERSION})
+        if result is None or result.empty:
+            return 0
+        return int(result.iloc[0]['count'])
+    
+    def reclean_display_text(self, batch_size=500):
+        """Recompute display text for rows cleaned with an older CLEAN_TEXT_VERSION"""
+        if not self.engine and not self.connect():
+            return 0
+        
+        raw_columns = list(DISPLAY_COLUMNS.keys())
+        select_query = text(f"""
+        SELECT id, {', '.join(raw_columns)} FROM social_media_data
+        WHERE display_version IS DISTINCT FROM :version
+        ORDER BY id
+        LIMIT :batch_size
+        """)
+        set_clause = ', '.join(f"{col} = :{col}" for col in DISPLAY_COLUMNS.values())
+        update_query = text(f"""
+        UPDATE social_media_data
+        SET {set_clause}, display_version = :version
+        WHERE id = :id
+        """)
+        
+        updated = 0
+        try:
+            while True:
+                # Separate connection so the re-clean can run next to dashboard queries
+                with self.engine.begin() as conn:
+                    rows = conn.execute(select_query, {'version': CLEAN_TEXT_VERSION, 'batch_size': batch_size}).mappings().all()
+                    if not rows:
+                        break
+                    
+                    values = []
+                    for row in rows:
+                        row_values = build_display_values(row)
+                        row_values['id'] = row['id']
+                        row_values['version'] = CLEAN_TEXT_VERSION
+                        values.append(row_values)
+                    
+                    conn.execute(update_query, values)
+                    updated += len(values)
+            
+            logger.info(f"Re-cleaned display text for {updated} rows (version {CLEAN_TEXT_VERSION})")
+            if updated:
+                self.bump_data_version()
+        except Exception as e:
+            logger.error(f"Display text re-clean failed: {e}")
+        
+        return updated
+    
     def get_sentiment_summary(self, platform=None, topic=None):
         """Get sentiment analysis summary"""
         query = """
@@ -109,9 +517,10 @@ class DatabaseManager:
         
         return self.execute_query(query, params)
     
-    def get_platform_stats(self):
+    def get_platform_stats(self, platform=None):
         """Get statistics by platform"""
-        query = """
+        where, params = self._platform_filter(platform)
+        query = f"""
         SELECT 
             platform,
             COUNT(*) as total_posts,
@@ -119,12 +528,12 @@ class DatabaseManager:
             COUNT(CASE WHEN sentiment_predicted = 'positive' THEN 1 END) as positive_count,
             COUNT(CASE WHEN sentiment_predicted = 'neutral' THEN 1 END) as neutral_count,
             COUNT(CASE WHEN sentiment_predicted = 'negative' THEN 1 END) as negative_count
-        FROM social_media_data 
+        FROM social_media_data {where}
         GROUP BY platform
         ORDER BY total_posts DESC
         """
         
-        return self.execute_query(query)
+        return self.execute_query(query, params)
     
     def get_recent_posts(self, limit=10, platform=None):
         """Get recent posts"""
@@ -168,11 +577,29 @@ class DatabaseManager:
 db_manager = DatabaseManager()
 
 # Utility functions for backward compatibility
-@st.cache_data
 def load_data_from_db(platform='All Platforms', topic='Education'):
     """Load data from database with caching"""
+    return _load_data_for_version(platform, topic, db_manager.get_data_version())
+
+@st.cache_data(max_entries=APP_CONFIG['data_cache_max_entries'])
+def _load_data_for_version(platform, topic, data_version):
+    """Cached load keyed on the data version, so entries go stale only when new data lands"""
     return db_manager.get_platform_data(platform, topic)
 
+@st.cache_data(ttl=APP_CONFIG['data_version_check_ttl'])
+def get_cached_data_version():
+    """Current data-version stamp, re-checked every few seconds"""
+    return db_manager.get_data_version()
+
+@st.cache_data(max_entries=APP_CONFIG['data_cache_max_entries'])
+def get_data_summaries(data_version):
+    """Per-platform summary statistics, computed once per data version and shared by all sessions"""
+    # Written by the precompute worker; computed here only if the worker has not caught up
+    summaries = db_manager.get_precomputed('data_summaries', 'All Platforms', data_version)
+    if summaries is not None:
+        return summaries
+    return db_manager.get_data_summaries()
+
 def get_sentiment_stats(platform='All Platforms', topic='Education'):
     """Get sentiment statistics"""
     return db_manager.get_sentiment_summary(platform, topic)
@@ -0,0 +1,172 @@
+import json
+import time
+import hashlib
+import logging
+import requests
+from .config import TOGETHER_AI_CONFIG, LLM_CONFIG
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class StreamStats:
+    """Timing of one streamed completion: time to first token and total time"""
+
+    def __init__(self, backend_name):
+        self.backend_name = backend_name
+        self.started = time.perf_counter()
+        self.first_token = None
+        self.finished = None
+        self.chunks = 0
+
+    @property
+    def ttft(self):
+        """Seconds until the first non-empty chunk (None if nothing arrived)"""
+        return self.first_token - self.started if self.first_token else None
+
+    @property
+    def total(self):
+        """Seconds until the stream ended"""
+        return (self.finished or time.perf_counter()) - self.started
+
+    def report(self):
+        """One-line summary for logs and the chat UI"""
+        ttft = f"{self.ttft:.2f}s" if self.ttft is not None else "n/a"
+        return f"{self.backend_name}: first token {ttft}, total {self.total:.2f}s, {self.chunks} chunks"
+
+class LLMBackend:
+    """Chat completion backend; subclasses implement stream()"""
+
+    name = 'llm'
+
+    def __init__(self, model, max_tokens=None, temperature=None):
+        self.model = model
+        self.max_tokens = max_tokens or TOGETHER_AI_CONFIG['max_tokens']
+        self.temperature = temperature if temperature is not None else TOGETHER_AI_CONFIG['temperature']
+
+    def stream(self, messages):
+        """Yield the reply to a list of chat messages as text chunks"""
+        raise NotImplementedError
+
+    def timed_stream(self, messages, stats):
+        """stream() that records first-token and total time on `stats`, logged when the stream ends"""
+        try:
+            for chunk in self.stream(messages):
+                if not chunk:
+                    continue
+                if stats.first_token is None:
+                    stats.first_token = time.perf_counter()
+                stats.chunks += 1
+                yield chunk
+        finally:
+            stats.finished = time.perf_counter()
+            logger.info(f"LLM stream {stats.report()}")
+
+    def complete(self, messages):
+        """Whole reply as one string"""
+        return ''.join(self.stream(messages))
+
+class TogetherBackend(LLMBackend):
+    """Together AI chat completions, streamed"""
+
+    name = 'together'
+
+    def __init__(self, api_key, model=None, **kwargs):
+        super().__init__(model or TOGETHER_AI_CONFIG['model'], **kwargs)
+        # Imported here so the other backends work without the together package
+        from together import Together
+        self.client = Together(api_key=api_key)
+
+    def stream(self, messages):
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            stream=True
+        )
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta:
+                yield chunk.choices[0].delta.content or ''
+
+class OpenAICompatibleBackend(LLMBackend):
+    """
+    Any server speaking the OpenAI chat completions API (vLLM, llama.cpp server,
+    Ollama, LM Studio, ...), streamed as server-sent events over plain requests.
+    """
+
+    name = 'openai'
+
+    def __init__(self, base_url, model, api_key=None, timeout=60, **kwargs):
+        super().__init__(model, **kwargs)
+        self.url = base_url.rstrip('/') + '/chat/completions'
+        self.timeout = timeout
+        self.session = requests.Session()
+        if api_key:
+            self.session.headers['Authorization'] = f"Bearer {api_key}"
+
+    def stream(self, messages):
+        payload = {
+            'model': self.model,
+            'messages': messages,
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature,
+            'stream': True
+        }
+        with self.session.post(self.url, json=payload, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[len('data:'):].strip()
+                if data == '[DONE]':
+                    break
+                choices = json.loads(data).get('choices') or [{}]
+                yield (choices[0].get('delta') or {}).get('content') or ''
+
+class MockBackend(LLMBackend):
+    """
+    Deterministic offline backend: the same messages always produce the same
+    reply, streamed word by word with a fixed delay, so the chat UI and its
+    latency can be exercised without network access or an API key.
+    """
+
+    name = 'mock'
+
+    WORDS = ['sentiment', 'posts', 'education', 'platform', 'trend', 'positive', 'neutral', 'negative',
+             'schools', 'fees', 'parents', 'students', 'UAE', 'insight', 'data', 'discussion']
+
+    def __init__(self, model='mock', token_delay=0.02, first_token_delay=0.2, reply_words=60, **kwargs):
+        super().__init__(model, **kwargs)
+        self.token_delay = token_delay
+        self.first_token_delay = first_token_delay
+        self.reply_words = reply_words
+
+    def reply(self, messages):
+        """The full deterministic reply for a conversation"""
+        question = messages[-1]['content'] if messages else ''
+        digest = hashlib.md5(json.dumps(messages, sort_keys=True).encode('utf-8')).digest()
+        words = [self.WORDS[digest[i % len(digest)] % len(self.WORDS)] for i in range(self.reply_words)]
+        return f"(mock reply to: {question[:80]}) " + ' '.join(words)
+
+    def stream(self, messages):
+        time.sleep(self.first_token_delay)
+        for i, word in enumerate(self.reply(messages).split(' ')):
+            if i:
+                time.sleep(self.token_delay)
+            yield word if i == 0 else ' ' + word
+
+def get_backend(name=None):
+    """Backend selected by LLM_BACKEND (together, openai or mock); None if it cannot be configured"""
+    name = (name or LLM_CONFIG['backend']).lower()
+    if name == 'mock':
+        return MockBackend(token_delay=LLM_CONFIG['mock_token_delay'],
+                           first_token_delay=LLM_CONFIG['mock_first_token_delay'])
+    if name == 'openai':
+        return OpenAICompatibleBackend(LLM_CONFIG['base_url'], LLM_CONFIG['model'] or TOGETHER_AI_CONFIG['model'],
+                                       api_key=LLM_CONFIG['api_key'], timeout=LLM_CONFIG['timeout'])
+    if name == 'together':
+        if not TOGETHER_AI_CONFIG['api_key']:
+            return None
+        return TogetherBackend(TOGETHER_AI_CONFIG['api_key'], model=LLM_CONFIG['model'] or None)
+    raise ValueError(f"Unknown LLM backend: {name}")
@@ -0,0 +1,167 @@
+import math
+import logging
+from .config import PROMPT_CONFIG
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Tokens the chat format adds around every message (role, separators)
+MESSAGE_OVERHEAD = 4
+
+# Heading and separator the retrieved posts are appended to the system prompt with
+POSTS_HEADER = "\n\nRELEVANT POSTS FOUND:\n"
+POSTS_SEPARATOR = '\n'
+
+class TokenCounter:
+    """Counts tokens with tiktoken when available, otherwise estimates ~4 characters per token"""
+
+    def __init__(self, encoding_name='cl100k_base'):
+        self.encoding = None
+        if tiktoken is not None:
+            try:
+                self.encoding = tiktoken.get_encoding(encoding_name)
+            except Exception as e:
+                # The encoding file is fetched on first use; without it fall back to the estimate
+                logger.warning(f"tiktoken encoding {encoding_name} unavailable, estimating tokens: {e}")
+
+    def count(self, text):
+        """Tokens in a piece of text"""
+        if not text:
+            return 0
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / 4)
+
+    def message(self, message):
+        """Tokens a chat message takes in the prompt"""
+        return self.count(message['content']) + MESSAGE_OVERHEAD
+
+    def truncate(self, text, max_tokens):
+        """Text cut to at most max_tokens (the last one being '...')"""
+        if self.count(text) <= max_tokens:
+            return text
+        if max_tokens <= 1:
+            return ''
+        if self.encoding is not None:
+            return self.encoding.decode(self.encoding.encode(text, disallowed_special=())[:max_tokens - 1]) + '...'
+        return text[:(max_tokens - 1) * 4] + '...'
+
+class PromptBuilder:
+    """
+    Assembles chat messages within a token budget.
+
+    The system prompt and the new user message always go in, cut to at most
+    half and `user_share` of the budget respectively. Of what is left,
+    up to `posts_share` goes to retrieved posts (best first, whole posts only)
+    and the rest to history, newest turns first. Turns that no longer fit are
+    folded into a short "earlier in this conversation" note of the user's
+    previous questions, or dropped when even that does not fit. Kept history
+    always starts with a user turn.
+    """
+
+    def __init__(self, max_prompt_tokens=None, posts_share=None, max_history_messages=None, summary_tokens=None,
+                 counter=None, user_share=None):
+        self.max_prompt_tokens = max_prompt_tokens or PROMPT_CONFIG['max_prompt_tokens']
+        self.posts_share = posts_share if posts_share is not None else PROMPT_CONFIG['posts_share']
+        self.user_share = user_share if user_share is not None else PROMPT_CONFIG['user_share']
+        self.max_history_messages = max_history_messages or PROMPT_CONFIG['max_history_messages']
+        self.summary_tokens = summary_tokens or PROMPT_CONFIG['summary_tokens']
+        self.counter = counter or TokenCounter()
+
+    def summarize_turns(self, turns):
+        """Compact note listing the user's questions from older turns"""
+        questions = [turn['content'].strip().replace('\n', ' ') for turn in turns if turn['role'] == 'user']
+        if not questions:
+            return ''
+        # Most recent first, so truncation cuts the oldest questions
+        note = "Earlier in this conversation the user asked (most recent first): " + '; '.join(
+            q[:120] for q in reversed(questions))
+        return self.counter.truncate(note, self.summary_tokens)
+
+    def fit_history(self, history, budget):
+        """Most recent history messages (at most max_history_messages) that fit the budget, and their tokens"""
+        kept = []
+        tokens = 0
+        for message in reversed(history[-self.max_history_messages:]):
+            message_tokens = self.counter.message(message)
+            if tokens + message_tokens > budget:
+                break
+            kept.insert(0, message)
+            tokens += message_tokens
+        # An assistant reply whose question was cut would read as unprompted
+        while kept and kept[0]['role'] != 'user':
+            tokens -= self.counter.message(kept.pop(0))
+        return kept, tokens
+
+    def build(self, system_prompt, user_message, posts=None, history=None):
+        """Return (messages, sizes) where sizes records the tokens spent on each part"""
+        posts = posts or []
+        history = history or []
+        counter = self.counter
+
+        # The question may use at most user_share of the budget and the system prompt at most half
+        user_message = counter.truncate(user_message, int(self.max_prompt_tokens * self.user_share) - MESSAGE_OVERHEAD)
+        user_tokens = counter.count(user_message) + MESSAGE_OVERHEAD
+        system_prompt = counter.truncate(system_prompt, self.max_prompt_tokens // 2)
+        system_tokens = counter.count(system_prompt) + MESSAGE_OVERHEAD
+        remaining = max(self.max_prompt_tokens - system_tokens - user_tokens, 0)
+
+        # Retrieved posts, best first, until their share is spent; the heading and separators count too
+        posts_budget = int(remaining * self.posts_share) if history else remaining
+        included_posts = []
+        posts_tokens = 0
+        for post in posts:
+            post_tokens = counter.count(post) + counter.count(POSTS_SEPARATOR if included_posts else POSTS_HEADER)
+            if posts_tokens + post_tokens > posts_budget:
+                break
+            included_posts.append(post)
+            posts_tokens += post_tokens
+        remaining -= posts_tokens
+
+        # History, newest first; if not all of it fits, room is kept for a note summarizing the rest
+        kept, history_tokens = self.fit_history(history, remaining)
+        older = history[:len(history) - len(kept)]
+        summary, summary_tokens = '', 0
+        if older:
+            summary_room = min(self.summary_tokens + MESSAGE_OVERHEAD, remaining // 4)
+            kept, history_tokens = self.fit_history(history, remaining - summary_room)
+            older = history[:len(history) - len(kept)]
+            summary = counter.truncate(self.summarize_turns(older), summary_room - MESSAGE_OVERHEAD)
+            summary_tokens = counter.count(summary) + MESSAGE_OVERHEAD if summary else 0
+            if summary_tokens > summary_room:
+                summary, summary_tokens = '', 0
+
+        if included_posts:
+            system_prompt += POSTS_HEADER + POSTS_SEPARATOR.join(included_posts)
+        messages = [{"role": "system", "content": system_prompt}]
+        if summary:
+            messages.append({"role": "system", "content": summary})
+        messages.extend(kept)
+        messages.append({"role": "user", "content": user_message})
+
+        sizes = {
+            'system': system_tokens,
+            'posts': posts_tokens,
+            'posts_included': len(included_posts),
+            'posts_found': len(posts),
+            'history': history_tokens,
+            'history_kept': len(kept),
+            'history_summarized': len(older) if summary else 0,
+            'history_dropped': len(older) if not summary else 0,
+            'summary': summary_tokens,
+            'user': user_tokens,
+        }
+        sizes['total'] = system_tokens + posts_tokens + history_tokens + summary_tokens + user_tokens
+        logger.info(
+            f"Prompt {sizes['total']}/{self.max_prompt_tokens} tokens: system {system_tokens}, "
+            f"posts {posts_tokens} ({len(included_posts)}/{len(posts)}), history {history_tokens} "
+            f"({len(kept)} kept, {sizes['history_summarized']} summarized, {sizes['history_dropped']} dropped), "
+            f"user {user_tokens}"
+        )
+        return messages, sizes
@@ -0,0 +1,205 @@
+import re
+from datetime import date, timedelta
+import pandas as pd
+
+# Platforms the dashboard knows, matched case-insensitively in questions
+PLATFORMS = ['Khaleej Times', 'LinkedIn', 'Reddit', 'Quora', 'Reuters']
+
+SENTIMENTS = ['positive', 'neutral', 'negative']
+
+# A post counts as engaged when it carries at least one scraped comment (no likes/upvotes are stored)
+HAS_COMMENT = "comment IS NOT NULL AND comment NOT IN ('', 'nan')"
+
+# What a trend question is about ("how has sentiment changed", not "how can I change the filter")
+TREND_SUBJECT = r"\b(sentiment|posts?|positive|negative|neutral|mood|opinions?|comments?|volume|activity|discussions?)\b"
+
+# What a question naming a platform asks about ("which platform has the most posts", not "what platform is this")
+PLATFORM_SUBJECT = (r"\b(most|more|least|fewer|highest|lowest|posts?|sentiment|positive|negative|neutral"
+                    r"|comments?|engagement|active|popular)\b")
+
+# (intent, question pattern, pattern the question must also match or None), checked in this order
+INTENT_PATTERNS = [
+    ('sentiment_trend', r"\btrends?\b|over time|\b(per|by|each) (day|week|month)\b|\b(daily|weekly|monthly)\b"
+                        r"|\bchang(ed|ing)\b|\bchanges? (in|over)\b", TREND_SUBJECT),
+    ('sentiment_breakdown', r"sentiment (distribution|breakdown|split)|\bhow many (positive|negative|neutral)\b"
+                            r"|\b(share|percentage|proportion) of (positive|negative|neutral)\b", None),
+    ('platform_comparison', r"\b(which|what) platforms?\b", PLATFORM_SUBJECT),
+    ('platform_comparison', r"\bcompar|\b(by|per|each|across) platforms?\b"
+                            r"|\bengagement\b|\bmost (active|popular|positive|negative)\b", None),
+    ('post_count', r"\bhow many posts\b|\bnumber of posts\b|\btotal (number of )?posts\b|\bpost counts?\b", None),
+]
+
+# Requests for post content are answered from the search index, not with aggregates
+CONTENT_PATTERN = r"\b(posts|post) (about|containing|mentioning)\b|\b(find|search|summarize|analyze) posts\b"
+
+PERIOD_UNITS = {'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+class QueryPlan:
+    """A recognized analytics question: one parameterized aggregate query and how to present it"""
+
+    def __init__(self, intent, description, query, params, period=None):
+        self.intent = intent
+        self.description = description
+        self.query = query
+        self.params = params
+        self.period = period
+
+    def run(self, db_manager):
+        """Execute the query through the DatabaseManager and shape the result table"""
+        result = db_manager.execute_query(self.query, self.params)
+        if result is None or result.empty:
+            return pd.DataFrame()
+
+        if self.intent == 'sentiment_trend':
+            result['period'] = pd.to_datetime(result['period']).dt.strftime('%Y-%m-%d' if self.period != 'month' else '%Y-%m')
+            result = result.pivot_table(index='period', columns='sentiment', values='posts', fill_value=0)
+            result = result.reindex(columns=[s for s in SENTIMENTS if s in result.columns] +
+                                    [c for c in result.columns if c not in SENTIMENTS])
+            result['total'] = result.sum(axis=1)
+            result = result.astype(int).reset_index()
+            result.columns.name = None
+        elif self.intent == 'sentiment_breakdown':
+            result['share'] = (result['posts'] / result['posts'].sum() * 100).round(1)
+        elif 'avg_confidence' in result.columns:
+            result['avg_confidence'] = result['avg_confidence'].astype(float).round(2)
+        return result
+
+    def as_text(self, table):
+        """Compact plain-text table for the LLM prompt"""
+        return f"{self.description}\n{table.to_string(index=False)}"
+
+    def answer(self, table):
+        """A direct, exact answer without the LLM"""
+        lines = [f"📊 {self.description}"]
+        if self.intent == 'platform_comparison':
+            for row in table.itertuples():
+                lines.append(f"• {row.platform}: {row.posts:,} posts, {row.with_comments:,} with comments "
+                             f"({row.positive:,} positive / {row.neutral:,} neutral / {row.negative:,} negative)")
+        elif self.intent == 'sentiment_breakdown':
+            for row in table.itertuples():
+                lines.append(f"• {row.sentiment}: {row.posts:,} posts ({row.share}%)")
+        elif self.intent == 'post_count':
+            for row in table.itertuples():
+                lines.append(f"• {row.platform}: {row.posts:,} posts")
+        else:
+            columns = [c for c in table.columns if c != 'period']
+            for row in table.to_dict('records'):
+                lines.append(f"• {row['period']}: " + ', '.join(f"{row[c]:,} {c}" for c in columns))
+        return '\n'.join(lines)
+
+class QueryPlanner:
+    """
+    Recognizes analytics questions (sentiment trends, sentiment breakdowns,
+    platform comparisons, post counts) and plans them as aggregate SQL.
+
+    Only whitelisted expressions are put into the SQL text; platforms and
+    dates taken from the question are passed as bound parameters.
+    """
+
+    def detect_intent(self, question):
+        """Name of the analytics intent a question asks for, or None"""
+        text = question.lower()
+        if re.search(CONTENT_PATTERN, text):
+            return None
+        for intent, pattern, subject in INTENT_PATTERNS:
+            if re.search(pattern, text) and (subject is None or re.search(subject, text)):
+                return intent
+        return None
+
+    def platforms_in(self, question, platform):
+        """Platforms named in the question, else the dashboard's selected platform (None for all)"""
+        named = [name for name in PLATFORMS if name.lower() in question.lower()]
+        if named:
+            return named
+        if platform and platform != 'All Platforms':
+            return [platform]
+        return None
+
+    def date_range(self, question):
+        """(since, until, label) from phrases like 'last 3 months', 'past week' or 'in 2024'"""
+        text = question.lower()
+        match = re.search(r"\b(?:last|past|previous)\s+(\d+\s+)?(day|week|month|year)s?\b", text)
+        if match:
+            count = int(match.group(1)) if match.group(1) else 1
+            since = date.today() - timedelta(days=count * PERIOD_UNITS[match.group(2)])
+            label = f"last {count} {match.group(2)}s" if count > 1 else f"last {match.group(2)}"
+            return since, None, label
+        match = re.search(r"\b(?:in|during|for)\s+(20\d\d)\b", text)
+        if match:
+            year = int(match.group(1))
+            return date(year, 1, 1), date(year + 1, 1, 1), f"in {year}"
+        return None, None, None
+
+    def plan(self, question, platform='All Platforms'):
+        """QueryPlan for an analytics question, or None if the question is not one"""
+        intent = self.detect_intent(question)
+        if not intent:
+            return None
+
+        conditions = ["1=1"]
+        params = {}
+        platforms = self.platforms_in(question, platform)
+        if intent == 'platform_comparison' and platforms and len(platforms) < 2:
+            # A comparison needs the other platforms too ("how does Reddit compare to ...")
+            platforms = None
+        if platforms:
+            conditions.append("platform = ANY(%(platforms)s)")
+            params['platforms'] = platforms
+        since, until, label = self.date_range(question)
+        if since:
+            conditions.append("date >= %(since)s")
+            params['since'] = since
+        if until:
+            conditions.append("date < %(until)s")
+            params['until'] = until
+        where = "WHERE " + " AND ".join(conditions)
+        scope = ', '.join(platforms) if platforms else 'all platforms'
+        scope += f", {label}" if label else ''
+
+        if intent == 'sentiment_trend':
+            text = question.lower()
+            if re.search(r"\b(day|daily)\b", text):
+                period = 'day'
+            elif re.search(r"\bweek", text) or (since and (date.today() - since).days <= 92):
+                period = 'week'
+            else:
+                period = 'month'
+            query = f"""
+            SELECT DATE_TRUNC('{period}', date) as period, sentiment_predicted as sentiment, COUNT(*) as posts
+            FROM social_media_data {where} AND date IS NOT NULL
+            GROUP BY 1, 2
+            ORDER BY 1
+            """
+            return QueryPlan(intent, f"Posts per {period} by sentiment ({scope})", query, params, period)
+
+        if intent == 'sentiment_breakdown':
+            query = f"""
+            SELECT sentiment_predicted as sentiment, COUNT(*) as posts
+            FROM social_media_data {where}
+            GROUP BY sentiment_predicted
+            ORDER BY posts DESC
+            """
+            return QueryPlan(intent, f"Sentiment breakdown ({scope})", query, params)
+
+        if intent == 'platform_comparison':
+            sentiment_columns = ',\n                   '.join(
+                f"COUNT(*) FILTER (WHERE sentiment_predicted = '{s}') as {s}" for s in SENTIMENTS)
+            query = f"""
+            SELECT platform, COUNT(*) as posts,
+                   COUNT(*) FILTER (WHERE {HAS_COMMENT}) as with_comments,
+                   {sentiment_columns},
+                   AVG(sentiment_confidence) as avg_confidence
+            FROM social_media_data {where}
+            GROUP BY platform
+            ORDER BY posts DESC
+            """
+            return QueryPlan(intent, f"Posts, comments and sentiment by platform ({scope}); "
+                                     f"engagement is measured as posts with comments", query, params)
+
+        query = f"""
+        SELECT platform, COUNT(*) as posts
+        FROM social_media_data {where}
+        GROUP BY platform
+        ORDER BY posts DESC
+        """
+        return QueryPlan(intent, f"Post counts ({scope})", query, params)
@@ -0,0 +1,113 @@
+import re
+import time
+import threading
+from collections import OrderedDict
+from .config import RESPONSE_CACHE_CONFIG
+from .retrieval import encode, get_encoder
+
+def normalize_question(question):
+    """Lowercase the question and drop emojis, punctuation and extra whitespace"""
+    words = re.findall(r"[\w']+", str(question).lower())
+    return ' '.join(words)
+
+class ResponseCache:
+    """
+    LRU cache of chatbot answers keyed by (normalized question, platform, data version, model).
+
+    Entries expire after `ttl` seconds and the least recently used entry is
+    evicted past `max_entries`. A new data version or a switch of LLM backend
+    or model changes the key, so answers about old data or from another model
+    are never served. When the retrieval embedding model is configured, a miss
+    falls back to the closest cached question for the same platform, data
+    version and model, served if its cosine similarity reaches
+    `similarity_threshold` (paraphrases of the same question).
+    """
+
+    def __init__(self, max_entries=256, ttl=3600, similarity_threshold=0.92):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        # key -> (response, stored at, question embedding or None)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def _key(self, question, platform, data_version, model):
+        """Cache key of a question"""
+        return (normalize_question(question), platform, data_version, model)
+
+    def _expired(self, stored_at):
+        """Whether an entry stored at `stored_at` is past its TTL"""
+        return time.time() - stored_at > self.ttl
+
+    def get(self, question, platform, data_version, model):
+        """Cached answer for the question from the given model (e.g. 'together/Llama-3'), or None"""
+        key = self._key(question, platform, data_version, model)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and not self._expired(entry[1]):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry:
+                del self.entries[key]
+
+        response = self._similar(key) if get_encoder() is not None else None
+        with self.lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.semantic_hits += 1
+        return response
+
+    def _similar(self, key):
+        """Answer of the most similar cached question for the same platform, data version and model"""
+        question_vector = encode([key[0]])[0]
+        best_key, best_score = None, self.similarity_threshold
+        with self.lock:
+            for cached_key, (response, stored_at, vector) in self.entries.items():
+                if vector is None or cached_key[1:] != key[1:] or self._expired(stored_at):
+                    continue
+                score = float(vector @ question_vector)
+                if score >= best_score:
+                    best_key, best_score = cached_key, score
+            if best_key is None:
+                return None
+            self.entries.move_to_end(best_key)
+            return self.entries[best_key][0]
+
+    def put(self, question, platform, data_version, model, response):
+        """Store an answer, evicting the least recently used entries past max_entries"""
+        key = self._key(question, platform, data_version, model)
+        vector = encode([key[0]])[0] if get_encoder() is not None else None
+        with self.lock:
+            self.entries[key] = (response, time.time(), vector)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def stats(self):
+        """Hit/miss counters and the current hit rate"""
+        with self.lock:
+            lookups = self.hits + self.semantic_hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'hits': self.hits,
+                'semantic_hits': self.semantic_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.semantic_hits) / lookups if lookups else 0.0
+            }
+
+    def report(self):
+        """One-line summary of the cache counters"""
+        stats = self.stats()
+        return (f"{stats['hit_rate']:.0%} hit rate ({stats['hits']} exact, {stats['semantic_hits']} similar, "
+                f"{stats['misses']} misses, {stats['entries']} entries)")
+
+def create_response_cache():
+    """Response cache sized from RESPONSE_CACHE_CONFIG"""
+    return ResponseCache(max_entries=RESPONSE_CACHE_CONFIG['max_entries'],
+                         ttl=RESPONSE_CACHE_CONFIG['ttl'],
+                         similarity_threshold=RESPONSE_CACHE_CONFIG['similarity_threshold'])
@@ -0,0 +1,279 @@
+import re
+import threading
+import logging
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from .config import RETRIEVAL_CONFIG
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+
+# Words too common in the corpus to help ranking
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'has', 'have', 'how', 'i',
+    'in', 'is', 'it', 'its', 'me', 'my', 'of', 'on', 'or', 'our', 'so', 'that', 'the', 'their', 'there',
+    'they', 'this', 'to', 'was', 'we', 'were', 'what', 'when', 'which', 'who', 'will', 'with', 'you', 'your',
+    'posts', 'post', 'about', 'find', 'summarize', 'containing', 'analyze', 'show'
+}
+
+# Display columns (falling back to the raw text) that make up a post's indexed text
+INDEXED_COLUMNS = ['title', 'summary', 'content', 'comment']
+
+# Latin letters and digits plus the Arabic block, since some posts are in Arabic
+TOKEN_PATTERN = re.compile(r"[a-z0-9\u0600-\u06ff]+")
+
+def tokenize(text_value):
+    """Lowercased word tokens of a text, without stopwords and one-letter words"""
+    if not text_value:
+        return []
+    return [token for token in TOKEN_PATTERN.findall(str(text_value).lower())
+            if len(token) > 1 and token not in STOPWORDS]
+
+_encoder = None
+_encoder_lock = threading.Lock()
+
+def get_encoder():
+    """Sentence-embedding model for reranking, or None when disabled or not installed"""
+    global _encoder
+    if SentenceTransformer is None or not RETRIEVAL_CONFIG['embedding_model']:
+        return None
+    with _encoder_lock:
+        if _encoder is None:
+            logger.info(f"Loading embedding model {RETRIEVAL_CONFIG['embedding_model']}")
+            _encoder = SentenceTransformer(RETRIEVAL_CONFIG['embedding_model'])
+    return _encoder
+
+def encode(texts):
+    """Unit-length float32 embeddings of a list of texts"""
+    return get_encoder().encode(list(texts), normalize_embeddings=True).astype(np.float32)
+
+class SearchIndex:
+    """
+    Persistent BM25 index over post text, stored in PostgreSQL next to the posts.
+
+    search_postings holds (term, post, term frequency), search_documents the
+    indexed length of each post and the updated_at it was indexed from, and
+    search_index_stats the corpus size and the newest post id and updated_at
+    indexed. update() only re-tokenizes posts that are new or changed since they
+    were indexed, pending() only counts posts past that watermark, and search()
+    ranks with a single query over the postings of the query terms, so the posts
+    table is never loaded.
+    When an embedding model is configured, the BM25 candidates are reranked by
+    cosine similarity with locally computed sentence embeddings.
+    """
+
+    def __init__(self, db_manager):
+        self.db = db_manager
+
+    def _ensure_connection(self):
+        """Connect the manager if it is not connected yet"""
+        return bool(self.db.engine) or self.db.connect()
+
+    def update(self, batch_size=500):
+        """Index posts added or changed since the last update; returns the number of posts indexed"""
+        if not self._ensure_connection():
+            return 0
+
+        text_columns = ', '.join(f"COALESCE(m.{col}_display, m.{col}) AS {col}" for col in INDEXED_COLUMNS)
+        select_query = text(f"""
+        SELECT m.id, m.platform, m.updated_at, {text_columns}
+        FROM social_media_data m
+        LEFT JOIN search_documents d ON d.post_id = m.id
+        WHERE d.post_id IS NULL OR m.updated_at IS DISTINCT FROM d.source_updated_at
+        ORDER BY m.id
+        LIMIT :batch_size
+        """)
+        delete_postings = text("DELETE FROM search_postings WHERE post_id = ANY(:ids)")
+        insert_posting = text("""
+        INSERT INTO search_postings (term, post_id, term_freq)
+        VALUES (:term, :post_id, :term_freq)
+        """)
+        upsert_document = text("""
+        INSERT INTO search_documents (post_id, platform, length, source_updated_at)
+        VALUES (:post_id, :platform, :length, :source_updated_at)
+        ON CONFLICT (post_id) DO UPDATE
+        SET platform = EXCLUDED.platform, length = EXCLUDED.length,
+            source_updated_at = EXCLUDED.source_updated_at, indexed_at = CURRENT_TIMESTAMP
+        """)
+        upsert_embedding = text("""
+        INSERT INTO search_embeddings (post_id, embedding) VALUES (:post_id, :embedding)
+        ON CONFLICT (post_id) DO UPDATE SET embedding = EXCLUDED.embedding
+        """)
+        encoder = get_encoder()
+
+        indexed = 0
+        try:
+            while True:
+                with self.db.engine.begin() as conn:
+                    rows = conn.execute(select_query, {'batch_size': batch_size}).mappings().all()
+                    if not rows:
+                        break
+
+                    postings = []
+                    documents = []
+                    for row in rows:
+                        tokens = tokenize(' '.join(str(row[col] or '') for col in INDEXED_COLUMNS))
+                        counts = {}
+                        for token in tokens:
+                            counts[token] = counts.get(token, 0) + 1
+                        postings.extend({'term': term, 'post_id': row['id'], 'term_freq': freq}
+                                        for term, freq in counts.items())
+                        documents.append({'post_id': row['id'], 'platform': row['platform'],
+                                          'length': len(tokens), 'source_updated_at': row['updated_at']})
+
+                    conn.execute(delete_postings, {'ids': [row['id'] for row in rows]})
+                    if postings:
+                        conn.execute(insert_posting, postings)
+                    conn.execute(upsert_document, documents)
+
+                    if encoder is not None:
+                        embeddings = encode(' '.join(str(row[col] or '') for col in INDEXED_COLUMNS)[:2000]
+                                            for row in rows)
+                        conn.execute(upsert_embedding, [
+                            {'post_id': row['id'], 'embedding': embedding.tobytes()}
+                            for row, embedding in zip(rows, embeddings)
+                        ])
+                    indexed += len(rows)
+
+            # Refreshed on every update so deleted posts (dropped by cascade) leave the statistics too
+            with self.db.engine.begin() as conn:
+                conn.execute(text("""
+                INSERT INTO search_index_stats (id, documents, total_length, last_post_id, last_updated_at, updated_at)
+                SELECT 1, COUNT(*), COALESCE(SUM(length), 0), COALESCE(MAX(post_id), 0), MAX(source_updated_at),
+                       CURRENT_TIMESTAMP
+                FROM search_documents
+                ON CONFLICT (id) DO UPDATE
+                SET documents = EXCLUDED.documents, total_length = EXCLUDED.total_length,
+                    last_post_id = EXCLUDED.last_post_id, last_updated_at = EXCLUDED.last_updated_at,
+                    updated_at = EXCLUDED.updated_at
+                """))
+
+            logger.info(f"Search index updated: {indexed} posts (re)indexed")
+        except Exception as e:
+            logger.error(f"Search index update failed: {e}")
+
+        return indexed
+
+    def pending(self):
+        """
+        Number of posts waiting to be (re)indexed, or None when the index tables are missing.
+        Counts posts newer than the watermark update() left in search_index_stats, which the
+        id and updated_at indexes answer without reading the posts that are already indexed.
+        """
+        if not self._ensure_connection():
+            return None
+        try:
+            with self.db.engine.connect() as conn:
+                stats = conn.execute(text(
+                    "SELECT last_post_id, last_updated_at FROM search_index_stats WHERE id = 1"
+                )).mappings().first()
+                if stats is None:
+                    # An index that was never built has no statistics row even when there is nothing to index
+                    waiting = conn.execute(text("SELECT COUNT(*) FROM social_media_data")).scalar()
+                    return max(waiting, 1)
+                return conn.execute(text("""
+                SELECT COUNT(*) FROM social_media_data
+                WHERE id > :last_post_id OR updated_at > :last_updated_at
+                """), dict(stats)).scalar()
+        except Exception as e:
+            logger.error(f"Search index status check failed: {e}")
+            return None
+
+    def search(self, query, platform=None, k=15):
+        """Top-k posts for a free-text query as a DataFrame with a 'score' column, best first"""
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return pd.DataFrame()
+
+        encoder = get_encoder()
+        candidates = k * RETRIEVAL_CONFIG['rerank_factor'] if encoder is not None else k
+
+        platform_clause = ""
+        params = {'terms': terms, 'k1': K1, 'b': B, 'limit': int(candidates)}
+        if platform and platform != 'All Platforms':
+            platform_clause = "AND d.platform = %(platform)s"
+            params['platform'] = platform
+
+        search_query = f"""
+        WITH stats AS (
+            SELECT documents, GREATEST(total_length::float / NULLIF(documents, 0), 1) AS avgdl
+            FROM search_index_stats WHERE id = 1
+        ),
+        term_df AS (
+            SELECT term, COUNT(*) AS df FROM search_postings
+            WHERE term = ANY(%(terms)s)
+            GROUP BY term
+        ),
+        scores AS (
+            SELECT p.post_id,
+                   SUM(LN(1 + (stats.documents - term_df.df + 0.5) / (term_df.df + 0.5))
+                       * p.term_freq * (%(k1)s + 1)
+                       / (p.term_freq + %(k1)s * (1 - %(b)s + %(b)s * d.length / stats.avgdl))) AS score
+            FROM search_postings p
+            JOIN term_df ON term_df.term = p.term
+            JOIN search_documents d ON d.post_id = p.post_id
+            CROSS JOIN stats
+            WHERE p.term = ANY(%(terms)s) {platform_clause}
+            GROUP BY p.post_id
+            ORDER BY score DESC
+            LIMIT %(limit)s
+        )
+        SELECT
+            m.id,
+            COALESCE(m.title_display, m.title) AS title,
+            COALESCE(m.content_display, m.content) AS content,
+            m.sentiment_predicted,
+            m.date,
+            m.platform,
+            m.url,
+            s.score
+        FROM scores s
+        JOIN social_media_data m ON m.id = s.post_id
+        ORDER BY s.score DESC, m.id
+        """
+
+        results = self.db.execute_query(search_query, params)
+        if results is None or results.empty:
+            return pd.DataFrame()
+
+        if encoder is not None and len(results) > 1:
+            results = self._rerank(query, results)
+        return results.head(k).reset_index(drop=True)
+
+    def _rerank(self, query, results):
+        """Order BM25 candidates by a blend of normalized BM25 score and embedding similarity"""
+        stored = self.db.execute_query(
+            "SELECT post_id, embedding FROM search_embeddings WHERE post_id = ANY(%(ids)s)",
+            {'ids': [int(post_id) for post_id in results['id']]}
+        )
+        if stored is None or stored.empty:
+            return results
+
+        vectors = {int(row.post_id): np.frombuffer(bytes(row.embedding), dtype=np.float32)
+                   for row in stored.itertuples()}
+        query_vector = encode([query])[0]
+        similarity = results['id'].map(lambda post_id: float(vectors[post_id] @ query_vector)
+                                       if post_id in vectors else 0.0)
+
+        bm25 = results['score'].astype(float)
+        bm25 = bm25 / bm25.max() if bm25.max() > 0 else bm25
+        weight = RETRIEVAL_CONFIG['embedding_weight']
+        results = results.assign(score=(1 - weight) * bm25 + weight * similarity)
+        return results.sort_values('score', ascending=False)
+
+if __name__ == "__main__":
+    # Build or refresh the index: python -m database.retrieval (from the Dashboard directory)
+    from .dashboard_db import DatabaseManager
+    count = SearchIndex(DatabaseManager()).update()
+    print(f"✅ Search index updated ({count} posts indexed)")
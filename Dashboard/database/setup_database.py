@@ -39,6 +39,96 @@ def create_database():
         logger.error(f"Error creating database: {e}")
         return False
 
+DATA_VERSION_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS data_version (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+INSERT INTO data_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING;
+"""
+
+QUORA_THREAD_TABLES_QUERY = """
+CREATE TABLE IF NOT EXISTS quora_questions (
+    id SERIAL PRIMARY KEY,
+    title TEXT NOT NULL,
+    details TEXT,
+    url TEXT,
+    answer_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_quora_questions_title ON quora_questions(md5(title));
+
+CREATE TABLE IF NOT EXISTS quora_answers (
+    id SERIAL PRIMARY KEY,
+    question_id INTEGER NOT NULL REFERENCES quora_questions(id) ON DELETE CASCADE,
+    ordinal INTEGER NOT NULL,
+    content TEXT,
+    content_hash CHAR(32) NOT NULL,
+    sentiment_predicted VARCHAR(20),
+    sentiment_confidence DECIMAL,
+    date DATE,
+    url TEXT,
+    UNIQUE (question_id, content_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_quora_answers_question ON quora_answers(question_id, ordinal);
+"""
+
+SEARCH_INDEX_TABLES_QUERY = """
+CREATE TABLE IF NOT EXISTS search_documents (
+    post_id INTEGER PRIMARY KEY REFERENCES social_media_data(id) ON DELETE CASCADE,
+    platform VARCHAR(50),
+    length INTEGER NOT NULL,
+    source_updated_at TIMESTAMP,
+    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_search_documents_platform ON search_documents(platform);
+
+CREATE TABLE IF NOT EXISTS search_postings (
+    term TEXT NOT NULL,
+    post_id INTEGER NOT NULL REFERENCES social_media_data(id) ON DELETE CASCADE,
+    term_freq INTEGER NOT NULL,
+    PRIMARY KEY (term, post_id)
+);
+CREATE INDEX IF NOT EXISTS idx_search_postings_post ON search_postings(post_id);
+
+CREATE TABLE IF NOT EXISTS search_index_stats (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    documents INTEGER NOT NULL DEFAULT 0,
+    total_length BIGINT NOT NULL DEFAULT 0,
+    last_post_id INTEGER NOT NULL DEFAULT 0,
+    last_updated_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS search_embeddings (
+    post_id INTEGER PRIMARY KEY REFERENCES social_media_data(id) ON DELETE CASCADE,
+    embedding BYTEA NOT NULL
+);
+"""
+
+PRECOMPUTED_TABLES_QUERY = """
+CREATE TABLE IF NOT EXISTS precomputed_aggregates (
+    name VARCHAR(50) NOT NULL,
+    platform VARCHAR(50) NOT NULL,
+    data_version INTEGER NOT NULL,
+    payload JSONB NOT NULL,
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (name, platform)
+);
+"""
+
+PLATFORM_COUNTS_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS platform_post_counts (
+    platform VARCHAR(50) PRIMARY KEY,
+    post_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+INSERT INTO platform_post_counts (platform, post_count)
+SELECT platform, COUNT(*) FROM social_media_data WHERE platform IS NOT NULL GROUP BY platform
+ON CONFLICT (platform) DO NOTHING;
+"""
+
 def create_tables():
     """Create necessary tables"""
     try:
@@ -47,6 +137,9 @@ def create_tables():
         
         # Drop existing table to recreate with updated schema
         cursor.execute("DROP TABLE IF EXISTS social_media_data CASCADE;")
+        cursor.execute("DROP TABLE IF EXISTS quora_answers, quora_questions CASCADE;")
+        cursor.execute("DROP TABLE IF EXISTS search_postings, search_documents, search_index_stats, search_embeddings CASCADE;")
+        cursor.execute("DROP TABLE IF EXISTS precomputed_aggregates, platform_post_counts;")
         
         # Create social_media_data table with updated schema
         create_table_query = """
@@ -70,6 +163,13 @@ def create_tables():
             date DATE,
             platform VARCHAR(50),
             platform_type VARCHAR(50),
+            title_display TEXT,
+            content_display TEXT,
+            summary_display TEXT,
+            author_display TEXT,
+            comment_display TEXT,
+            display_version INTEGER,
+            quora_question_id INTEGER,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
@@ -84,7 +184,10 @@ def create_tables():
             "CREATE INDEX IF NOT EXISTS idx_date ON social_media_data(date);",
             "CREATE INDEX IF NOT EXISTS idx_platform_date ON social_media_data(platform, date);",
             "CREATE INDEX IF NOT EXISTS idx_relevance ON social_media_data(relevant_to_education_in_uae);",
-            "CREATE INDEX IF NOT EXISTS idx_sentiment_confidence ON social_media_data(sentiment_confidence);"
+            "CREATE INDEX IF NOT EXISTS idx_sentiment_confidence ON social_media_data(sentiment_confidence);",
+            "CREATE INDEX IF NOT EXISTS idx_display_version ON social_media_data(display_version);",
+            "CREATE INDEX IF NOT EXISTS idx_quora_question ON social_media_data(quora_question_id);",
+            "CREATE INDEX IF NOT EXISTS idx_updated_at ON social_media_data(updated_at);"
         ]
         
         for index in indexes:
@@ -109,6 +212,21 @@ def create_tables():
         
         cursor.execute(trigger_query)
         
+        # Data-version stamp bumped by the loader, used to key dashboard caches
+        cursor.execute(DATA_VERSION_TABLE_QUERY)
+        
+        # Normalized Quora question/answer threads built by the loader
+        cursor.execute(QUORA_THREAD_TABLES_QUERY)
+        
+        # BM25 search index over post text used by the chatbot (see database/retrieval.py)
+        cursor.execute(SEARCH_INDEX_TABLES_QUERY)
+        
+        # Dashboard aggregates and chatbot summaries written by scripts/precompute_worker.py
+        cursor.execute(PRECOMPUTED_TABLES_QUERY)
+        
+        # Per-platform post counts refreshed by the loader, read by the sidebar and header
+        cursor.execute(PLATFORM_COUNTS_TABLE_QUERY)
+        
         conn.commit()
         cursor.close()
         conn.close()
@@ -120,6 +238,45 @@ def create_tables():
         logger.error(f"Error creating tables: {e}")
         return False
 
+def upgrade_schema():
+    """Add columns introduced after the initial schema to an existing table"""
+    try:
+        conn = psycopg2.connect(**DATABASE_CONFIG)
+        cursor = conn.cursor()
+        
+        # Display-ready text columns filled at ingest (see database/text_cleaning.py)
+        for column in ['title_display', 'content_display', 'summary_display', 'author_display', 'comment_display']:
+            cursor.execute(f"ALTER TABLE social_media_data ADD COLUMN IF NOT EXISTS {column} TEXT;")
+        cursor.execute("ALTER TABLE social_media_data ADD COLUMN IF NOT EXISTS display_version INTEGER;")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_display_version ON social_media_data(display_version);")
+        
+        cursor.execute(DATA_VERSION_TABLE_QUERY)
+        
+        cursor.execute("ALTER TABLE social_media_data ADD COLUMN IF NOT EXISTS quora_question_id INTEGER;")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_quora_question ON social_media_data(quora_question_id);")
+        cursor.execute(QUORA_THREAD_TABLES_QUERY)
+        
+        cursor.execute(SEARCH_INDEX_TABLES_QUERY)
+        # Newest post indexed, so checking for unindexed posts only reads the posts after it
+        cursor.execute("ALTER TABLE search_index_stats ADD COLUMN IF NOT EXISTS last_post_id INTEGER NOT NULL DEFAULT 0;")
+        cursor.execute("ALTER TABLE search_index_stats ADD COLUMN IF NOT EXISTS last_updated_at TIMESTAMP;")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_updated_at ON social_media_data(updated_at);")
+        
+        cursor.execute(PRECOMPUTED_TABLES_QUERY)
+        
+        cursor.execute(PLATFORM_COUNTS_TABLE_QUERY)
+        
+        conn.commit()
+        cursor.close()
+        conn.close()
+        
+        logger.info("Schema upgraded successfully")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error upgrading schema: {e}")
+        return False
+
 def setup_database():
     """Complete database setup"""
     logger.info("Starting database setup...")
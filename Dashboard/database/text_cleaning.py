@@ -0,0 +1,88 @@
+import re
+
+# Bump this whenever clean_text_for_display changes so stored display text is re-cleaned
+CLEAN_TEXT_VERSION = 1
+
+# Raw text column -> column holding its display-ready version
+DISPLAY_COLUMNS = {
+    'title': 'title_display',
+    'content': 'content_display',
+    'summary': 'summary_display',
+    'author': 'author_display',
+    'comment': 'comment_display'
+}
+
+def clean_text_for_display(text):
+    """Clean text for display by removing HTML tags and special characters"""
+    if not text or str(text).strip() == '':
+        return ""
+    
+    text_str = str(text)
+    
+    # First pass: Remove obvious HTML tags (including standalone closing tags)
+    text_str = re.sub(r'<[^>]*>', '', text_str)
+    text_str = re.sub(r'<[^>]*$', '', text_str)  # Remove incomplete tags at end
+    text_str = re.sub(r'^[^<]*>', '', text_str)  # Remove incomplete tags at start
+    
+    # Specifically handle common standalone HTML artifacts
+    text_str = re.sub(r'</p>\s*', ' ', text_str)  # Remove </p> tags
+    text_str = re.sub(r'</div>\s*', ' ', text_str)  # Remove </div> tags
+    text_str = re.sub(r'</span>\s*', ' ', text_str)  # Remove </span> tags
+    
+    # Replace HTML entities
+    html_entities = {
+        '&lt;': '<', '&gt;': '>', '&amp;': '&', '&quot;': '"', 
+        '&#x27;': "'", '&nbsp;': ' ', '&#39;': "'", '&apos;': "'",
+        '&ldquo;': '"', '&rdquo;': '"', '&lsquo;': "'", '&rsquo;': "'",
+        '&hellip;': '...', '&mdash;': '—', '&ndash;': '–', '&copy;': '©',
+        '&reg;': '®', '&trade;': '™', '&deg;': '°', '&plusmn;': '±'
+    }
+    
+    for entity, replacement in html_entities.items():
+        text_str = text_str.replace(entity, replacement)
+    
+    # Remove any remaining HTML entities
+    text_str = re.sub(r'&[a-zA-Z0-9#]+;', '', text_str)
+    
+    # Remove CSS style attributes and other HTML attributes
+    text_str = re.sub(r'style\s*=\s*["\'][^"\']*["\']', '', text_str)
+    text_str = re.sub(r'\w+\s*=\s*["\'][^"\']*["\']', '', text_str)
+    
+    # If the text still contains HTML-like content, do aggressive cleaning
+    if '<' in text_str or '>' in text_str or 'style=' in text_str.lower():
+        # Split by angle brackets and keep only text content
+        parts = re.split(r'[<>]', text_str)
+        clean_parts = []
+        
+        for part in parts:
+            part = part.strip()
+            # Skip empty parts and HTML tag-like content
+            if not part:
+                continue
+            if re.match(r'^/?[a-zA-Z][a-zA-Z0-9]*(\s|$)', part):  # Looks like a tag
+                continue
+            if 'style=' in part.lower() or 'class=' in part.lower():  # Contains attributes
+                continue
+            if part.count('=') > 1 and part.count('"') > 1:  # Looks like attributes
+                continue
+                
+            clean_parts.append(part)
+        
+        text_str = ' '.join(clean_parts)
+    
+    # Final cleanup
+    text_str = re.sub(r'\s+', ' ', text_str)
+    text_str = re.sub(r'[\r\n\t]+', ' ', text_str)
+    text_str = text_str.strip()
+    
+    # Remove any remaining problematic characters that might be HTML artifacts
+    text_str = text_str.replace('nan', '').strip()
+    
+    return text_str
+
+def build_display_values(row):
+    """Return display-ready versions of the raw text columns in a row"""
+    return {
+        display_col: clean_text_for_display(row.get(raw_col, ''))
+        for raw_col, display_col in DISPLAY_COLUMNS.items()
+    }
@@ -0,0 +1,321 @@
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+import types
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# The assistant answers without an API key or the mock's simulated typing; set before the database config is imported
+os.environ.setdefault('LLM_BACKEND', 'mock')
+os.environ.setdefault('LLM_MOCK_TOKEN_DELAY', '0')
+os.environ.setdefault('LLM_MOCK_FIRST_TOKEN_DELAY', '0')
+
+import numpy as np
+import pandas as pd
+import psycopg2
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from streamlit.testing.v1 import AppTest
+from database.config import DATABASE_CONFIG
+from database.dashboard_db import DatabaseManager
+from database.setup_database import create_database, create_tables
+from database.retrieval import SearchIndex
+from database.text_cleaning import CLEAN_TEXT_VERSION
+
+DASHBOARD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Share of synthetic posts per platform
+PLATFORM_WEIGHTS = {'Khaleej Times': 0.2, 'LinkedIn': 0.25, 'Reddit': 0.25, 'Quora': 0.15, 'Reuters': 0.15}
+
+SENTIMENTS = np.array(['negative', 'neutral', 'positive'])
+
+# Words the synthetic posts are drawn from, so chatbot searches find realistic numbers of matches
+VOCABULARY = np.array([
+    'school', 'schools', 'education', 'fees', 'tuition', 'teacher', 'teachers', 'students', 'parents',
+    'curriculum', 'university', 'exam', 'exams', 'uae', 'dubai', 'abu', 'dhabi', 'sharjah', 'private',
+    'public', 'ministry', 'policy', 'online', 'learning', 'classes', 'grades', 'admission', 'scholarship',
+    'cost', 'quality', 'british', 'american', 'indian', 'ib', 'kindergarten', 'primary', 'secondary',
+    'college', 'campus', 'new', 'year', 'term', 'rating', 'khda', 'inspection', 'results', 'summer',
+    'support', 'special', 'needs', 'arabic', 'english', 'math', 'science', 'technology', 'ai',
+    'good', 'bad', 'expensive', 'affordable', 'better', 'worse', 'great', 'poor', 'best', 'improve'
+])
+
+# Questions the simulated users ask the assistant (post searches, not analytics the planner answers)
+SEARCH_QUESTIONS = ["Find posts about school fees", "Find posts about teachers",
+                    "Find posts about university admission", "Find posts about online learning"]
+
+# What each simulated user does, in order; latency is reported per step
+STEPS = ['first render', 'rerun', 'post detail', 'assistant page', 'assistant answer']
+
+SEED_COLUMNS = [
+    'title', 'url', 'summary', 'content', 'comment', 'comment_sentiment', 'author', 'combined_text',
+    'relevance_score', 'relevant_to_education_in_uae', 'sentiment_negative', 'sentiment_neutral',
+    'sentiment_positive', 'sentiment_predicted', 'sentiment_confidence', 'date', 'platform',
+    'title_display', 'content_display', 'summary_display', 'author_display', 'comment_display', 'display_version'
+]
+
+def random_text(rng, rows, words):
+    """One string of `words` random vocabulary words per row"""
+    return [' '.join(row) for row in rng.choice(VOCABULARY, size=(rows, words))]
+
+def synthetic_chunk(rng, start, rows):
+    """A frame of synthetic posts with the columns of social_media_data"""
+    scores = rng.dirichlet([1.0, 1.5, 1.2], size=rows)
+    predicted = scores.argmax(axis=1)
+    platforms = rng.choice(list(PLATFORM_WEIGHTS), size=rows, p=list(PLATFORM_WEIGHTS.values()))
+    days_ago = rng.integers(0, 730, size=rows)
+    has_comment = rng.random(rows) < 0.4
+
+    title = random_text(rng, rows, 8)
+    content = random_text(rng, rows, 60)
+    summary = random_text(rng, rows, 20)
+    comment = np.where(has_comment, random_text(rng, rows, 15), '')
+    author = [f"user_{i}" for i in rng.integers(0, max(rows // 20, 1), size=rows) + start]
+
+    df = pd.DataFrame({
+        'title': title,
+        'url': [f"https://example.com/posts/{i}" for i in range(start, start + rows)],
+        'summary': summary,
+        'content': content,
+        'comment': comment,
+        'comment_sentiment': np.where(has_comment, rng.choice(SENTIMENTS, size=rows), ''),
+        'author': author,
+        'combined_text': [f"{t} {c}" for t, c in zip(title, content)],
+        'relevance_score': rng.random(rows).round(4),
+        'relevant_to_education_in_uae': rng.random(rows) < 0.8,
+        'sentiment_negative': scores[:, 0].round(4),
+        'sentiment_neutral': scores[:, 1].round(4),
+        'sentiment_positive': scores[:, 2].round(4),
+        'sentiment_predicted': SENTIMENTS[predicted],
+        'sentiment_confidence': scores.max(axis=1).round(4),
+        'date': pd.Timestamp.today().normalize() - pd.to_timedelta(days_ago, unit='D'),
+        'platform': platforms,
+    })
+    # Synthetic text is already clean, so the display columns are copies
+    for column in ['title', 'content', 'summary', 'author', 'comment']:
+        df[f"{column}_display"] = df[column]
+    df['display_version'] = CLEAN_TEXT_VERSION
+    return df[SEED_COLUMNS]
+
+def seed_corpus(rows, chunk_size=100000, build_index=False, seed=42):
+    """Recreate the schema and COPY `rows` synthetic posts into social_media_data"""
+    if not create_database() or not create_tables():
+        print("❌ Failed to create the load-test schema")
+        return False
+
+    rng = np.random.default_rng(seed)
+    conn = psycopg2.connect(**DATABASE_CONFIG)
+    copy_query = f"COPY social_media_data ({', '.join(SEED_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+    started = time.time()
+    try:
+        cursor = conn.cursor()
+        for start in range(0, rows, chunk_size):
+            size = min(chunk_size, rows - start)
+            buffer = io.StringIO()
+            synthetic_chunk(rng, start, size).to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            cursor.copy_expert(copy_query, buffer)
+            conn.commit()
+            print(f"💾 {start + size:,}/{rows:,} rows ({time.time() - started:.0f}s)")
+        cursor.close()
+
+        # Planner statistics for the fresh table
+        conn.autocommit = True
+        conn.cursor().execute("ANALYZE social_media_data")
+    finally:
+        conn.close()
+
+    db = DatabaseManager()
+    if not db.connect():
+        print("❌ Failed to connect to database")
+        return False
+    db.refresh_platform_counts()
+    if build_index:
+        print("🔎 Building the chatbot search index...")
+        print(f"✅ Indexed {SearchIndex(db).update()} posts")
+    version = db.bump_data_version()
+    db.disconnect()
+    print(f"✅ Seeded {rows:,} posts in {time.time() - started:.0f}s (data version {version})")
+    return True
+
+def dashboard_page():
+    """The dashboard's main(), the page `streamlit run dashboard_postgresql.py` renders on every rerun"""
+    import dashboard_postgresql
+    dashboard_postgresql.main()
+
+class QueryCounter:
+    """Counts SQL statements sent through any SQLAlchemy engine"""
+
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+        event.listen(Engine, 'before_cursor_execute', self.on_execute)
+
+    def on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        with self.lock:
+            self.count += 1
+
+def rss_mb():
+    """Resident memory of this process in MB"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def object_sizes(root):
+    """
+    Bytes of every object reachable from `root` through containers and instance attributes, by id.
+    Frames and arrays count their data; classes, modules and functions are not followed.
+    """
+    sizes = {}
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in sizes or isinstance(obj, (type, types.ModuleType, types.FunctionType, types.MethodType)):
+            continue
+        if isinstance(obj, pd.DataFrame):
+            sizes[id(obj)] = int(obj.memory_usage(deep=True).sum())
+        elif isinstance(obj, (pd.Series, pd.Index)):
+            sizes[id(obj)] = int(obj.memory_usage(deep=True))
+        elif isinstance(obj, np.ndarray):
+            sizes[id(obj)] = obj.nbytes
+        else:
+            sizes[id(obj)] = sys.getsizeof(obj)
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+            elif hasattr(obj, '__dict__'):
+                stack.append(vars(obj))
+    return sizes
+
+def session_state_sizes(states):
+    """
+    (bytes held by each session's own state, bytes of objects several sessions' states share).
+    Shared objects (e.g. cached frames or database managers) are counted once, apart from the sessions.
+    """
+    sizes = [object_sizes(state) for state in states]
+    owners = Counter(object_id for session_sizes in sizes for object_id in session_sizes)
+    per_session = [sum(size for object_id, size in session_sizes.items() if owners[object_id] == 1)
+                   for session_sizes in sizes]
+    shared = {object_id: size for session_sizes in sizes for object_id, size in session_sizes.items()
+              if owners[object_id] > 1}
+    return per_session, sum(shared.values())
+
+def timed_run(app, timings, step):
+    """Rerun the page, record its seconds under `step` and return the number of exceptions it raised"""
+    started = time.perf_counter()
+    app.run()
+    timings[step].append(time.perf_counter() - started)
+    return len(app.exception)
+
+def run_session(session, renders, timeout):
+    """
+    One simulated user: the Dashboard page rendered `renders` times, the first post opened,
+    then a question asked on the AI Assistant page, all through the widgets a user clicks.
+    Returns the seconds of each step by name, the exceptions raised and the final session state.
+    """
+    platforms = ['All Platforms'] + list(PLATFORM_WEIGHTS)
+    app = AppTest.from_function(dashboard_page, default_timeout=timeout)
+    # The sidebar's platform filter starts from this
+    app.session_state['current_platform'] = platforms[session % len(platforms)]
+
+    timings = {step: [] for step in STEPS}
+    errors = timed_run(app, timings, 'first render')
+    for _ in range(renders - 1):
+        errors += timed_run(app, timings, 'rerun')
+
+    read_buttons = [button for button in app.button if button.label == "📖 Read Full Post"]
+    if read_buttons:
+        read_buttons[0].click()
+        errors += timed_run(app, timings, 'post detail')
+
+    next(box for box in app.selectbox if box.label == "Navigation").set_value("🤖 AI Assistant")
+    errors += timed_run(app, timings, 'assistant page')
+    if app.chat_input:
+        app.chat_input[0].set_value(SEARCH_QUESTIONS[session % len(SEARCH_QUESTIONS)])
+        errors += timed_run(app, timings, 'assistant answer')
+    return timings, errors, app.session_state.to_dict()
+
+def percentiles(values):
+    """p50 / p95 / max of a list of seconds as a short string"""
+    if not values:
+        return "n/a"
+    return (f"p50 {np.percentile(values, 50):.2f}s, p95 {np.percentile(values, 95):.2f}s, "
+            f"max {max(values):.2f}s")
+
+def run_load_test(sessions, renders, concurrency, timeout):
+    """Render the dashboard for many simulated sessions and print latency, queries and memory"""
+    sys.path.insert(0, DASHBOARD_DIR)
+    counter = QueryCounter()
+    rss_before = rss_mb()
+
+    print(f"🔄 {sessions} sessions x {renders} renders, {concurrency} at a time...")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda session: run_session(session, renders, timeout), range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    step_timings = {step: [t for timings, _, _ in results for t in timings[step]] for step in STEPS}
+    total_renders = sum(len(values) for values in step_timings.values())
+    errors = sum(session_errors for _, session_errors, _ in results)
+    rss_after = rss_mb()
+
+    print(f"📊 {total_renders} renders in {elapsed:.1f}s")
+    for step, values in step_timings.items():
+        print(f"   {(step.capitalize() + ':'):<18}{percentiles(values)}")
+    print(f"   SQL queries per render: {counter.count / max(total_renders, 1):.1f} "
+          f"(SQLAlchemy statements; prepared scalar queries are not counted)")
+    print(f"   Process memory: {rss_before:.0f} MB -> {rss_after:.0f} MB (shared caches and session state together)")
+
+    app_module = sys.modules.get('dashboard_postgresql')
+    if app_module is not None:
+        frames = list(app_module.CACHED_FRAME_MEMORY.items())
+        cached_bytes = sum(entry['bytes'] for _, entry in frames)
+        print(f"   Shared cached frames: {cached_bytes / 1024 ** 2:.1f} MB in {len(frames)} frames (last computed)")
+        for (name, version), entry in frames:
+            print(f"     {name} (v{version}): {entry['rows']:,} rows, {entry['bytes'] / 1024 ** 2:.1f} MB")
+
+    per_session, shared_state = session_state_sizes([state for _, _, state in results])
+    if per_session:
+        print(f"   Session state: {np.mean(per_session) / 1024:.1f} KB per session on average "
+              f"(max {max(per_session) / 1024:.1f} KB), plus {shared_state / 1024 ** 2:.1f} MB "
+              f"of objects the sessions share")
+    if errors:
+        print(f"   ⚠️  {errors} renders raised exceptions")
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a synthetic corpus and load-test the dashboard pages")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = subparsers.add_parser('seed', help="Recreate the tables and fill them with synthetic posts")
+    seed_parser.add_argument('--rows', type=int, default=100000, help="Synthetic posts to insert (100k-10M)")
+    seed_parser.add_argument('--chunk-size', type=int, default=100000, help="Rows per COPY batch")
+    seed_parser.add_argument('--index', action='store_true', help="Also build the chatbot search index")
+    seed_parser.add_argument('--yes', action='store_true',
+                             help="Allow dropping the tables of a database not named *loadtest*")
+
+    run_parser = subparsers.add_parser('run', help="Render the dashboard for many simulated sessions")
+    run_parser.add_argument('--sessions', type=int, default=20, help="Simulated users")
+    run_parser.add_argument('--renders', type=int, default=5, help="Dashboard page renders per session")
+    run_parser.add_argument('--concurrency', type=int, default=4, help="Sessions rendering at the same time")
+    run_parser.add_argument('--timeout', type=float, default=120, help="Seconds allowed per render")
+    args = parser.parse_args()
+
+    if args.command == 'seed':
+        if 'loadtest' not in DATABASE_CONFIG['database'] and not args.yes:
+            print(f"❌ Seeding drops every table in '{DATABASE_CONFIG['database']}'. "
+                  f"Set DB_NAME to a load-test database (e.g. dashboard_loadtest) or pass --yes.")
+            return
+        seed_corpus(args.rows, chunk_size=args.chunk_size, build_index=args.index)
+    else:
+        run_load_test(args.sessions, args.renders, args.concurrency, args.timeout)
+
+if __name__ == "__main__":
+    main()
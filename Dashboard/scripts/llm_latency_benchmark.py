@@ -0,0 +1,64 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from database.llm_backends import StreamStats, get_backend
+from database.config import LLM_CONFIG
+
+SAMPLE_QUESTIONS = [
+    "What are the main sentiment trends?",
+    "Which platform has the most engagement?",
+    "Summarize posts about education or school",
+    "Find posts about fees or costs",
+]
+
+def run_session(backend, session, questions):
+    """One simulated user asking every question in turn; returns the StreamStats of each reply"""
+    results = []
+    history = []
+    for question in questions:
+        messages = [{"role": "system", "content": "You are a dashboard assistant."}] + history
+        messages.append({"role": "user", "content": f"{question} (session {session})"})
+        stats = StreamStats(backend.name)
+        reply = ''.join(backend.timed_stream(messages, stats))
+        history += [messages[-1], {"role": "assistant", "content": reply}]
+        results.append(stats)
+    return results
+
+def percentiles(values):
+    """p50 / p95 / max of a list of seconds as a short string"""
+    if not values:
+        return "n/a"
+    return (f"p50 {np.percentile(values, 50):.2f}s, p95 {np.percentile(values, 95):.2f}s, "
+            f"max {max(values):.2f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure time to first token of the chat backend under concurrent sessions")
+    parser.add_argument('--backend', default=LLM_CONFIG['backend'], help="together, openai or mock")
+    parser.add_argument('--sessions', type=int, default=8, help="Concurrent simulated users")
+    parser.add_argument('--questions', type=int, default=len(SAMPLE_QUESTIONS), help="Questions per session")
+    args = parser.parse_args()
+
+    backend = get_backend(args.backend)
+    if backend is None:
+        print("❌ Backend not configured (TOGETHER_API_KEY missing?)")
+        return
+
+    questions = [SAMPLE_QUESTIONS[i % len(SAMPLE_QUESTIONS)] for i in range(args.questions)]
+    print(f"🔄 {args.sessions} sessions x {len(questions)} questions against the {backend.name} backend...")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as executor:
+        sessions = list(executor.map(lambda session: run_session(backend, session, questions), range(args.sessions)))
+    elapsed = time.perf_counter() - started
+
+    stats = [reply for session in sessions for reply in session]
+    ttfts = [reply.ttft for reply in stats if reply.ttft is not None]
+    totals = [reply.total for reply in stats]
+    print(f"📊 {len(stats)} replies in {elapsed:.1f}s")
+    print(f"   Time to first token: {percentiles(ttfts)}")
+    print(f"   Full reply:          {percentiles(totals)}")
+    if len(ttfts) < len(stats):
+        print(f"   ⚠️  {len(stats) - len(ttfts)} replies produced no tokens")
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@ import pandas as pd
 import os
 from datetime import datetime, timedelta
 from database.dashboard_db import DatabaseManager
+from database.setup_database import upgrade_schema
+from database.retrieval import SearchIndex
+from database.text_cleaning import CLEAN_TEXT_VERSION, build_display_values
 from tqdm import tqdm
 import time
 from sqlalchemy import text
 import numpy as np
+import hashlib
 
 def parse_date_safely(date_value, platform_name):
     """Safely parse date from various formats"""
@@ -73,6 +77,11 @@ def migrate_data_with_progress():
     
     print("✅ Connected to database successfully")
     
+    # Make sure the display text columns exist on older tables
+    if not upgrade_schema():
+        print("❌ Failed to upgrade database schema")
+        return
+    
     # Clear existing data
     print("🧹 Clearing existing data...")
     try:
@@ -178,6 +187,27 @@ def migrate_data_with_progress():
     print(f"📈 Total records migrated: {total_records}")
     print(f"✅ Successful file imports: {successful_imports}/{len(files_to_process)}")
     
+    # Build the normalized Quora question/answer threads from the inserted rows
+    print("\n🧵 Building Quora question/answer threads...")
+    question_count, answer_count = build_quora_threads(db)
+    print(f"✅ Stored {question_count} Quora questions with {answer_count} unique answers")
+    
+    # Index the new posts for the chatbot's search (only new or changed posts are tokenized)
+    print("\n🔎 Updating the chatbot search index...")
+    indexed = SearchIndex(db).update()
+    print(f"✅ Indexed {indexed} posts")
+    
+    # Refresh the per-platform counters the dashboard sidebar reads
+    if db.refresh_platform_counts():
+        print("✅ Platform post counts refreshed")
+    else:
+        print("❌ Failed to refresh platform post counts")
+    
+    # Stamp a new data version so dashboards reload their caches (and the precompute worker is notified)
+    new_version = db.bump_data_version()
+    if new_version is not None:
+        print(f"🏷️  Data version is now {new_version}")
+    
     # Verify data in database
     print("\n🔍 Verifying data in database...")
     verify_query = "SELECT platform, COUNT(*) as count FROM social_media_data GROUP BY platform ORDER BY platform"
@@ -565,6 +595,91 @@ def process_platform_data(df, platform_name):
         print(f"❌ Error processing {platform_name} data: {str(e)}")
         return None
 
+def quora_answer_hash(content):
+    """Hash used to dedupe Quora answers (same 100-character prefix rule the dashboard used)"""
+    prefix = str(content).strip()[:100].lower()
+    return hashlib.md5(prefix.encode('utf-8')).hexdigest()
+
+def build_quora_threads(db):
+    """Rebuild quora_questions/quora_answers from the Quora rows in social_media_data"""
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(text("TRUNCATE quora_answers, quora_questions RESTART IDENTITY"))
+            
+            rows = conn.execute(text("""
+            SELECT id, title_display, summary_display, content_display,
+                   sentiment_predicted, sentiment_confidence, date, url
+            FROM social_media_data
+            WHERE platform = 'Quora'
+            ORDER BY id
+            """)).mappings().all()
+            
+            # Group rows by question, keeping the order they were scraped in
+            questions = {}
+            for row in rows:
+                title = row['title_display'] or ''
+                if title.strip():
+                    questions.setdefault(title, []).append(row)
+            
+            insert_question = text("""
+            INSERT INTO quora_questions (title, details, url, answer_count)
+            VALUES (:title, :details, :url, :answer_count)
+            RETURNING id
+            """)
+            insert_answer = text("""
+            INSERT INTO quora_answers
+            (question_id, ordinal, content, content_hash, sentiment_predicted, sentiment_confidence, date, url)
+            VALUES (:question_id, :ordinal, :content, :content_hash, :sentiment_predicted, :sentiment_confidence, :date, :url)
+            """)
+            link_rows = text("UPDATE social_media_data SET quora_question_id = :question_id WHERE id = ANY(:ids)")
+            
+            total_answers = 0
+            for title, question_rows in tqdm(questions.items(), desc="Building Quora threads", unit="questions"):
+                # The first scraped row holds the question merged with its answer, so skip it
+                answers = []
+                seen_hashes = set()
+                for row in question_rows[1:]:
+                    content = row['content_display']
+                    if not content or not content.strip() or content.strip().lower() == 'nan':
+                        continue
+                    content_hash = quora_answer_hash(content)
+                    if content_hash in seen_hashes:
+                        continue
+                    seen_hashes.add(content_hash)
+                    answers.append((content_hash, row))
+                
+                first_row = question_rows[0]
+                question_id = conn.execute(insert_question, {
+                    'title': title,
+                    'details': first_row['summary_display'] or '',
+                    'url': first_row['url'] or '',
+                    'answer_count': len(answers)
+                }).scalar()
+                
+                if answers:
+                    conn.execute(insert_answer, [
+                        {
+                            'question_id': question_id,
+                            'ordinal': ordinal,
+                            'content': row['content_display'],
+                            'content_hash': content_hash,
+                            'sentiment_predicted': row['sentiment_predicted'],
+                            'sentiment_confidence': row['sentiment_confidence'],
+                            'date': row['date'],
+                            'url': row['url']
+                        }
+                        for ordinal, (content_hash, row) in enumerate(answers, 1)
+                    ])
+                    total_answers += len(answers)
+                
+                conn.execute(link_rows, {'question_id': question_id, 'ids': [row['id'] for row in question_rows]})
+        
+        return len(questions), total_answers
+        
+    except Exception as e:
+        print(f"❌ Error building Quora threads: {str(e)}")
+        return 0, 0
+
 def insert_batch(db, batch_df):
     """Insert a batch of records into the database"""
     try:
@@ -574,10 +689,12 @@ def insert_batch(db, batch_df):
                 INSERT INTO social_media_data 
                 (title, url, summary, content, comment, comment_sentiment, author, combined_text, relevance_score, 
                  relevant_to_education_in_uae, sentiment_negative, sentiment_neutral, 
-                 sentiment_positive, sentiment_predicted, sentiment_confidence, date, platform)
+                 sentiment_positive, sentiment_predicted, sentiment_confidence, date, platform,
+                 title_display, content_display, summary_display, author_display, comment_display, display_version)
                 VALUES (:title, :url, :summary, :content, :comment, :comment_sentiment, :author, :combined_text, :relevance_score,
                         :relevant_to_education_in_uae, :sentiment_negative, :sentiment_neutral,
-                        :sentiment_positive, :sentiment_predicted, :sentiment_confidence, :date, :platform)
+                        :sentiment_positive, :sentiment_predicted, :sentiment_confidence, :date, :platform,
+                        :title_display, :content_display, :summary_display, :author_display, :comment_display, :display_version)
                 """)
                 
                 values = {
@@ -600,6 +717,10 @@ def insert_batch(db, batch_df):
                     'platform': str(row['platform'])
                 }
                 
+                # Clean text for display once here instead of on every dashboard load
+                values.update(build_display_values(values))
+                values['display_version'] = CLEAN_TEXT_VERSION
+                
                 conn.execute(insert_query, values)
             conn.commit()
         
@@ -0,0 +1,141 @@
+import argparse
+import select
+import time
+import psycopg2
+import pandas as pd
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from database.config import DATABASE_CONFIG
+from database.dashboard_db import DatabaseManager, DATA_LOADED_CHANNEL, PRECOMPUTED_AGGREGATES, frame_to_payload
+from database.setup_database import upgrade_schema
+
+# Seconds to wait before reconnecting after the database went away
+RECONNECT_DELAY = 10
+
+class WorkerDatabaseManager(DatabaseManager):
+    """
+    DatabaseManager whose queries raise instead of returning None, so a failed
+    aggregate stops the round (and the worker reconnects) rather than being stored empty
+    """
+
+    def execute_query(self, query, params=None):
+        if not self.connection and not self.connect():
+            raise psycopg2.OperationalError("could not connect to the database")
+        return pd.read_sql(query, self.connection, params=params)
+
+def precompute(db):
+    """
+    Recompute every dashboard aggregate and the chatbot summaries for the current data version.
+    The version and every aggregate are read in one REPEATABLE READ transaction, so a load
+    committed halfway through cannot mix new rows into results stored under the old version.
+    """
+    started = time.time()
+    # End any open transaction so the snapshot starts now
+    db.connection.commit()
+    db.connection.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY"))
+    version = db.get_data_version()
+
+    # Chatbot prompt context for every platform at once; its keys also list the platforms
+    summaries = db.get_data_summaries()
+    db.store_precomputed('data_summaries', 'All Platforms', version, summaries)
+    platforms = ['All Platforms'] + sorted(name for name in summaries if name != 'All Platforms')
+
+    stored = 1
+    for platform in platforms:
+        for name, method in PRECOMPUTED_AGGREGATES.items():
+            result = getattr(db, method)(platform)
+            db.store_precomputed(name, platform, version, frame_to_payload(result))
+            stored += 1
+
+    # End the snapshot so the next round sees newly loaded data
+    db.connection.commit()
+
+    print(f"✅ Data version {version}: {stored} aggregates for {len(platforms)} platforms in {time.time() - started:.1f}s")
+    return version
+
+def current_version(db):
+    """The data version, raising (unlike DatabaseManager.get_data_version) when the database is unreachable"""
+    return db.connection.execute(text("SELECT version FROM data_version WHERE id = 1")).scalar() or 0
+
+def listen_connection():
+    """Autocommit connection subscribed to the data-loaded channel"""
+    conn = psycopg2.connect(**DATABASE_CONFIG)
+    conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+    cursor = conn.cursor()
+    cursor.execute(f"LISTEN {DATA_LOADED_CHANNEL};")
+    cursor.close()
+    return conn
+
+def run_worker(poll_interval=300, once=False):
+    """Precompute now, then again whenever the loader stamps a new data version"""
+    print("🔄 Initializing database connection...")
+    db = WorkerDatabaseManager()
+    if not db.connect():
+        print("❌ Failed to connect to database")
+        return
+
+    # Make sure precomputed_aggregates exists on older databases
+    if not upgrade_schema():
+        print("❌ Failed to upgrade database schema")
+        return
+
+    if once:
+        precompute(db)
+        return
+
+    computed_version = None
+    conn = None
+    reconnecting = False
+    try:
+        while True:
+            try:
+                if conn is None:
+                    if reconnecting and not db.connect():
+                        raise psycopg2.OperationalError("could not reconnect to the database")
+                    conn = listen_connection()
+                    print(f"👂 Listening on '{DATA_LOADED_CHANNEL}' (re-checking the data version every {poll_interval}s)")
+                    # Nothing is computed yet, or notifications sent while disconnected are lost, so check right away
+                    reconnecting = False
+                    if current_version(db) != computed_version:
+                        computed_version = precompute(db)
+
+                # A timeout is a fallback check in case a notification was missed
+                readable, _, _ = select.select([conn], [], [], poll_interval)
+                if readable:
+                    conn.poll()
+                    versions = [notify.payload for notify in conn.notifies]
+                    conn.notifies.clear()
+                    if versions:
+                        print(f"📬 Data loaded (version {', '.join(versions)})")
+
+                # Several loads in a row collapse into one recompute of the latest version
+                if current_version(db) != computed_version:
+                    computed_version = precompute(db)
+                else:
+                    db.connection.commit()
+            except (psycopg2.Error, SQLAlchemyError) as e:
+                print(f"⚠️  Database error, reconnecting in {RECONNECT_DELAY}s: {e}")
+                if conn is not None:
+                    conn.close()
+                    conn = None
+                db.disconnect()
+                reconnecting = True
+                time.sleep(RECONNECT_DELAY)
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping precompute worker")
+    finally:
+        if conn is not None:
+            conn.close()
+        db.disconnect()
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute dashboard aggregates whenever new data is loaded")
+    parser.add_argument('--poll-interval', type=int, default=300,
+                        help="Seconds between fallback data-version checks")
+    parser.add_argument('--once', action='store_true', help="Precompute for the current data version and exit")
+    args = parser.parse_args()
+    run_worker(poll_interval=args.poll_interval, once=args.once)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import aiohttp
+
+from rate_limiter import HostRateLimiter
+
+# Seconds to back off after a 429 without a Retry-After header, and the longest Retry-After honoured
+DEFAULT_RETRY_AFTER = 5
+MAX_RETRY_AFTER = 300
+
+
+def retry_after_seconds(headers, default=DEFAULT_RETRY_AFTER):
+    """Seconds a Retry-After header asks for (a number or an HTTP date), or `default` without one"""
+    value = headers.get('Retry-After')
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return default
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class AsyncFetcher:
+    """Concurrent page fetcher sharing one keep-alive session and cookie jar across requests"""
+
+    def __init__(self, headers=None, requests_per_second=0.25, burst=1, max_concurrency=4,
+                 timeout=15, prime_urls=None, cache=None, max_retries=2):
+        self.headers = headers or {}
+        # Optional http_cache.HttpCache: fresh pages skip the network, stale ones are revalidated
+        self.cache = cache
+        self.rate_limiter = HostRateLimiter(requests_per_second, burst)
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        # Throttled requests (429, or 503 with Retry-After) are retried this often after the host's pause
+        self.max_retries = max_retries
+        # host -> URL requested once (before any article on that host) to pick up cookies
+        self.prime_urls = prime_urls or {}
+        self.primed = {}
+        self.session = None
+        self.semaphore = None
+
+    async def __aenter__(self):
+        # unsafe=True lets the jar keep cookies for IP hosts such as a local test server
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit_per_host=self.max_concurrency),
+        )
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+
+    async def _prime(self, url):
+        """Request the host's priming URL once so later requests carry its cookies"""
+        host = urlparse(url).netloc.lower()
+        prime_url = self.prime_urls.get(host)
+        if not prime_url:
+            return
+
+        if host not in self.primed:
+            self.primed[host] = asyncio.ensure_future(self._get(prime_url))
+        try:
+            await self.primed[host]
+        except Exception as e:
+            print(f"Cookie priming failed for {host}: {e}")
+
+    async def _get(self, url, headers=None):
+        """
+        Rate-limited GET returning (status, response headers, body bytes).
+
+        A throttled response pauses the host's token bucket for its Retry-After,
+        so every request to that host waits, and the request is then retried.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire_async(url)
+            async with self.session.get(url, headers=headers) as response:
+                body = await response.read()
+                status, response_headers = response.status, response.headers
+
+            throttled = status == 429 or (status == 503 and 'Retry-After' in response_headers)
+            if not throttled or attempt == self.max_retries:
+                return status, response_headers, body
+            wait = retry_after_seconds(response_headers)
+            print(f"{status} from {urlparse(url).netloc}, pausing the host for {wait:.0f}s")
+            self.rate_limiter.pause(url, wait)
+
+    async def fetch(self, url):
+        """Fetch one URL, returning (url, status, body); status is None if the request failed"""
+        async with self.semaphore:
+            try:
+                # The cache is sqlite, so its reads and writes run off the event loop
+                entry = await asyncio.to_thread(self.cache.lookup, url) if self.cache else None
+                if entry and entry['is_fresh']:
+                    await asyncio.to_thread(self.cache.mark_accessed, url)
+                    self.cache.record('fresh_hits', len(entry['body']))
+                    return url, entry['status'], entry['body']
+
+                await self._prime(url)
+                conditional_headers = self.cache.conditional_headers(entry) if self.cache else None
+                status, headers, body = await self._get(url, conditional_headers)
+
+                if self.cache:
+                    if status == 304 and entry:
+                        await asyncio.to_thread(self.cache.mark_revalidated, url, headers)
+                        self.cache.record('revalidated', len(entry['body']))
+                        return url, entry['status'], entry['body']
+                    self.cache.record('misses')
+                    await asyncio.to_thread(self.cache.store, url, status, headers, body)
+
+                return url, status, body
+            except Exception as e:
+                print(f"Error fetching {url}: {e}")
+                return url, None, None
+
+    async def fetch_all(self, urls):
+        """Fetch all URLs concurrently, yielding (url, status, body) as each completes"""
+        tasks = [asyncio.ensure_future(self.fetch(url)) for url in urls]
+        for task in asyncio.as_completed(tasks):
+            yield await task
+
+
+async def fetch_urls(urls, **fetcher_options):
+    """Fetch a list of URLs and return {url: (status, body)}"""
+    results = {}
+    async with AsyncFetcher(**fetcher_options) as fetcher:
+        async for url, status, body in fetcher.fetch_all(urls):
+            results[url] = (status, body)
+    return results
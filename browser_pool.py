@@ -0,0 +1,191 @@
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from selenium_waits import wait_for_cookie, wait_for_ready_state
+
+DEFAULT_PROFILE_ROOT = '.browser_profiles'
+
+
+def save_cookies(driver, path):
+    """Write the browser's cookies for the current site to a JSON snapshot (readable by the owner only)"""
+    cookies = driver.get_cookies()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(cookies, f, indent=2)
+    os.chmod(path, 0o600)
+    return len(cookies)
+
+
+def load_cookie_snapshot(path):
+    """Cookies from a snapshot file, without the ones that have expired"""
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, encoding='utf-8') as f:
+            cookies = json.load(f)
+    except (OSError, ValueError):
+        return []
+    now = time.time()
+    return [cookie for cookie in cookies if not cookie.get('expiry') or cookie['expiry'] > now]
+
+
+def add_cookies(driver, cookies):
+    """Add snapshot cookies to the browser; the driver must already be on the cookies' site"""
+    added = 0
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+            added += 1
+        except Exception:
+            continue
+    return added
+
+
+class BrowserPool:
+    """
+    Warm Chrome sessions for one site, authenticated from persisted profiles.
+
+    Every slot has its own Chrome user-data directory under
+    `<profile_root>/<site>/session_<n>` (Chrome cannot share one between running
+    browsers), and the site's login cookies are snapshotted to
+    `<profile_root>/<site>/cookies.json` so a new or wiped profile starts logged in.
+    Sessions run headless when the snapshot holds a live `login_cookie`; otherwise
+    the first one opens visibly at `login_url` for a manual login, once.
+    """
+
+    def __init__(self, site, home_url, size=1, login_url=None, login_cookie=None, login_timeout=180,
+                 options_factory=None, headless=None, profile_root=DEFAULT_PROFILE_ROOT):
+        self.site = site
+        self.home_url = home_url
+        self.size = size
+        self.login_url = login_url
+        self.login_cookie = login_cookie
+        self.login_timeout = login_timeout
+        # Callable returning fresh chrome Options (the scraper's own flags)
+        self.options_factory = options_factory or Options
+        # None: headless whenever no manual login is needed
+        self.headless = headless
+        self.site_dir = os.path.join(profile_root, site)
+        self.cookie_path = os.path.join(self.site_dir, 'cookies.json')
+        self.idle = queue.Queue()
+        self.drivers = []
+        self.lock = threading.Lock()
+
+    def is_authenticated(self):
+        """Whether the cookie snapshot holds an unexpired login cookie"""
+        if not self.login_cookie:
+            return True
+        return any(cookie['name'] == self.login_cookie for cookie in load_cookie_snapshot(self.cookie_path))
+
+    def profile_dir(self, slot):
+        """Chrome user-data directory of a pool slot"""
+        return os.path.abspath(os.path.join(self.site_dir, f'session_{slot}'))
+
+    def start_driver(self, slot, headless):
+        """Chrome on the slot's profile, with the cookie snapshot applied; None if Chrome fails to start"""
+        options = self.options_factory()
+        options.add_argument(f"--user-data-dir={self.profile_dir(slot)}")
+        if headless:
+            options.add_argument("--headless=new")
+        try:
+            driver = webdriver.Chrome(options=options)
+        except Exception as e:
+            print(f"Error starting Chrome for {self.site} session {slot}: {e}")
+            return None
+
+        cookies = load_cookie_snapshot(self.cookie_path)
+        if cookies:
+            driver.get(self.home_url)
+            add_cookies(driver, cookies)
+            driver.refresh()
+            wait_for_ready_state(driver)
+        return driver
+
+    def login(self, driver):
+        """Wait for a manual login in a visible session, then snapshot its cookies"""
+        driver.get(self.login_url)
+        print("\n" + "="*50)
+        print(f"Please log in to {self.site} in the browser window")
+        print(f"Waiting up to {self.login_timeout} seconds; the session is saved for later runs")
+        print("="*50 + "\n")
+        if not wait_for_cookie(driver, self.login_cookie, timeout=self.login_timeout):
+            print(f"Warning Login to {self.site} not detected, continuing without saved session")
+            return False
+        wait_for_ready_state(driver)
+        self.save_session(driver)
+        print(f"Login detected, session saved to {self.site_dir}")
+        return True
+
+    def save_session(self, driver):
+        """Refresh the cookie snapshot from a live session"""
+        os.makedirs(self.site_dir, exist_ok=True)
+        with self.lock:
+            save_cookies(driver, self.cookie_path)
+
+    def start(self):
+        """Start all sessions, logging in first if the saved session is missing or expired"""
+        os.makedirs(self.site_dir, exist_ok=True)
+        needs_login = bool(self.login_url and self.login_cookie) and not self.is_authenticated()
+        if self.headless is not None:
+            headless = self.headless
+        else:
+            headless = not needs_login
+
+        for slot in range(self.size):
+            # A manual login needs a window, so the first session is visible until it is done
+            slot_headless = headless and not (needs_login and slot == 0)
+            driver = self.start_driver(slot, slot_headless)
+            if not driver:
+                continue
+            if needs_login and slot == 0 and not slot_headless:
+                needs_login = not self.login(driver)
+            self.drivers.append(driver)
+            self.idle.put(driver)
+
+        print(f"{self.site}: {len(self.drivers)}/{self.size} browser sessions ready"
+              f"{' (headless)' if headless else ''}")
+        return len(self.drivers)
+
+    def acquire(self, timeout=None):
+        """Take an idle session, waiting for one if all are busy"""
+        return self.idle.get(timeout=timeout)
+
+    def release(self, driver):
+        """Return a session to the pool"""
+        self.idle.put(driver)
+
+    @contextmanager
+    def session(self):
+        """Borrow a session for the duration of a with block"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Snapshot the latest cookies and quit every session"""
+        for driver in self.drivers:
+            try:
+                if self.login_cookie and driver.get_cookie(self.login_cookie):
+                    self.save_session(driver)
+            except Exception:
+                pass
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self.drivers = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
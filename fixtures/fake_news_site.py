@@ -0,0 +1,168 @@
+"""
+Local stand-in for a news site, for exercising async_fetcher.AsyncFetcher.
+
+Serves a home page that sets a session cookie and numbered article pages in
+Reuters markup, each with an ETag (If-None-Match is answered with 304). With
+--throttle N every N-th article request gets a 429. Requests are counted per
+Host header, together with cookie-less article requests and the peak number
+of requests in flight; GET /stats returns the counters as JSON.
+
+    python fixtures/fake_news_site.py --port 8766 --delay 0.2
+    python -c "import reuters_scrap; reuters_scrap.scrape_all_articles(
+        [f'http://127.0.0.1:8766/article/{n}' for n in range(8)],
+        prime_url='http://127.0.0.1:8766/', cache_path=None)"
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COOKIE_NAME = 'site_session'
+
+
+def article_html(number):
+    """Reuters-style article page with JSON-LD, a headline, a dateline and a body"""
+    ld = json.dumps({"@type": "NewsArticle", "headline": f"UAE schools story {number}",
+                     "datePublished": f"2024-01-{number % 28 + 1:02d}T08:00:00Z",
+                     "author": {"name": f"Reporter {number % 3}"},
+                     "description": f"Summary of story {number}."})
+    paragraphs = ''.join(f"<p>Paragraph {index} of story {number} about education in the UAE.</p>"
+                         for index in range(1, 6))
+    return (f"<html><head><title>Story {number}</title>"
+            f"<script type=\"application/ld+json\">{ld}</script></head>"
+            f"<body><h1 data-testid=\"Heading\">UAE schools story {number}</h1>"
+            f"<time datetime=\"2024-01-{number % 28 + 1:02d}\">January</time>"
+            f"<div data-testid=\"article-body\">{paragraphs}</div></body></html>").encode('utf-8')
+
+
+class SiteStats:
+    """Request counters per host"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hosts = {}
+
+    def host(self, name):
+        return self.hosts.setdefault(name, {
+            'requests': 0, 'primes': 0, 'articles': 0, 'without_cookie': 0, 'not_modified': 0,
+            'throttled': 0, 'in_flight': 0, 'max_in_flight': 0, 'article_times': [],
+        })
+
+    def started(self, name):
+        with self.lock:
+            counters = self.host(name)
+            counters['requests'] += 1
+            counters['in_flight'] += 1
+            counters['max_in_flight'] = max(counters['max_in_flight'], counters['in_flight'])
+            return counters['requests']
+
+    def finished(self, name):
+        with self.lock:
+            self.host(name)['in_flight'] -= 1
+
+    def count(self, name, counter, amount=1):
+        with self.lock:
+            self.host(name)[counter] += amount
+
+    def article(self, name, has_cookie):
+        with self.lock:
+            counters = self.host(name)
+            counters['articles'] += 1
+            counters['article_times'].append(time.monotonic())
+            if not has_cookie:
+                counters['without_cookie'] += 1
+            return counters['articles']
+
+    def snapshot(self):
+        with self.lock:
+            return json.loads(json.dumps(self.hosts))
+
+
+class FakeNewsHandler(BaseHTTPRequestHandler):
+    stats = None
+    delay = 0.0
+    throttle_every = 0
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self.send_body(200, json.dumps(self.stats.snapshot()).encode('utf-8'),
+                           {'Content-Type': 'application/json'})
+            return
+
+        host = self.headers.get('Host', '')
+        self.stats.started(host)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+
+            if self.path.rstrip('/') == '':
+                self.stats.count(host, 'primes')
+                self.send_body(200, b"<html><body>Home</body></html>",
+                               {'Content-Type': 'text/html', 'Set-Cookie': f"{COOKIE_NAME}=primed; Path=/"})
+                return
+
+            match = re.match(r'^/article/(\d+)/?$', self.path)
+            if not match:
+                self.send_body(404, b"Not found")
+                return
+
+            number = int(match.group(1))
+            has_cookie = f"{COOKIE_NAME}=primed" in (self.headers.get('Cookie') or '')
+            served = self.stats.article(host, has_cookie)
+            if self.throttle_every and served % self.throttle_every == 0:
+                self.stats.count(host, 'throttled')
+                self.send_body(429, b"Too Many Requests", {'Retry-After': '1'})
+                return
+
+            etag = f'"article-{number}-v1"'
+            if self.headers.get('If-None-Match') == etag:
+                self.stats.count(host, 'not_modified')
+                self.send_body(304, headers={'ETag': etag})
+                return
+            self.send_body(200, article_html(number), {'Content-Type': 'text/html; charset=utf-8', 'ETag': etag})
+        finally:
+            self.stats.finished(host)
+
+
+def start_server(port=0, delay=0.0, throttle_every=0):
+    """Serve the fake site from a background thread; returns (server, stats, base URL)"""
+    stats = SiteStats()
+    handler = type('Handler', (FakeNewsHandler,), {'stats': stats, 'delay': delay,
+                                                    'throttle_every': throttle_every})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake news site for the async fetcher")
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--delay', type=float, default=0.2, help="Seconds each response takes")
+    parser.add_argument('--throttle', type=int, default=0, help="Answer every N-th article request with 429")
+    args = parser.parse_args()
+
+    server, _, url = start_server(args.port, args.delay, args.throttle)
+    print(f"Fake news site on {url} (articles at /article/<n>, counters at /stats)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
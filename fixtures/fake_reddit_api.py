@@ -0,0 +1,189 @@
+"""
+Local stand-in for the parts of the Reddit API the harvester uses.
+
+Serves the OAuth token endpoint, subreddit search and post comments with
+generated data, and enforces a request window reported through the same
+X-Ratelimit-* headers as Reddit. Searches for different keywords share posts,
+so deduplication can be checked; searches and comment requests per post are
+counted.
+
+    python fixtures/fake_reddit_api.py --port 8765
+    REDDIT_API_URL=http://127.0.0.1:8765 python reddit-education.py
+"""
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+POOL_SIZE = 60
+
+
+def post_id(number):
+    """Base-36 style id of the n-th generated post"""
+    return f"fake{number:03d}"
+
+
+def submission(number, subreddit):
+    """Listing child for a generated post"""
+    return {"kind": "t3", "data": {
+        "id": post_id(number),
+        "name": f"t3_{post_id(number)}",
+        "title": f"Generated post {number} about UAE schools",
+        "author": f"user{number % 7}",
+        "score": number * 3,
+        "url": f"https://www.reddit.com/r/{subreddit}/comments/{post_id(number)}/",
+        "permalink": f"/r/{subreddit}/comments/{post_id(number)}/",
+        "subreddit": subreddit,
+        "created_utc": 1700000000 + number * 3600,
+        "selftext": f"Body of generated post {number}.",
+        "num_comments": number % 5,
+    }}
+
+
+def comment(number, index):
+    """Listing child for a generated comment"""
+    return {"kind": "t1", "data": {
+        "id": f"c{number:03d}{index}",
+        "name": f"t1_c{number:03d}{index}",
+        "author": f"commenter{index}",
+        "body": f"Comment {index} on post {number}",
+        "score": 10 - index,
+        "replies": "",
+        "link_id": f"t3_{post_id(number)}",
+        "parent_id": f"t3_{post_id(number)}",
+    }}
+
+
+def listing(children):
+    return {"kind": "Listing", "data": {"children": children, "after": None, "before": None}}
+
+
+class RateWindow:
+    """Fixed request window, like Reddit's per-client limit"""
+
+    def __init__(self, limit, seconds):
+        self.limit = limit
+        self.seconds = seconds
+        self.started = time.time()
+        self.used = 0
+        self.lock = threading.Lock()
+
+    def take(self):
+        """(allowed, used, remaining, seconds until reset)"""
+        with self.lock:
+            now = time.time()
+            if now - self.started >= self.seconds:
+                self.started, self.used = now, 0
+            allowed = self.used < self.limit
+            if allowed:
+                self.used += 1
+            reset = max(int(self.started + self.seconds - now), 1)
+            return allowed, self.used, self.limit - self.used, reset
+
+
+class ApiStats:
+    """Search and per-post comment request counters"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.searches = 0
+        self.comment_requests = {}
+
+    def search(self):
+        with self.lock:
+            self.searches += 1
+
+    def comments(self, submission_id):
+        with self.lock:
+            self.comment_requests[submission_id] = self.comment_requests.get(submission_id, 0) + 1
+
+
+class FakeRedditHandler(BaseHTTPRequestHandler):
+    window = None
+    stats = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, payload, status=200, rate_headers=True):
+        if rate_headers:
+            allowed, used, remaining, reset = self.window.take()
+            if not allowed:
+                payload, status = {"message": "Too Many Requests", "error": 429}, 429
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if rate_headers:
+            self.send_header('X-Ratelimit-Used', str(used))
+            self.send_header('X-Ratelimit-Remaining', str(float(remaining)))
+            self.send_header('X-Ratelimit-Reset', str(reset))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip('/') == '/api/v1/access_token':
+            self.send_json({"access_token": "fake-token", "token_type": "bearer",
+                            "expires_in": 3600, "scope": "*"}, rate_headers=False)
+        else:
+            self.send_json({"error": 404}, status=404, rate_headers=False)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        search = re.match(r'^/r/([^/]+)/search', url.path)
+        if search:
+            subreddit = search.group(1)
+            self.stats.search()
+            limit = int(query.get('limit', ['15'])[0])
+            # Posts depend on the subreddit and (loosely) the keyword, so keywords overlap
+            seed = int(hashlib.md5(query.get('q', [''])[0].encode('utf-8')).hexdigest(), 16) % 10
+            start = int(hashlib.md5(subreddit.encode('utf-8')).hexdigest(), 16) % POOL_SIZE + seed
+            numbers = [(start + i) % POOL_SIZE for i in range(min(limit, 15))]
+            self.send_json(listing([submission(number, subreddit) for number in numbers]))
+            return
+
+        comments = re.match(r'^/comments/fake(\d+)', url.path)
+        if comments:
+            number = int(comments.group(1))
+            self.stats.comments(post_id(number))
+            limit = int(query.get('limit', ['200'])[0])
+            children = [comment(number, index) for index in range(min(number % 5, limit))]
+            self.send_json([listing([submission(number, 'dubai')]), listing(children)])
+            return
+
+        self.send_json({"error": 404}, status=404, rate_headers=False)
+
+
+def start_server(port=0, limit=100, window=60):
+    """Serve the fake API from a background thread; returns (server, stats, base URL)"""
+    stats = ApiStats()
+    handler = type('Handler', (FakeRedditHandler,), {'window': RateWindow(limit, window), 'stats': stats})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake Reddit API for the harvester")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--limit', type=int, default=100, help="Requests allowed per window")
+    parser.add_argument('--window', type=int, default=60, help="Window length in seconds")
+    args = parser.parse_args()
+
+    server, _, url = start_server(args.port, args.limit, args.window)
+    print(f"Fake Reddit API on {url} ({args.limit} requests / {args.window}s)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
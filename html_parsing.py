@@ -0,0 +1,255 @@
+import json
+import os
+from collections import namedtuple
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+# Optional faster backends; BeautifulSoup with the built-in parser always works
+try:
+    import lxml.html
+    from lxml import etree
+    from cssselect import GenericTranslator
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Fastest first; HTML_PARSER_BACKEND overrides the choice
+BACKEND_PREFERENCE = ['selectolax', 'lxml', 'html.parser']
+
+
+def available_backends():
+    """Parser backends that can be used in this environment, fastest first"""
+    available = {
+        'selectolax': SELECTOLAX_AVAILABLE,
+        'lxml': LXML_AVAILABLE,
+        'html.parser': True,
+    }
+    return [backend for backend in BACKEND_PREFERENCE if available[backend]]
+
+
+def default_backend():
+    """Backend used when none is requested"""
+    backend = os.getenv('HTML_PARSER_BACKEND')
+    if backend in available_backends():
+        return backend
+    return available_backends()[0]
+
+
+def make_soup(html):
+    """BeautifulSoup tree built with lxml when it is installed (much faster than 'html.parser')"""
+    return BeautifulSoup(html, 'lxml' if LXML_AVAILABLE else 'html.parser')
+
+
+# kind: 'text' | 'attr' | 'joined' | 'json_ld'
+#   text     first element matching `selector`, its stripped text
+#   attr     first element matching `selector`, attribute `arg`
+#   joined   first element matching `selector`, non-empty texts of its `arg[0]` descendants joined by `arg[1]`
+#   json_ld  value of key `selector` in the page's JSON-LD (`arg` picks a sub-key, e.g. author name)
+Rule = namedtuple('Rule', ['kind', 'selector', 'arg', 'max_length'])
+
+
+def text(selector, max_length=None):
+    """Rule: text of the first match, optionally truncated"""
+    return Rule('text', selector, None, max_length)
+
+
+def attr(selector, name):
+    """Rule: attribute of the first match"""
+    return Rule('attr', selector, name, None)
+
+
+def joined(selector, children, separator='\n\n'):
+    """Rule: texts of the children of the first match, joined"""
+    return Rule('joined', selector, (children, separator), None)
+
+
+def json_ld(key, sub_key=None):
+    """Rule: value from the page's JSON-LD"""
+    return Rule('json_ld', key, sub_key, None)
+
+
+JSON_LD_SELECTOR = 'script[type="application/ld+json"]'
+
+
+class SoupBackend:
+    """BeautifulSoup with the pure-Python 'html.parser' (the scrapers' original setup)"""
+
+    name = 'html.parser'
+
+    def compile(self, selector):
+        return soupsieve.compile(selector)
+
+    def parse(self, html):
+        return BeautifulSoup(html, 'html.parser')
+
+    def first(self, node, compiled):
+        return compiled.select_one(node)
+
+    def all(self, node, compiled):
+        return compiled.select(node)
+
+    def text(self, node):
+        return node.get_text(strip=True)
+
+    def script_text(self, node):
+        return node.string or ''
+
+    def attr(self, node, name):
+        return node.get(name)
+
+
+class LxmlBackend:
+    """lxml.html with CSS selectors translated to XPath once, at compile time"""
+
+    name = 'lxml'
+
+    def compile(self, selector):
+        return etree.XPath(GenericTranslator().css_to_xpath(selector))
+
+    def parse(self, html):
+        return lxml.html.document_fromstring(html)
+
+    def first(self, node, compiled):
+        matches = compiled(node)
+        return matches[0] if matches else None
+
+    def all(self, node, compiled):
+        return compiled(node)
+
+    def text(self, node):
+        return ''.join(piece.strip() for piece in node.itertext())
+
+    def script_text(self, node):
+        return node.text or ''
+
+    def attr(self, node, name):
+        return node.get(name)
+
+
+class SelectolaxBackend:
+    """selectolax (lexbor) parser; selectors are passed straight through"""
+
+    name = 'selectolax'
+
+    def compile(self, selector):
+        return selector
+
+    def parse(self, html):
+        return HTMLParser(html)
+
+    def first(self, node, compiled):
+        return node.css_first(compiled)
+
+    def all(self, node, compiled):
+        if ',' not in compiled:
+            return node.css(compiled)
+        # css() returns a selector group's matches grouped per selector; keep document order like the others
+        descendants = node.traverse(include_text=False)
+        next(descendants, None)  # the node itself
+        return [child for child in descendants if child.css_matches(compiled)]
+
+    def text(self, node):
+        return node.text(deep=True, separator='', strip=True)
+
+    def script_text(self, node):
+        return node.text(deep=True) or ''
+
+    def attr(self, node, name):
+        return node.attributes.get(name)
+
+
+BACKENDS = {
+    'html.parser': SoupBackend,
+    'lxml': LxmlBackend,
+    'selectolax': SelectolaxBackend,
+}
+
+
+class ExtractionPlan:
+    """
+    A site's field -> fallback-rule chains, compiled once per backend.
+
+    The page is parsed once and each field takes the first non-empty value
+    from its rules, in order.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.compiled = {}
+
+    def compile(self, backend_name):
+        """Backend instance plus every selector of the plan compiled for it"""
+        if backend_name not in self.compiled:
+            backend = BACKENDS[backend_name]()
+            selectors = {JSON_LD_SELECTOR}
+            for rules in self.fields.values():
+                for rule in rules:
+                    if rule.kind != 'json_ld':
+                        selectors.add(rule.selector)
+                    if rule.kind == 'joined':
+                        selectors.add(rule.arg[0])
+            self.compiled[backend_name] = (backend, {selector: backend.compile(selector) for selector in selectors})
+        return self.compiled[backend_name]
+
+    def extract(self, html, backend_name=None):
+        """Extract all fields from a page as a dict (None where no rule matched)"""
+        backend, selectors = self.compile(backend_name or default_backend())
+        root = backend.parse(html)
+        json_data = None
+        if any(rule.kind == 'json_ld' for rules in self.fields.values() for rule in rules):
+            json_data = self._json_ld(backend, root, selectors)
+
+        result = {}
+        for field, rules in self.fields.items():
+            result[field] = None
+            for rule in rules:
+                value = self._apply(rule, backend, root, selectors, json_data)
+                if value:
+                    if rule.max_length and len(value) > rule.max_length:
+                        value = value[:rule.max_length] + "..."
+                    result[field] = value
+                    break
+        return result
+
+    def _json_ld(self, backend, root, selectors):
+        """First JSON-LD object of the page, if it is a dict"""
+        script = backend.first(root, selectors[JSON_LD_SELECTOR])
+        if script is None:
+            return None
+        try:
+            data = json.loads(backend.script_text(script))
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _apply(self, rule, backend, root, selectors, json_data):
+        """Value of one rule, or None"""
+        if rule.kind == 'json_ld':
+            if not json_data or rule.selector not in json_data:
+                return None
+            value = json_data[rule.selector]
+            if rule.arg:
+                if isinstance(value, list):
+                    value = value[0] if value else {}
+                value = value.get(rule.arg, '') if isinstance(value, dict) else ''
+            return value if isinstance(value, str) else None
+
+        node = backend.first(root, selectors[rule.selector])
+        if node is None:
+            return None
+        if rule.kind == 'text':
+            return backend.text(node)
+        if rule.kind == 'attr':
+            return backend.attr(node, rule.arg)
+
+        # joined
+        children, separator = rule.arg
+        texts = [backend.text(child) for child in backend.all(node, selectors[children])]
+        return separator.join(piece for piece in texts if piece)
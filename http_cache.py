@@ -0,0 +1,198 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+import requests
+
+# Seconds a cached page is reused without asking the server, per URL class.
+# Listing pages change as news is published; published articles rarely do.
+DEFAULT_FRESHNESS = {
+    'listing': 60 * 60,
+    'article': 30 * 24 * 60 * 60,
+}
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+class HttpCache:
+    """On-disk HTTP cache with compressed bodies and ETag/Last-Modified revalidation"""
+
+    def __init__(self, path='.http_cache.sqlite', listing_patterns=None, freshness=None,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        # URLs matching any of these regexes are listing pages, everything else is an article
+        self.listing_patterns = [re.compile(pattern) for pattern in (listing_patterns or [])]
+        self.freshness = dict(DEFAULT_FRESHNESS, **(freshness or {}))
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'fresh_hits': 0, 'revalidated': 0, 'misses': 0, 'bytes_saved': 0}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER,
+                etag TEXT,
+                last_modified TEXT,
+                encoding TEXT,
+                body BLOB,
+                body_size INTEGER,
+                validated_at REAL,
+                accessed_at REAL
+            )
+        """)
+        self.db.commit()
+
+    def url_class(self, url):
+        """'listing' or 'article' for the freshness policy"""
+        if any(pattern.search(url) for pattern in self.listing_patterns):
+            return 'listing'
+        return 'article'
+
+    def lookup(self, url):
+        """Cached entry for `url` as a dict (with an 'is_fresh' flag), or None"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT status, etag, last_modified, encoding, body, body_size, validated_at "
+                "FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return None
+
+        status, etag, last_modified, encoding, body, body_size, validated_at = row
+        age = time.time() - validated_at
+        return {
+            'status': status,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': encoding,
+            'body': zlib.decompress(body),
+            'body_size': body_size,
+            'is_fresh': age < self.freshness[self.url_class(url)],
+        }
+
+    def conditional_headers(self, entry):
+        """If-None-Match / If-Modified-Since headers for revalidating a cached entry"""
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, status, headers, body, encoding=None):
+        """Cache a 200 response body (compressed) with its validators"""
+        if status != 200 or body is None:
+            return
+
+        now = time.time()
+        compressed = zlib.compress(body, 6)
+        # Only validators the origin issued; without any, an expired entry is simply re-fetched
+        last_modified = headers.get('Last-Modified')
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status, etag, last_modified, encoding, body, body_size, validated_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, status, headers.get('ETag'), last_modified, encoding, compressed, len(compressed), now, now)
+            )
+            self.db.commit()
+            self._evict()
+
+    def mark_revalidated(self, url, headers=None):
+        """Record a 304: the cached body is still current, restart its freshness window"""
+        now = time.time()
+        headers = headers or {}
+        with self.lock:
+            self.db.execute(
+                "UPDATE responses SET validated_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (now, now, headers.get('ETag'), headers.get('Last-Modified'), url)
+            )
+            self.db.commit()
+
+    def mark_accessed(self, url):
+        """Bump the access time used for least-recently-used eviction"""
+        with self.lock:
+            self.db.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            self.db.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is back under 90% of max_bytes"""
+        total = self.db.execute("SELECT COALESCE(SUM(body_size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = self.max_bytes * 0.9
+        for url, size in self.db.execute("SELECT url, body_size FROM responses ORDER BY accessed_at").fetchall():
+            if total <= target:
+                break
+            self.db.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+        self.db.commit()
+
+    def record(self, outcome, body_size=0):
+        """Count one request as 'fresh_hits', 'revalidated' or 'misses'"""
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats[outcome] += 1
+            if outcome != 'misses':
+                self.stats['bytes_saved'] += body_size
+
+    def fetch(self, session, url, params=None, headers=None, timeout=30, before_request=None):
+        """
+        GET through the cache with a requests session.
+
+        Returns (status, body bytes, encoding). Fresh entries are served without a
+        request; stale ones are revalidated, and a 304 reuses the cached body.
+        `before_request` runs only when a request is actually sent (e.g. a polite delay).
+        """
+        if params:
+            url = session.prepare_request(requests.Request('GET', url, params=params)).url
+
+        entry = self.lookup(url)
+        if entry and entry['is_fresh']:
+            self.mark_accessed(url)
+            self.record('fresh_hits', len(entry['body']))
+            return entry['status'], entry['body'], entry['encoding']
+
+        if before_request:
+            before_request()
+
+        request_headers = dict(headers or {})
+        request_headers.update(self.conditional_headers(entry))
+        response = session.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and entry:
+            self.mark_revalidated(url, response.headers)
+            self.record('revalidated', len(entry['body']))
+            return entry['status'], entry['body'], entry['encoding']
+
+        self.record('misses')
+        encoding = response.encoding
+        self.store(url, response.status_code, response.headers, response.content, encoding)
+        return response.status_code, response.content, encoding
+
+    def hit_rate(self):
+        """Share of requests answered from the cache (fresh or 304)"""
+        if not self.stats['requests']:
+            return 0.0
+        return (self.stats['fresh_hits'] + self.stats['revalidated']) / self.stats['requests']
+
+    def report(self):
+        """One-line summary of this run's cache use"""
+        stats = self.stats
+        return (f"HTTP cache: {stats['requests']} requests, {stats['fresh_hits']} fresh hits, "
+                f"{stats['revalidated']} revalidated (304), {stats['misses']} downloaded, "
+                f"hit rate {self.hit_rate():.1%}, {stats['bytes_saved'] / 1024:.1f} KB saved")
+
+    def close(self):
+        """Close the cache database"""
+        with self.lock:
+            self.db.close()
@@ -1,23 +1,54 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import time
-import random
+import queue
+import threading
 import logging
 from urllib.parse import urljoin
+from http_cache import HttpCache
+from rate_limiter import TokenBucket
+from html_parsing import ExtractionPlan, make_soup, joined, text
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("kt_education_scraper_log.txt"),
-        logging.StreamHandler()
-    ]
-)
+# Article page fields, each a fallback chain compiled once per parser backend
+ARTICLE_PLAN = ExtractionPlan({
+    'content': [
+        joined('.article-content', 'p', ' '),
+        joined('.story-content', 'p', ' '),
+        joined('.content', 'p', ' '),
+        joined('.article-body', 'p', ' '),
+    ],
+    'date': [
+        text('.published-date'),
+        text('.date'),
+        text('.timestamp'),
+        text('.article-date'),
+    ],
+    'author': [
+        text('.author'),
+        text('.byline'),
+    ],
+})
 
 class KhaleejtimesScraper:
-    def __init__(self):
+    # Search terms used to find education articles
+    SEARCH_TERMS = [
+        "UAE education",
+        "Dubai school",
+        "Abu Dhabi school",
+        "UAE university",
+        "Dubai university",
+        "Abu Dhabi university",
+        "UAE student",
+        "UAE teacher",
+        "UAE curriculum",
+        "UAE academic",
+        "Sharjah education",
+        "UAE college",
+        "UAE scholarship",
+        "UAE school fees",
+        "UAE education ministry"
+    ]
+    
+    def __init__(self, requests_per_second=0.45):
         """Initialize the Khaleej Times education scraper."""
         self.base_url = "https://www.khaleejtimes.com"
         self.education_url = "https://www.khaleejtimes.com/education"
@@ -28,17 +59,39 @@ class KhaleejtimesScraper:
             'Referer': 'https://www.khaleejtimes.com/'
         }
         self.session = requests.Session()
+        self.thread_local = threading.local()
         self.articles = []
+        self.articles_lock = threading.Lock()
+        # One shared limit for listing and detail requests (about one request every 2.2s)
+        self.rate_limiter = TokenBucket(requests_per_second)
+        # Section archive and search result pages are listings; everything else is an article
+        self.cache = HttpCache(
+            path=".http_cache/khaleej_times.sqlite",
+            listing_patterns=[r"/education/?$", r"/education/page/\d+", r"/search\?"]
+        )
+    
+    def polite_delay(self):
+        """Wait for the shared rate limit to avoid overloading the server and getting blocked"""
+        self.rate_limiter.acquire()
+    
+    def get_session(self):
+        """requests session for the calling thread (the main thread keeps self.session)"""
+        if threading.current_thread() is threading.main_thread():
+            return self.session
+        if not hasattr(self.thread_local, 'session'):
+            self.thread_local.session = requests.Session()
+        return self.thread_local.session
     
     def get_page(self, url, params=None):
-        """Fetch the HTML content of a page."""
+        """Fetch the HTML content of a page (through the on-disk HTTP cache)."""
         try:
-            # Add random delay to avoid overloading the server and getting blocked
-            time.sleep(random.uniform(1.5, 3))
-            
-            response = self.session.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.text
+            # The delay only applies when a request actually goes out
+            status, body, encoding = self.cache.fetch(self.get_session(), url, params=params, headers=self.headers,
+                                                      before_request=self.polite_delay)
+            if status >= 400:
+                logging.error(f"Error fetching {url}: HTTP {status}")
+                return None
+            return body.decode(encoding or 'utf-8', errors='replace')
         except requests.exceptions.RequestException as e:
             logging.error(f"Error fetching {url}: {e}")
             return None
@@ -48,7 +101,7 @@ class KhaleejtimesScraper:
         if not html:
             return None
         
-        return BeautifulSoup(html, 'html.parser')
+        return make_soup(html)
     
     def search_education_articles(self, num_pages=15):
         """
@@ -82,29 +135,10 @@ class KhaleejtimesScraper:
                 # If we get an error, the archive might not exist, so break
                 break
                 
-        # Define search terms
-        search_terms = [
-            "UAE education",
-            "Dubai school",
-            "Abu Dhabi school",
-            "UAE university",
-            "Dubai university",
-            "Abu Dhabi university",
-            "UAE student",
-            "UAE teacher",
-            "UAE curriculum",
-            "UAE academic",
-            "Sharjah education",
-            "UAE college",
-            "UAE scholarship",
-            "UAE school fees",
-            "UAE education ministry"
-        ]
-        
         # Search for each term
         search_url = f"{self.base_url}/search"
         
-        for search_term in search_terms:
+        for search_term in self.SEARCH_TERMS:
             logging.info(f"Starting search for term: {search_term}")
             
             for page in range(1, num_pages + 1):
@@ -137,8 +171,13 @@ class KhaleejtimesScraper:
         self.articles = unique_articles
         return unique_articles
     
-    def extract_articles(self, soup):
-        """Extract article information from the page."""
+    def extract_articles(self, soup, listing_urls=None):
+        """
+        Extract article information from the page.
+        
+        Only UAE education articles are returned; if `listing_urls` is given, the URL of
+        every article listed on the page is appended to it, whatever its topic.
+        """
         articles = []
         
         # Looking for article containers - these selectors might need adjustment
@@ -178,6 +217,8 @@ class KhaleejtimesScraper:
                 if not article_url.startswith('http'):
                     article_url = urljoin(self.base_url, article_url)
                 article_data['url'] = article_url
+                if listing_urls is not None:
+                    listing_urls.append(article_url)
             else:
                 continue  # Skip if no link found
             
@@ -243,41 +284,126 @@ class KhaleejtimesScraper:
             logging.info(f"Getting details for article {i+1}/{len(self.articles)}: {article['title']}")
             
             html = self.get_page(article['url'])
-            soup = self.parse_page(html)
             
-            if not soup:
+            if not html:
                 continue
             
-            # Find article content
-            content_elem = (soup.select_one('.article-content') or soup.select_one('.story-content') or 
-                           soup.select_one('.content') or soup.select_one('.article-body'))
-            
-            if content_elem:
-                # Extract paragraphs
-                paragraphs = content_elem.select('p')
-                content = ' '.join([p.get_text(strip=True) for p in paragraphs])
-                article['content'] = content
-            else:
-                article['content'] = None
-            
-            # Find published date if not already found
-            if not article['date']:
-                date_elem = (soup.select_one('.published-date') or soup.select_one('.date') or 
-                            soup.select_one('.timestamp') or soup.select_one('.article-date'))
-                if date_elem:
-                    article['date'] = date_elem.get_text(strip=True)
-            
-            # Find author if available
-            author_elem = soup.select_one('.author') or soup.select_one('.byline')
-            if author_elem:
-                article['author'] = author_elem.get_text(strip=True)
-            else:
-                article['author'] = None
+            self.parse_article_details(article, html)
                 
             # Save incrementally after every 10 articles to avoid losing data
             if (i + 1) % 10 == 0:
                 self.save_to_csv(f"khaleej_times_education_articles_partial_{i+1}.csv")
     
+    def parse_article_details(self, article, html):
+        """Fill in content, date and author of an article from its page."""
+        details = ARTICLE_PLAN.extract(html)
+        article['content'] = details['content']
+        
+        # Keep the listing date if one was found
+        if not article['date']:
+            article['date'] = details['date']
+        
+        article['author'] = details['author']
+    
+    def listing_sequences(self, num_pages):
+        """Listing page sequences as (kind, [(url, params)]): the section archive, then each search term."""
+        sequences = [('archive', [(self.education_url, None)] +
+                      [(f"{self.education_url}/page/{page}", None) for page in range(2, num_pages + 1)])]
+        
+        search_url = f"{self.base_url}/search"
+        for search_term in self.SEARCH_TERMS:
+            sequences.append(('search', [(search_url, {'q': search_term, 'page': page})
+                                         for page in range(1, num_pages + 1)]))
+        
+        return sequences
+    
+    def detail_worker(self, detail_queue):
+        """Fetch article pages from the queue until the crawl is finished."""
+        while True:
+            article = detail_queue.get()
+            if article is None:
+                return
+            
+            try:
+                html = self.get_page(article['url'])
+                if html:
+                    self.parse_article_details(article, html)
+            except Exception as e:
+                # Keep the worker alive so the listing producer never blocks on a full queue
+                logging.error(f"Error getting details for {article['url']}: {e}")
+            
+            with self.articles_lock:
+                self.articles.append(article)
+                done = len(self.articles)
+                logging.info(f"Got details for article {done}: {article['title']}")
+                
+                # Save incrementally after every 10 articles to avoid losing data
+                if done % 10 == 0:
+                    self.save_to_csv(f"khaleej_times_education_articles_partial_{done}.csv")
+    
+    def crawl(self, num_pages=15, num_workers=3, queue_size=50):
+        """
+        Crawl listing pages and article details at the same time.
+        
+        Articles found on listing pages go straight onto a bounded queue served by
+        detail workers, and all requests share one rate limit. The archive stops
+        when a page fails to load or lists only articles seen before; a search
+        stops as soon as one of its pages yields no new education articles.
+        
+        Args:
+            num_pages: Number of pages to scrape for each listing sequence
+            num_workers: Number of article detail workers
+            queue_size: Maximum number of articles waiting for details
+        """
+        self.articles = []
+        seen_urls = set()
+        # Every article URL listed so far, education or not (the archive lists other topics too)
+        listed_urls = set()
+        detail_queue = queue.Queue(maxsize=queue_size)
+        workers = [threading.Thread(target=self.detail_worker, args=(detail_queue,), daemon=True)
+                   for _ in range(num_workers)]
+        for worker in workers:
+            worker.start()
+        
+        try:
+            for kind, sequence in self.listing_sequences(num_pages):
+                for page_number, (url, params) in enumerate(sequence, start=1):
+                    logging.info(f"Scraping listing page: {url} {params or ''}")
+                    soup = self.parse_page(self.get_page(url, params=params))
+                    if not soup:
+                        # If we get an error, the listing might not go further
+                        break
+                    
+                    listing_urls = []
+                    articles = self.extract_articles(soup, listing_urls)
+                    new_articles = [article for article in articles if article['url'] not in seen_urls]
+                    if kind == 'archive':
+                        # An archive page without education articles is normal; only a page of
+                        # articles listed before means the archive has nothing further
+                        if all(listing_url in listed_urls for listing_url in listing_urls):
+                            logging.info("Archive page only lists already-seen articles, moving on")
+                            break
+                        listed_urls.update(listing_urls)
+                    elif not articles and page_number > 1:
+                        # If no articles found and we're past page 1, we might be at the end
+                        break
+                    elif articles and not new_articles:
+                        logging.info("Listing page only has already-known articles, moving on")
+                        break
+                    
+                    for article in new_articles:
+                        seen_urls.add(article['url'])
+                        # Blocks while the workers are behind, keeping memory bounded
+                        detail_queue.put(article)
+        finally:
+            for _ in workers:
+                detail_queue.put(None)
+            for worker in workers:
+                worker.join()
+        
+        logging.info(f"Crawled {len(self.articles)} unique education articles")
+        return self.articles
+    
     def save_to_csv(self, filename="khaleej_times_education_articles.csv"):
         """Save the scraped data to a CSV file."""
         if not self.articles:
@@ -300,15 +426,24 @@ class KhaleejtimesScraper:
 
 
 if __name__ == "__main__":
+    # Configure logging (here, so importing the module for its extraction plan writes no log file)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("kt_education_scraper_log.txt"),
+            logging.StreamHandler()
+        ]
+    )
+    
     # Initialize the Khaleej Times scraper
     scraper = KhaleejtimesScraper()
     
-    # Search for education articles (increased to 15 pages per search term)
-    scraper.search_education_articles(num_pages=15)
-    
-    # Get detailed content for each article
-    scraper.get_article_details()
+    # Crawl listing pages (15 per sequence) while article details are fetched alongside
+    scraper.crawl(num_pages=15)
     
     # Save the results
     scraper.save_to_csv()
-    scraper.save_to_excel() 
\ No newline at end of file
+    scraper.save_to_excel()
+    
+    logging.info(scraper.cache.report()) 
\ No newline at end of file
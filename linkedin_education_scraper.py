@@ -3,200 +3,248 @@ import json
 import csv
 import signal
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import pandas as pd
 import os
 
+from browser_pool import BrowserPool
+from scrape_journal import ScrapeJournal
+from selenium_waits import (AdaptiveTimeout, scroll_and_wait, wait_for_count_increase,
+                            wait_for_network_idle, wait_for_ready_state, wait_until)
+
+# Columns of the exported CSV, in order
+POST_FIELDS = [
+    'keyword', 'scraped_at', 'content_type', 'post_id', 'author_name', 'author_title', 'post_text',
+    'post_url', 'likes_count', 'comments_count', 'reposts_count', 'post_date',
+    'comment_author', 'comment_text', 'comment_date'
+]
+
+# Session cookie LinkedIn sets once the user has logged in
+LINKEDIN_SESSION_COOKIE = "li_at"
+
+# Selectors of post elements on search result pages
+POST_SELECTORS = [
+    ".feed-shared-update-v2",
+    ".update-components-update-v2",
+    "[data-urn*='activity']",
+    ".occludable-update",
+    "[data-chameleon-result-urn]"
+]
+
+# Selectors of comment elements inside a post
+COMMENT_SELECTORS = [
+    ".comments-comment-item",
+    ".feed-shared-comments-list .comment",
+    ".comments-comment-entity",
+    ".feed-shared-comment",
+    "[data-test-id='comment']"
+]
+
+# Fallback selector chains for each post field; the first non-empty match wins
+POST_FIELD_SELECTORS = {
+    'author_name': [
+        ".update-components-actor__name",
+        ".feed-shared-actor__name",
+        ".feed-shared-actor__name a",
+        ".feed-shared-actor__name span",
+        "[data-control-name='actor'] span",
+        ".update-components-actor__name a span"
+    ],
+    'author_title': [
+        ".update-components-actor__description",
+        ".feed-shared-actor__description",
+        ".feed-shared-actor__sub-description",
+        ".update-components-actor__meta .update-components-actor__description"
+    ],
+    'post_text': [
+        ".feed-shared-update-v2__description",
+        ".update-components-text",
+        ".feed-shared-text",
+        ".feed-shared-update-v2__description .feed-shared-text",
+        ".update-components-update-v2__commentary .update-components-text",
+        ".feed-shared-inline-show-more-text",
+        ".attributed-text-segment-list__content"
+    ],
+    'post_url': [
+        "a[data-control-name='overlay']",
+        "a[href*='/posts/']",
+        "a[href*='activity-']",
+        ".feed-shared-control-menu__trigger"
+    ],
+    'likes_count': [
+        ".social-details-social-counts__reactions-count",
+        ".feed-shared-social-action-bar__reaction-count",
+        "[data-control-name='reactions_count']",
+        ".reactions-count"
+    ],
+    'comments_count': [
+        ".social-details-social-counts__comments",
+        ".feed-shared-social-action-bar__comment-count",
+        "[data-control-name='comments_count']",
+        ".comments-count"
+    ],
+    'post_date': [
+        ".update-components-actor__sub-description",
+        ".feed-shared-actor__sub-description",
+        ".update-components-actor__meta time",
+        ".feed-shared-actor__meta time",
+        "time[datetime]"
+    ],
+}
+
+# Finds the posts in the DOM; shared by the two scripts below.
+# Arguments: post selectors, field selectors, URNs already processed.
+FIND_POSTS_SCRIPT = """
+var postSelectors = arguments[0], fields = arguments[1], seen = new Set(arguments[2]);
+var elements = [];
+for (var i = 0; i < postSelectors.length && !elements.length; i++) {
+    elements = Array.prototype.slice.call(document.querySelectorAll(postSelectors[i]));
+}
+
+function postUrn(element) {
+    var inner = element.querySelector('[data-urn]');
+    return element.getAttribute('data-urn') || element.getAttribute('data-chameleon-result-urn') ||
+           (inner ? inner.getAttribute('data-urn') : '') || '';
+}
+
+function isNew(element, urn) {
+    // URN-less posts are remembered on the element itself
+    return !((urn && seen.has(urn)) || element.hasAttribute('data-scraper-seen'));
+}
+"""
+
+# Clicks "see more" on every new post whose text is still collapsed; the
+# toggle also collapses expanded posts, so its state is checked first.
+# Returns the number of posts expanded.
+EXPAND_NEW_POSTS_SCRIPT = FIND_POSTS_SCRIPT + """
+var expanded = 0;
+elements.forEach(function (element) {
+    if (!isNew(element, postUrn(element))) {
+        return;
+    }
+    var toggle = element.querySelector('.feed-shared-inline-show-more-text__see-more-less-toggle, .see-more');
+    if (!toggle) {
+        return;
+    }
+    var state = toggle.getAttribute('aria-expanded');
+    var label = (toggle.getAttribute('aria-label') || toggle.innerText || '').toLowerCase();
+    var collapsed = state !== null ? state === 'false' : label.indexOf('less') < 0;
+    if (collapsed) {
+        toggle.click();
+        expanded++;
+    }
+});
+return expanded;
+"""
+
+# Extracts every post in the DOM that has not been processed yet, in one round-trip.
+# Run after EXPAND_NEW_POSTS_SCRIPT, in a separate call so the expanded text has rendered.
+# Returns [JSON list of post fields, matching post elements, number of posts in the DOM].
+EXTRACT_NEW_POSTS_SCRIPT = FIND_POSTS_SCRIPT + """
+
+function firstText(root, selectors, minLength) {
+    for (var i = 0; i < selectors.length; i++) {
+        var node = root.querySelector(selectors[i]);
+        var text = node ? (node.innerText || '').trim() : '';
+        if (text.length > minLength) {
+            return text;
+        }
+    }
+    return '';
+}
+
+function postUrl(root, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var node = root.querySelector(selectors[i]);
+        var href = node ? node.href || node.getAttribute('href') || '' : '';
+        if (href && (href.indexOf('posts') >= 0 || href.indexOf('activity') >= 0)) {
+            return href;
+        }
+    }
+    return '';
+}
+
+var posts = [], newElements = [];
+elements.forEach(function (element) {
+    var urn = postUrn(element);
+    if (!isNew(element, urn)) {
+        return;
+    }
+    element.setAttribute('data-scraper-seen', '1');
+    try {
+        posts.push({
+            urn: urn,
+            author_name: firstText(element, fields.author_name, 0),
+            author_title: firstText(element, fields.author_title, 0),
+            post_text: firstText(element, fields.post_text, 10),
+            post_url: postUrl(element, fields.post_url),
+            likes_count: firstText(element, fields.likes_count, 0),
+            comments_count: firstText(element, fields.comments_count, 0),
+            post_date: firstText(element, fields.post_date, 0)
+        });
+    } catch (e) {
+        posts.push({urn: urn, error: String(e)});
+    }
+    newElements.push(element);
+});
+return [JSON.stringify(posts), newElements, elements.length];
+"""
+
 class LinkedInEducationScraper:
-    def __init__(self):
+    def __init__(self, num_sessions=1, journal_path="linkedin_scrape_journal.jsonl"):
+        # Each thread works with its own pooled browser session
+        self.local = threading.local()
         self.driver = None
-        self.posts_data = []
+        self.pool = BrowserPool(
+            'linkedin', "https://www.linkedin.com/feed/", size=num_sessions,
+            login_url="https://www.linkedin.com/login", login_cookie=LINKEDIN_SESSION_COOKIE,
+            login_timeout=120, options_factory=self.chrome_options,
+        )
+        # Every post and comment is appended here as it is scraped; an unfinished journal is resumed
+        self.journal = ScrapeJournal(journal_path)
         self.interrupted = False
+        # Learned from how long LinkedIn takes to load more posts / comments
+        self.scroll_timeout = AdaptiveTimeout(initial=8, maximum=15)
+        self.comments_timeout = AdaptiveTimeout(initial=5, maximum=10)
         
         # Set up signal handler for graceful interruption
         signal.signal(signal.SIGINT, self.signal_handler)
     
+    @property
+    def driver(self):
+        """Browser session of the calling thread"""
+        return getattr(self.local, 'driver', None)
+    
+    @driver.setter
+    def driver(self, driver):
+        self.local.driver = driver
+    
     def signal_handler(self, signum, frame):
-        """Handle Ctrl+C interruption gracefully"""
-        print(f"\n\n[INTERRUPTION DETECTED]")
-        print("=" * 50)
-        print("Saving collected data before exit...")
-        
-        self.interrupted = True
-        
-        # Try to save data from multiple possible sources
-        data_to_save = []
-        
-        # Check instance variable first
-        if hasattr(self, 'posts_data') and self.posts_data:
-            data_to_save = self.posts_data
-            print(f"Found {len(data_to_save)} posts in instance variable")
-        
-        # Always try to create a CSV file, even if data appears empty
-        try:
-            # Save emergency data regardless of content
-            emergency_filename = self.save_emergency_data_force(data_to_save)
-            print(f"Emergency save completed: {emergency_filename}")
-            print(f"Attempted to save {len(data_to_save)} posts")
-        except Exception as e:
-            print(f"Error during emergency save: {e}")
-            print(f"Raw data length: {len(data_to_save) if data_to_save else 0}")
-            # Create diagnostic file
+        """Handle Ctrl+C: stop after the current post (everything scraped is already in the journal)"""
+        if self.interrupted:
+            print("\nSecond interruption, exiting now. Collected data is in the journal.")
             try:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                error_filename = f"emergency_save_ERROR_{timestamp}.txt"
-                with open(error_filename, 'w') as f:
-                    f.write(f"Emergency save error at {datetime.now()}\n")
-                    f.write(f"Error: {e}\n")
-                    f.write(f"Data length: {len(data_to_save) if data_to_save else 0}\n")
-                    f.write(f"Sample data: {data_to_save[:1] if data_to_save else 'No data'}\n")
-                print(f"Error diagnostic created: {error_filename}")
-            except Exception as diagnostic_error:
-                print(f"Could not create diagnostic file: {diagnostic_error}")
-        
-        # Close browser if it exists
-        if hasattr(self, 'driver') and self.driver:
-            try:
-                print("Closing browser...")
-                self.driver.quit()
+                self.pool.close()
             except:
                 pass
+            self.journal.close()
+            sys.exit(1)
         
-        print("Exiting gracefully...")
-        sys.exit(0)
-    
-    def save_emergency_data(self, posts_data):
-        """Save data immediately when interrupted"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        emergency_filename = f"emergency_save_{timestamp}.csv"
-        
-        if posts_data:
-            try:
-                # Try pandas first
-                df = pd.DataFrame(posts_data)
-                df.to_csv(emergency_filename, index=False, encoding='utf-8')
-                print(f"CSV created using pandas: {emergency_filename}")
-            except Exception as pd_error:
-                print(f"Warning ({pd_error}), using manual CSV creation...")
-                # Fallback: Manual CSV creation
-                try:
-                    with open(emergency_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                        if posts_data:
-                            # Get all possible field names
-                            fieldnames = set()
-                            for post in posts_data:
-                                fieldnames.update(post.keys())
-                            fieldnames = sorted(list(fieldnames))
-                            
-                            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                            writer.writeheader()
-                            writer.writerows(posts_data)
-                    print(f"CSV created manually: {emergency_filename}")
-                except Exception as csv_error:
-                    print(f"Manual CSV creation failed: {csv_error}")
-            
-            # Also save as JSON for backup
-            try:
-                json_filename = f"emergency_save_{timestamp}.json"
-                with open(json_filename, 'w', encoding='utf-8') as f:
-                    json.dump(posts_data, f, indent=2, ensure_ascii=False)
-                print(f"JSON backup created: {json_filename}")
-            except Exception as json_error:
-                print(f"Warning JSON backup failed: {json_error}")
-            
-            print(f"Emergency files completed!")
-            print(f"   CSV: {emergency_filename}")
-            if 'json_filename' in locals():
-                print(f"   JSON: {json_filename}")
-        
-        return emergency_filename
+        print(f"\n\n[INTERRUPTION DETECTED]")
+        print("=" * 50)
+        print(f"Stopping after the current post; collected data is already saved in {self.journal.path}")
+        print("Press Ctrl+C again to exit immediately")
+        self.interrupted = True
     
-    def save_emergency_data_force(self, posts_data):
-        """Force save data immediately when interrupted - always creates CSV"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        emergency_filename = f"emergency_save_{timestamp}.csv"
-        
-        print(f"Debug: Attempting to save {len(posts_data) if posts_data else 0} posts")
-        
-        # Always create CSV file, even if empty
-        try:
-            with open(emergency_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                if posts_data and len(posts_data) > 0:
-                    # Get all possible field names from all posts
-                    fieldnames = set()
-                    valid_posts = []
-                    
-                    for i, post in enumerate(posts_data):
-                        if isinstance(post, dict):
-                            fieldnames.update(post.keys())
-                            valid_posts.append(post)
-                        else:
-                            print(f"Warning Post {i} is not a dictionary: {type(post)}")
-                    
-                    if valid_posts:
-                        fieldnames = sorted(list(fieldnames))
-                        print(f"Debug: Found {len(valid_posts)} valid posts with fields: {fieldnames}")
-                        
-                        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(valid_posts)
-                        print(f"CSV created with {len(valid_posts)} valid posts: {emergency_filename}")
-                    else:
-                        # Create empty CSV with standard headers
-                        standard_headers = ['keyword', 'scraped_at', 'content_type', 'post_id', 'author_name', 'author_title', 
-                                          'post_text', 'post_url', 'likes_count', 'comments_count', 
-                                          'reposts_count', 'post_date', 'comment_author', 'comment_text', 'comment_date']
-                        writer = csv.DictWriter(csvfile, fieldnames=standard_headers)
-                        writer.writeheader()
-                        print(f"Warning CSV created with headers only (no valid posts): {emergency_filename}")
-                else:
-                    # Create empty CSV with standard headers
-                    standard_headers = ['keyword', 'scraped_at', 'content_type', 'post_id', 'author_name', 'author_title', 
-                                      'post_text', 'post_url', 'likes_count', 'comments_count', 
-                                      'reposts_count', 'post_date', 'comment_author', 'comment_text', 'comment_date']
-                    writer = csv.DictWriter(csvfile, fieldnames=standard_headers)
-                    writer.writeheader()
-                    print(f"Empty CSV created (no posts collected): {emergency_filename}")
-            
-        except Exception as csv_error:
-            print(f"CSV creation failed: {csv_error}")
-            # Create a simple text file with the data dump
-            try:
-                text_filename = f"emergency_save_{timestamp}.txt"
-                with open(text_filename, 'w', encoding='utf-8') as f:
-                    f.write(f"Emergency save data dump at {datetime.now()}\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(f"Posts data length: {len(posts_data) if posts_data else 0}\n")
-                    if posts_data:
-                        for i, post in enumerate(posts_data):
-                            f.write(f"\nPost {i+1}:\n")
-                            f.write(str(post))
-                            f.write("\n" + "-" * 30 + "\n")
-                print(f"Emergency text dump created: {text_filename}")
-                emergency_filename = text_filename
-            except Exception as text_error:
-                print(f"Warning Even text dump failed: {text_error}")
-        
-        # Also try JSON backup
-        try:
-            json_filename = f"emergency_save_{timestamp}.json"
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(posts_data if posts_data else [], f, indent=2, ensure_ascii=False)
-            print(f"JSON backup created: {json_filename}")
-        except Exception as json_error:
-            print(f"Warning JSON backup failed: {json_error}")
-        
-        return emergency_filename
-        
-    def setup_driver(self):
-        """Setup Chrome driver with appropriate options"""
+    def chrome_options(self):
+        """Chrome options for LinkedIn sessions"""
         chrome_options = Options()
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -204,60 +252,17 @@ class LinkedInEducationScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            print("Chrome driver initialized successfully")
-        except Exception as e:
-            print(f"Error initializing Chrome driver: {e}")
+        return chrome_options
+    
+    def setup_driver(self):
+        """Start the browser pool: headless with the saved session, or visible for a one-time manual login"""
+        if not self.pool.start():
+            print("Error initializing Chrome driver")
             print("Please make sure ChromeDriver is installed and in your PATH")
             return False
+        print("Chrome driver initialized successfully")
         return True
     
-    def login_wait(self):
-        """Navigate to LinkedIn login and wait for user to log in"""
-        try:
-            print("Navigating to LinkedIn login page...")
-            self.driver.get("https://www.linkedin.com/login")
-            
-            print("\n" + "="*50)
-            print("Please log in to your LinkedIn account")
-            print("You have 2 minutes to complete the login process")
-            print("The script will automatically continue after login")
-            print("="*50 + "\n")
-            
-            # Wait for 2 minutes or until login is detected
-            max_wait_time = 120  # 2 minutes
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait_time:
-                try:
-                    # Check if we're on the feed page (successful login)
-                    if "feed" in self.driver.current_url or "linkedin.com/in/" in self.driver.current_url:
-                        print("Login detected! Continuing with scraping...")
-                        return True
-                    
-                    # Check if we're redirected to home page
-                    if self.driver.current_url == "https://www.linkedin.com/" or "linkedin.com/feed" in self.driver.current_url:
-                        print("Login successful! Redirected to home page")
-                        return True
-                        
-                except Exception:
-                    pass
-                
-                time.sleep(2)
-                remaining_time = int(max_wait_time - (time.time() - start_time))
-                if remaining_time > 0:
-                    print(f"Waiting for login... {remaining_time} seconds remaining", end="\r")
-            
-            print("\nWarning Login timeout reached. Please make sure you're logged in and try again.")
-            return False
-            
-        except Exception as e:
-            print(f"Error during login process: {e}")
-            return False
-    
     def search_keyword(self, keyword):
         """Search for a specific keyword on LinkedIn"""
         try:
@@ -267,7 +272,7 @@ class LinkedInEducationScraper:
             try:
                 # Go to LinkedIn home/feed first
                 self.driver.get("https://www.linkedin.com/feed/")
-                time.sleep(2)
+                wait_for_ready_state(self.driver)
                 
                 # Find and click the search box
                 search_box = WebDriverWait(self.driver, 10).until(
@@ -276,7 +281,7 @@ class LinkedInEducationScraper:
                 search_box.clear()
                 search_box.send_keys(keyword)
                 search_box.send_keys(Keys.RETURN)
-                time.sleep(3)
+                wait_until(self.driver, lambda d: "/search/results/" in d.current_url, timeout=10)
                 
                 # Click on "Posts" tab if available
                 try:
@@ -284,13 +289,13 @@ class LinkedInEducationScraper:
                         EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Posts') or contains(text(), 'posts')]"))
                     )
                     posts_tab.click()
-                    time.sleep(2)
+                    wait_until(self.driver, lambda d: "/search/results/content/" in d.current_url, timeout=5)
                 except:
                     # Try alternative selector for posts tab
                     try:
                         posts_tab = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label*='Posts']")
                         posts_tab.click()
-                        time.sleep(2)
+                        wait_until(self.driver, lambda d: "/search/results/content/" in d.current_url, timeout=5)
                     except:
                         print("Warning Could not find Posts tab, continuing with current results")
                 
@@ -300,34 +305,16 @@ class LinkedInEducationScraper:
                 search_url = f"https://www.linkedin.com/search/results/content/?keywords={keyword.replace(' ', '%20')}"
                 print(f"Trying direct URL: {search_url}")
                 self.driver.get(search_url)
-                time.sleep(3)
-            
-            # Wait for any posts to load with multiple possible selectors
-            post_selectors = [
-                ".feed-shared-update-v2",
-                ".update-components-update-v2",
-                "[data-urn*='activity']",
-                ".feed-shared-update-v2__description-wrapper",
-                ".occludable-update",
-                ".feed-shared-update-v2__content"
-            ]
+                wait_for_ready_state(self.driver)
             
-            posts_found = False
-            for selector in post_selectors:
-                try:
-                    WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    posts_found = True
-                    print(f"Posts found using selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-            
-            if not posts_found:
+            # Wait for the first post matching any of the possible selectors
+            posts_found = wait_for_count_increase(self.driver, ", ".join(POST_SELECTORS), 0, timeout=10)
+            if posts_found:
+                print(f"Posts found: {posts_found}")
+            else:
                 print(f"Warning No posts found with standard selectors, trying alternative approach")
                 # Last resort: check if any content is loaded
-                time.sleep(3)
+                wait_for_network_idle(self.driver, timeout=5)
                 page_content = self.driver.page_source
                 if "No results" in page_content or "0 results" in page_content:
                     print(f"No search results found for '{keyword}'")
@@ -342,231 +329,58 @@ class LinkedInEducationScraper:
             print(f"Error searching for '{keyword}': {e}")
             return False
     
-    def extract_post_data(self, post_element, keyword):
-        """Extract data from a single post element"""
-        try:
+    def extract_new_posts(self, keyword, processed_urns):
+        """
+        Data of the posts in the DOM that are not in `processed_urns`, as (post_data, element) pairs.
+
+        Collapsed posts are expanded in one execute_script call, then all fields
+        of all new posts come back from a second one; the returned URNs are added
+        to `processed_urns`. Also returns the number of posts currently in the DOM.
+        """
+        self.driver.execute_script(
+            EXPAND_NEW_POSTS_SCRIPT, POST_SELECTORS, POST_FIELD_SELECTORS, sorted(processed_urns)
+        )
+        payload, elements, total = self.driver.execute_script(
+            EXTRACT_NEW_POSTS_SCRIPT, POST_SELECTORS, POST_FIELD_SELECTORS, sorted(processed_urns)
+        )
+        
+        new_posts = []
+        for raw, post_element in zip(json.loads(payload), elements):
+            urn = raw.get('urn', '')
+            if urn:
+                processed_urns.add(urn)
+            
             post_data = {
                 'keyword': keyword,
                 'scraped_at': datetime.now().isoformat(),
                 'content_type': 'post',  # New field to distinguish posts from comments
                 'post_id': '',  # Will help group comments with posts
-                'author_name': '',
-                'author_title': '',
-                'post_text': '',
-                'post_url': '',
-                'likes_count': '',
-                'comments_count': '',
+                'author_name': raw.get('author_name', ''),
+                'author_title': raw.get('author_title', ''),
+                'post_text': raw.get('post_text', ''),
+                'post_url': raw.get('post_url', ''),
+                'likes_count': raw.get('likes_count', ''),
+                'comments_count': raw.get('comments_count', ''),
                 'reposts_count': '',
-                'post_date': '',
+                'post_date': raw.get('post_date', ''),
                 'comment_author': '',  # For comments
                 'comment_text': '',    # For comments
                 'comment_date': ''     # For comments
             }
             
-            print(f"     Extracting from post element: {post_element.tag_name if hasattr(post_element, 'tag_name') else 'unknown'}")  # Debug
-            
-            # Extract author name with multiple selectors
-            author_selectors = [
-                ".update-components-actor__name",
-                ".feed-shared-actor__name",
-                ".feed-shared-actor__name a",
-                ".feed-shared-actor__name span",
-                "[data-control-name='actor'] span",
-                ".update-components-actor__name a span"
-            ]
-            
-            for selector in author_selectors:
-                try:
-                    author_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                    author_text = author_element.text.strip()
-                    if author_text:
-                        post_data['author_name'] = author_text
-                        print(f"     Author found with '{selector}': {author_text[:30]}")  # Debug
-                        break
-                    else:
-                        print(f"     Warning Author selector '{selector}' found element but no text")  # Debug
-                except NoSuchElementException:
-                    print(f"     Author selector '{selector}' not found")  # Debug
-                    continue
-            
-            if not post_data['author_name']:
-                print(f"     Warning No author name found with any selector")  # Debug
-            
-            # Extract author title with multiple selectors
-            title_selectors = [
-                ".update-components-actor__description",
-                ".feed-shared-actor__description",
-                ".feed-shared-actor__sub-description",
-                ".update-components-actor__meta .update-components-actor__description"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    title_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                    post_data['author_title'] = title_element.text.strip()
-                    if post_data['author_title']:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Extract post text with multiple selectors
-            text_selectors = [
-                ".feed-shared-update-v2__description",
-                ".update-components-text",
-                ".feed-shared-text",
-                ".feed-shared-update-v2__description .feed-shared-text",
-                ".update-components-update-v2__commentary .update-components-text",
-                ".feed-shared-inline-show-more-text",
-                ".attributed-text-segment-list__content"
-            ]
-            
-            for selector in text_selectors:
-                try:
-                    text_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                    text_content = text_element.text.strip()
-                    if text_content and len(text_content) > 10:  # Only use if substantial content
-                        post_data['post_text'] = text_content
-                        print(f"     Post text found with '{selector}': {text_content[:50]}...")  # Debug
-                        break
-                    elif text_content:
-                        print(f"     Warning Text selector '{selector}' found short text: '{text_content}'")  # Debug
-                    else:
-                        print(f"     Warning Text selector '{selector}' found element but no text")  # Debug
-                except NoSuchElementException:
-                    print(f"     Author selector '{selector}' not found")  # Debug
-                    continue
-            
-            if not post_data['post_text']:
-                print(f"     Warning No post text found with any selector")  # Debug
-            
-            # Try to expand "See more" if text is truncated
-            if post_data['post_text'] and ("..." in post_data['post_text'] or "see more" in post_data['post_text'].lower()):
-                try:
-                    see_more_button = post_element.find_element(By.CSS_SELECTOR, ".feed-shared-inline-show-more-text__see-more-less-toggle, .see-more")
-                    see_more_button.click()
-                    time.sleep(0.5)
-                    # Re-extract text after expanding
-                    for selector in text_selectors:
-                        try:
-                            text_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                            expanded_text = text_element.text.strip()
-                            if len(expanded_text) > len(post_data['post_text']):
-                                post_data['post_text'] = expanded_text
-                                break
-                        except NoSuchElementException:
-                            continue
-                except:
-                    pass
-            
-            # Extract post URL with multiple approaches
-            url_selectors = [
-                "a[data-control-name='overlay']",
-                "a[href*='/posts/']",
-                "a[href*='activity-']",
-                ".feed-shared-control-menu__trigger"
-            ]
-            
-            for selector in url_selectors:
-                try:
-                    url_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                    href = url_element.get_attribute('href')
-                    if href and ('posts' in href or 'activity' in href):
-                        post_data['post_url'] = href
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Extract engagement metrics with multiple selectors
-            reaction_selectors = [
-                ".social-details-social-counts__reactions-count",
-                ".feed-shared-social-action-bar__reaction-count",
-                "[data-control-name='reactions_count']",
-                ".reactions-count"
-            ]
-            
-            for selector in reaction_selectors:
-                try:
-                    reactions_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                    post_data['likes_count'] = reactions_element.text.strip()
-                    if post_data['likes_count']:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            comment_selectors = [
-                ".social-details-social-counts__comments",
-                ".feed-shared-social-action-bar__comment-count",
-                "[data-control-name='comments_count']",
-                ".comments-count"
-            ]
-            
-            for selector in comment_selectors:
-                try:
-                    comments_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                    post_data['comments_count'] = comments_element.text.strip()
-                    if post_data['comments_count']:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Extract post date with multiple selectors
-            date_selectors = [
-                ".update-components-actor__sub-description",
-                ".feed-shared-actor__sub-description",
-                ".update-components-actor__meta time",
-                ".feed-shared-actor__meta time",
-                "time[datetime]"
-            ]
-            
-            for selector in date_selectors:
-                try:
-                    date_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                    post_data['post_date'] = date_element.text.strip()
-                    if post_data['post_date']:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Final debug summary
-            extracted_fields = sum(1 for field in ['author_name', 'post_text', 'author_title', 'post_url'] 
-                                  if post_data.get(field, '').strip())
-            print(f"     Extraction summary: {extracted_fields}/4 fields extracted")
-            
-            # If nothing meaningful was extracted, save HTML for debugging
-            if extracted_fields == 0:
-                try:
-                    html_snippet = post_element.get_attribute('outerHTML')[:500]
-                    print(f"     Extracted HTML snippet: {html_snippet}...")
-                except:
-                    print(f"     Warning Could not get HTML snippet")
+            if 'error' in raw:
+                post_data['author_name'] = 'ERROR'
+                post_data['post_text'] = f"Error extracting post: {raw['error']}"
             
             # Extract post ID for comment grouping
-            try:
-                post_urn = post_element.get_attribute('data-urn') or post_element.get_attribute('data-chameleon-result-urn')
-                if post_urn:
-                    post_data['post_id'] = post_urn.split(':')[-1] if ':' in post_urn else post_urn[:10]
-                else:
-                    post_data['post_id'] = f"post_{datetime.now().strftime('%H%M%S%f')}"
-            except:
+            if urn:
+                post_data['post_id'] = urn.split(':')[-1] if ':' in urn else urn[:10]
+            else:
                 post_data['post_id'] = f"post_{datetime.now().strftime('%H%M%S%f')}"
             
-            return post_data
-            
-        except Exception as e:
-            print(f"Warning Error extracting post data: {e}")
-            # Return basic error post
-            return {
-                'keyword': keyword,
-                'scraped_at': datetime.now().isoformat(),
-                'author_name': 'EXTRACTION_ERROR',
-                'author_title': '',
-                'post_text': f'Error: {str(e)}',
-                'post_url': '',
-                'likes_count': '',
-                'comments_count': '',
-                'reposts_count': '',
-                'post_date': ''
-                         }
+            new_posts.append((post_data, post_element))
+        
+        return new_posts, total
     
     def extract_comments(self, post_element, keyword, post_data):
         """Extract comments from a post and return them as separate entries"""
@@ -588,7 +402,7 @@ class LinkedInEducationScraper:
                         comments_button = post_element.find_element(By.CSS_SELECTOR, selector)
                         if "comment" in comments_button.text.lower() or "comment" in comments_button.get_attribute('aria-label').lower():
                             self.driver.execute_script("arguments[0].click();", comments_button)
-                            time.sleep(2)
+                            self.comments_timeout.wait(wait_for_count_increase, post_element, ", ".join(COMMENT_SELECTORS), 0)
                             print(f"     Clicked comments button")
                             break
                     except:
@@ -597,16 +411,8 @@ class LinkedInEducationScraper:
                 print(f"     Warning Could not expand comments: {comment_expand_error}")
             
             # Find comment elements
-            comment_selectors = [
-                ".comments-comment-item",
-                ".feed-shared-comments-list .comment",
-                ".comments-comment-entity",
-                ".feed-shared-comment",
-                "[data-test-id='comment']"
-            ]
-            
             comment_elements = []
-            for selector in comment_selectors:
+            for selector in COMMENT_SELECTORS:
                 try:
                     elements = post_element.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
@@ -721,34 +527,23 @@ class LinkedInEducationScraper:
         return text
      
     def scrape_posts(self, keyword, max_posts=40):
-        """Scrape posts for a specific keyword"""
-        posts_collected = []
-        scroll_pause_time = 3
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        """
+        Scrape posts for a specific keyword, extracting only the posts added since the last scroll.
+        
+        Posts and comments go straight to the journal; returns the number of entries collected.
+        """
+        posts_collected = 0
+        processed_urns = set()
+        seen_content = set()
         no_new_posts_count = 0
         
         print(f"Starting to scrape {max_posts} posts for '{keyword}'...")
         
-        while len(posts_collected) < max_posts and not self.interrupted:
+        while posts_collected < max_posts and not self.interrupted:
             try:
-                # Multiple selectors to find post elements
-                post_selectors = [
-                    ".feed-shared-update-v2",
-                    ".update-components-update-v2",
-                    "[data-urn*='activity']",
-                    ".occludable-update",
-                    "[data-chameleon-result-urn]"
-                ]
-                
-                post_elements = []
-                for selector in post_selectors:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        post_elements = elements
-                        print(f"Found {len(elements)} posts using selector: {selector}")
-                        break
+                new_posts, total = self.extract_new_posts(keyword, processed_urns)
                 
-                if not post_elements:
+                if not total:
                     print(f"Warning No post elements found with any selector")
                     print(f"Current URL: {self.driver.current_url}")
                     print(f"Page title: {self.driver.title}")
@@ -768,168 +563,144 @@ class LinkedInEducationScraper:
                     except Exception as debug_error:
                         print(f"Warning Debug file save failed: {debug_error}")
                     
+                    no_new_posts_count += 1
+                    if no_new_posts_count >= 3:
+                        print(f"Warning No posts found after 3 attempts for '{keyword}'.")
+                        break
                     print(f"Warning Scrolling and trying again...")
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(scroll_pause_time)
+                    self.scroll_timeout.wait(scroll_and_wait, self.driver)
                     continue
                 
-                previous_count = len(posts_collected)
+                print(f"Found {total} posts, {len(new_posts)} new")
+                previous_count = posts_collected
                 
-                # Extract data from new posts
-                for i, post_element in enumerate(post_elements):
-                    if len(posts_collected) >= max_posts:
+                # Process only the posts added since the last scroll
+                for post_data, post_element in new_posts:
+                    if posts_collected >= max_posts:
                         break
                     
-                    # Skip posts we've already processed
-                    if i < previous_count:
+                    print(f"   Raw post data: {post_data}")  # Debug line
+                    
+                    # Clean all text fields to fix encoding issues
+                    text_fields = ['author_name', 'author_title', 'post_text']
+                    for field in text_fields:
+                        if post_data.get(field):
+                            post_data[field] = self.clean_text(post_data[field])
+                    
+                    # Always collect post data, even if minimal
+                    # Check for any meaningful content
+                    has_content = (
+                        post_data.get('post_text', '').strip() or 
+                        post_data.get('author_name', '').strip() or
+                        post_data.get('author_title', '').strip() or
+                        post_data.get('post_url', '').strip()
+                    )
+                    
+                    if not has_content:
+                        # Still collect it but mark as empty
+                        self.journal.append(keyword, post_data)
+                        posts_collected += 1
+                        print(f"   Post {posts_collected}/{max_posts} - EMPTY POST (collected anyway)")
                         continue
                     
-                    try:
-                        post_data = self.extract_post_data(post_element, keyword)
-                        print(f"   Raw post data: {post_data}")  # Debug line
-                        
-                        if post_data:
-                            # Clean all text fields to fix encoding issues
-                            text_fields = ['author_name', 'author_title', 'post_text']
-                            for field in text_fields:
-                                if post_data.get(field):
-                                    post_data[field] = self.clean_text(post_data[field])
-                            
-                            # Always collect post data, even if minimal
-                            # Check for any meaningful content
-                            has_content = (
-                                post_data.get('post_text', '').strip() or 
-                                post_data.get('author_name', '').strip() or
-                                post_data.get('author_title', '').strip() or
-                                post_data.get('post_url', '').strip()
-                            )
-                            
-                            if has_content:
-                                # Avoid duplicates by checking if we already have this post
-                                is_duplicate = False
-                                for existing_post in posts_collected:
-                                    if (existing_post.get('post_text', '') == post_data.get('post_text', '') and 
-                                        existing_post.get('author_name', '') == post_data.get('author_name', '') and
-                                        post_data.get('post_text', '')):  # Only check for duplicates if there's actual text
-                                        is_duplicate = True
-                                        break
-                                
-                                if not is_duplicate:
-                                    posts_collected.append(post_data)
-                                    author_display = post_data.get('author_name', 'Unknown')[:30] or 'No author'
-                                    text_preview = post_data.get('post_text', 'No text')[:50] or 'No text'
-                                    print(f"   Post {len(posts_collected)}/{max_posts} - Author: {author_display} | Text: {text_preview}...")
-                                    
-                                    # Extract comments for this post
-                                    try:
-                                        comments = self.extract_comments(post_element, keyword, post_data)
-                                        if comments:
-                                            posts_collected.extend(comments)
-                                            print(f"   Added {len(comments)} comments to collection")
-                                    except Exception as comment_error:
-                                        print(f"   Warning Comment extraction failed: {comment_error}")
-                                else:
-                                    print(f"   Skipped duplicate post")
-                            else:
-                                # Still collect it but mark as empty
-                                posts_collected.append(post_data)
-                                print(f"   Post {len(posts_collected)}/{max_posts} - EMPTY POST (collected anyway)")
-                    except Exception as post_error:
-                        print(f"   Warning Error processing individual post: {post_error}")
-                        # Create empty post entry to maintain count
-                        empty_post = {
-                            'keyword': keyword,
-                            'scraped_at': datetime.now().isoformat(),
-                            'content_type': 'post',
-                            'post_id': f'error_{datetime.now().strftime("%H%M%S%f")}',
-                            'author_name': 'ERROR',
-                            'author_title': '',
-                            'post_text': f'Error extracting post: {post_error}',
-                            'post_url': '',
-                            'likes_count': '',
-                            'comments_count': '',
-                            'reposts_count': '',
-                            'post_date': '',
-                            'comment_author': '',
-                            'comment_text': '',
-                            'comment_date': ''
-                        }
-                        posts_collected.append(empty_post)
-                        print(f"   Post {len(posts_collected)}/{max_posts} - ERROR POST (collected for debugging)")
+                    # Avoid duplicates (same author and text); only check if there's actual text
+                    content_key = (post_data.get('author_name', ''), post_data.get('post_text', ''))
+                    if post_data.get('post_text', '') and content_key in seen_content:
+                        print(f"   Skipped duplicate post")
                         continue
+                    seen_content.add(content_key)
+                    
+                    self.journal.append(keyword, post_data)
+                    posts_collected += 1
+                    author_display = post_data.get('author_name', 'Unknown')[:30] or 'No author'
+                    text_preview = post_data.get('post_text', 'No text')[:50] or 'No text'
+                    print(f"   Post {posts_collected}/{max_posts} - Author: {author_display} | Text: {text_preview}...")
+                    
+                    # Extract comments for this post
+                    try:
+                        comments = self.extract_comments(post_element, keyword, post_data)
+                        for comment in comments:
+                            self.journal.append(keyword, comment)
+                        posts_collected += len(comments)
+                        if comments:
+                            print(f"   Added {len(comments)} comments to collection")
+                    except Exception as comment_error:
+                        print(f"   Warning Comment extraction failed: {comment_error}")
                 
                 # Check if we got new posts
-                if len(posts_collected) == previous_count:
+                if posts_collected == previous_count:
                     no_new_posts_count += 1
                     print(f"   No new posts found (attempt {no_new_posts_count}/3)")
                     if no_new_posts_count >= 3:
-                        print(f"Warning No new posts after 3 attempts for '{keyword}'. Collected {len(posts_collected)} posts.")
+                        print(f"Warning No new posts after 3 attempts for '{keyword}'. Collected {posts_collected} posts.")
                         break
                 else:
                     no_new_posts_count = 0
                 
                 # Scroll down to load more posts
-                if len(posts_collected) < max_posts:
+                if posts_collected < max_posts:
                     print(f"   Scrolling to load more posts...")
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(scroll_pause_time)
-                    
-                    # Check if we've reached the bottom
-                    new_height = self.driver.execute_script("return document.body.scrollHeight")
-                    if new_height == last_height:
-                        print(f"Warning Reached end of page for '{keyword}'. Collected {len(posts_collected)} posts.")
+                    # Nothing new within the timeout means we've reached the bottom
+                    if not self.scroll_timeout.wait(scroll_and_wait, self.driver):
+                        print(f"Warning Reached end of page for '{keyword}'. Collected {posts_collected} posts.")
                         break
-                    last_height = new_height
                     
             except Exception as e:
                 print(f"Error during scraping for '{keyword}': {e}")
                 break
         
-        print(f"Completed scraping for '{keyword}': {len(posts_collected)} posts collected")
+        print(f"Completed scraping for '{keyword}': {posts_collected} posts collected")
         return posts_collected
     
-    def save_data(self, all_posts_data, filename_prefix="uae_education_data"):
-        """Save scraped data to multiple formats"""
+    def save_data(self, journal, filename_prefix="uae_education_data"):
+        """Export the journal to JSON, CSV and a summary, one record at a time"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Save as JSON
         json_filename = f"{filename_prefix}_{timestamp}.json"
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(all_posts_data, f, indent=2, ensure_ascii=False)
-        print(f"Data saved to JSON: {json_filename}")
-        
-        # Save as CSV
         csv_filename = f"{filename_prefix}_{timestamp}.csv"
-        if all_posts_data:
-            df = pd.DataFrame(all_posts_data)
-            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')  # utf-8-sig fixes Excel encoding
-            print(f"Data saved to CSV: {csv_filename}")
+        
+        total_entries = 0
+        posts_count = 0
+        comments_count = 0
+        keyword_counts = {}
+        
+        # utf-8-sig fixes Excel encoding
+        with open(json_filename, 'w', encoding='utf-8') as json_file, \
+                open(csv_filename, 'w', newline='', encoding='utf-8-sig') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=POST_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            json_file.write("[\n")
+            
+            for keyword, item in journal.records():
+                if total_entries:
+                    json_file.write(",\n")
+                json_file.write(json.dumps(item, indent=2, ensure_ascii=False))
+                writer.writerow(item)
+                total_entries += 1
+                
+                # Count posts vs comments, also per keyword
+                counts = keyword_counts.setdefault(keyword, {'posts': 0, 'comments': 0})
+                if item.get('content_type') == 'post':
+                    posts_count += 1
+                    counts['posts'] += 1
+                else:
+                    counts['comments'] += 1
+                    if item.get('content_type') == 'comment':
+                        comments_count += 1
+            
+            json_file.write("\n]\n")
+        print(f"Data saved to JSON: {json_filename}")
+        print(f"Data saved to CSV: {csv_filename}")
         
         # Save summary
         summary_filename = f"{filename_prefix}_summary_{timestamp}.txt"
         with open(summary_filename, 'w', encoding='utf-8') as f:
             f.write(f"LinkedIn Education Data Scraping Summary\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total entries collected: {len(all_posts_data)}\n\n")
-            
-            # Count posts vs comments
-            posts_count = len([item for item in all_posts_data if item.get('content_type') == 'post'])
-            comments_count = len([item for item in all_posts_data if item.get('content_type') == 'comment'])
+            f.write(f"Total entries collected: {total_entries}\n\n")
             
             f.write(f"Posts collected: {posts_count}\n")
             f.write(f"Comments collected: {comments_count}\n\n")
             
-            # Group by keyword
-            keyword_counts = {}
-            for item in all_posts_data:
-                keyword = item['keyword']
-                if keyword not in keyword_counts:
-                    keyword_counts[keyword] = {'posts': 0, 'comments': 0}
-                if item.get('content_type') == 'post':
-                    keyword_counts[keyword]['posts'] += 1
-                else:
-                    keyword_counts[keyword]['comments'] += 1
-            
             f.write("Data per keyword:\n")
             for keyword, counts in keyword_counts.items():
                 f.write(f"  - {keyword}: {counts['posts']} posts, {counts['comments']} comments\n")
@@ -937,88 +708,75 @@ class LinkedInEducationScraper:
         print(f"Summary saved: {summary_filename}")
         return json_filename, csv_filename, summary_filename
     
-    def cleanup_temp_files(self):
-        """Clean up temporary progress files"""
-        try:
-            temp_files = [f for f in os.listdir('.') if f.startswith('temp_progress_')]
-            if temp_files:
-                print(f"\nCleaning up {len(temp_files)} temporary files...")
-                for temp_file in temp_files:
-                    os.remove(temp_file)
-                    print(f"    Removed: {temp_file}")
-                print("Cleanup completed")
-        except Exception as e:
-            print(f"Warning Cleanup warning: {e}")
+    def scrape_keyword(self, keyword, delay_time=3):
+        """Search one keyword and journal its posts in a pooled browser session; returns the entry count"""
+        if self.interrupted:
+            return 0
+        with self.pool.session() as driver:
+            self.driver = driver
+            try:
+                if not self.search_keyword(keyword):
+                    print(f"Warning Skipping keyword '{keyword}' due to search error")
+                    return 0
+                self.journal.start(keyword)
+                count = self.scrape_posts(keyword, max_posts=40)
+                
+                # A keyword cut short by Ctrl+C is redone when the run is resumed
+                if not self.interrupted:
+                    self.journal.finish(keyword, count)
+                    # Pause this session before its next keyword to avoid rate limiting
+                    time.sleep(delay_time)
+                return count
+            finally:
+                self.driver = None
     
     def run_scraping(self, keywords):
         """Main method to run the complete scraping process"""
+        # Keywords finished by an earlier, interrupted run are not scraped again
+        completed = self.journal.completed()
+        remaining = [keyword for keyword in keywords if keyword not in completed]
+        if len(remaining) < len(keywords):
+            print(f"Resuming {self.journal.path}: {len(keywords) - len(remaining)} keywords already done")
+        
+        # Step 1: Start the browser sessions, logging in once if no saved session exists
         if not self.setup_driver():
             return False
         
         try:
-            # Step 1: Login wait
-            if not self.login_wait():
+            if not self.pool.is_authenticated():
                 print("Warning Login failed or timed out")
                 return False
             
-            # Initialize data storage in instance variable for signal handler access
-            self.posts_data = []
-            
-            # Step 2: Process each keyword with progress tracking
-            total_keywords = len(keywords)
-            print(f"\nStarting to process {total_keywords} keywords")
+            # Step 2: Process the keywords on all sessions with progress tracking
+            total_keywords = len(remaining)
+            sessions = len(self.pool.drivers)
+            # Longer delay for larger batches to avoid rate limiting
+            delay_time = 5 if total_keywords > 30 else 3
+            print(f"\nStarting to process {total_keywords} keywords on {sessions} browser session(s)")
             print(f"Target: {total_keywords * 40} total posts (40 per keyword)")
-            print(f"Warning Press Ctrl+C at any time to stop and save collected data")
-            print(f"Debug: Instance variable initialized with {len(self.posts_data)} posts")
-            
-            for i, keyword in enumerate(keywords, 1):
-                # Check if we've been interrupted
-                if self.interrupted:
-                    break
-                print(f"\n{'='*70}")
-                print(f"Searching for keyword {i}/{total_keywords}: '{keyword}'")
-                print(f"Progress: {((i-1)/total_keywords)*100:.1f}% complete")
-                print(f"Posts collected so far: {len(self.posts_data)}")
-                print(f"{'='*70}")
-                
-                if self.search_keyword(keyword):
-                    posts = self.scrape_posts(keyword, max_posts=40)
-                    self.posts_data.extend(posts)
-                    
-                    print(f"Completed keyword '{keyword}': {len(posts)} posts added")
-                    print(f"Posts collected: {len(self.posts_data)}")
-                    
-                    # Debug: Confirm data is being stored
-                    if len(self.posts_data) > 0:
-                        print(f"Debug: Last post author: {self.posts_data[-1].get('author_name', 'Unknown')[:30]}...")
-                    
-                    # Check for interruption after each keyword
-                    if self.interrupted:
-                        break
-                    
-                    # Longer delay for larger batches to avoid rate limiting
-                    if i < len(keywords):
-                        delay_time = 5 if total_keywords > 30 else 3
-                        print(f"Waiting {delay_time} seconds before next keyword...")
-                        time.sleep(delay_time)
-                else:
-                    print(f"Warning Skipping keyword '{keyword}' due to search error")
-                    
-                # Save intermediate progress every 10 keywords for large batches
-                if total_keywords > 20 and i % 10 == 0:
-                    temp_filename = f"temp_progress_{i}keywords_{datetime.now().strftime('%H%M%S')}.json"
-                    with open(temp_filename, 'w', encoding='utf-8') as f:
-                        json.dump(self.posts_data, f, indent=2, ensure_ascii=False)
-                    print(f"Intermediate progress saved: {temp_filename}")
+            print(f"Warning Press Ctrl+C at any time to stop; collected data is journaled to {self.journal.path}")
+            
+            i = 0
+            entries_collected = 0
+            with ThreadPoolExecutor(max_workers=sessions) as executor:
+                futures = {executor.submit(self.scrape_keyword, keyword, delay_time): keyword for keyword in remaining}
+                for future in as_completed(futures):
+                    keyword = futures[future]
+                    i += 1
+                    try:
+                        count = future.result()
+                    except Exception as e:
+                        print(f"Warning Error scraping keyword '{keyword}': {e}")
+                        count = 0
+                    entries_collected += count
                     
-                    # Also save CSV backup every 10 keywords
-                    temp_csv_filename = f"temp_progress_{i}keywords_{datetime.now().strftime('%H%M%S')}.csv"
-                    if self.posts_data:
-                        df = pd.DataFrame(self.posts_data)
-                        df.to_csv(temp_csv_filename, index=False, encoding='utf-8')
-                        print(f"CSV backup saved: {temp_csv_filename}")
+                    print(f"\n{'='*70}")
+                    print(f"Completed keyword {i}/{total_keywords} '{keyword}': {count} posts added")
+                    print(f"Progress: {(i/total_keywords)*100:.1f}% complete")
+                    print(f"Posts collected this run: {entries_collected}")
+                    print(f"{'='*70}")
             
-            # Step 3: Save all collected data
+            # Step 3: Compact the journal and export all collected data
             if self.interrupted:
                 print(f"\n{'='*70}")
                 print("Warning SCRAPING INTERRUPTED BY USER")
@@ -1029,29 +787,28 @@ class LinkedInEducationScraper:
                 print(f"{'='*70}")
             
             print(f"Final Results:")
-            print(f"   • Keywords processed: {i if 'i' in locals() else 0}")
-            print(f"   • Total posts collected: {len(self.posts_data)}")
-            if len(self.posts_data) > 0 and 'i' in locals() and i > 0:
-                print(f"   • Average posts per keyword: {len(self.posts_data)/i:.1f}")
-            
-            if self.posts_data:
-                if self.interrupted:
-                    print(f"\nSaving interrupted session data...")
-                    emergency_filename = self.save_emergency_data(self.posts_data)
-                    print(f"\nFiles created (due to interruption):")
-                    print(f"   CSV: {emergency_filename}")
-                else:
-                    json_file, csv_file, summary_file = self.save_data(self.posts_data)
-                    print(f"\nFiles created:")
-                    print(f"   JSON: {json_file}")
-                    print(f"   CSV: {csv_file}")
-                    print(f"   Summary: {summary_file}")
-                
-                # Clean up temporary files
-                self.cleanup_temp_files()
+            print(f"   • Keywords processed: {i}")
+            print(f"   • Total posts collected this run: {entries_collected}")
+            if entries_collected > 0 and i > 0:
+                print(f"   • Average posts per keyword: {entries_collected/i:.1f}")
+            
+            if self.journal.compact():
+                json_file, csv_file, summary_file = self.save_data(self.journal)
+                print(f"\nFiles created{' (due to interruption)' if self.interrupted else ''}:")
+                print(f"   JSON: {json_file}")
+                print(f"   CSV: {csv_file}")
+                print(f"   Summary: {summary_file}")
             else:
                 print("Warning No data was collected")
             
+            if self.interrupted:
+                print(f"\nRun again with the same keywords to resume from {self.journal.path}")
+            else:
+                # Keep the compacted journal, but let the next run start a fresh one
+                archive_name = f"uae_education_data_journal_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+                self.journal.archive(archive_name)
+                print(f"   Journal: {archive_name}")
+            
             return True
             
         except Exception as e:
@@ -1059,10 +816,10 @@ class LinkedInEducationScraper:
             return False
         
         finally:
-            # Cleanup
-            if self.driver:
-                print("\nClosing browser...")
-                self.driver.quit()
+            # Cleanup (the pool saves the login session for the next run)
+            print("\nClosing browser...")
+            self.pool.close()
+            self.journal.close()
 
 def main():
     """Main function to run the scraper with user-defined keywords"""
@@ -1154,10 +911,13 @@ def main():
     print(f"\nExpected total posts: {len(keywords) * 40}")
     print("Warning  Remember: Press Ctrl+C anytime to stop and save progress!")
     
+    sessions = input("\nBrowser sessions to run in parallel (default 1): ").strip()
+    num_sessions = int(sessions) if sessions.isdigit() and int(sessions) > 0 else 1
+    
     input("\nPress Enter to start scraping...")
     
     # Run the scraper
-    scraper = LinkedInEducationScraper()
+    scraper = LinkedInEducationScraper(num_sessions=num_sessions)
     success = scraper.run_scraping(keywords)
     
     if success:
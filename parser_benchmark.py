@@ -0,0 +1,108 @@
+import argparse
+import glob
+import importlib
+import os
+import sys
+import time
+
+from html_parsing import available_backends
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'parsers')
+
+# Extraction plans that can be benchmarked, as "module:attribute"; each has saved pages in FIXTURE_DIR/<site>
+PLANS = {
+    'reuters': 'reuters_scrap:REUTERS_PLAN',
+    'khaleej': 'khaleej_times_education_scraper:ARTICLE_PLAN',
+    'quora': 'quora_engine:QUESTION_LINKS',
+}
+
+
+def load_plan(name):
+    """Import a scraper's extraction plan"""
+    module_name, attribute = PLANS.get(name, name).split(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def load_pages(html_dir):
+    """Read every saved .html file in a directory as {file name: bytes}"""
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(html_dir, '*.html'))):
+        with open(path, 'rb') as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+
+def check_backends(plan, pages, backends):
+    """Differences between each backend's extracted fields and html.parser's, as readable lines"""
+    problems = []
+    for name, page in pages.items():
+        expected = plan.extract(page, 'html.parser')
+        if not any(expected.values()):
+            problems.append(f"{name}: html.parser extracted nothing")
+        for backend in backends:
+            result = plan.extract(page, backend)
+            for field, value in expected.items():
+                if result.get(field) != value:
+                    problems.append(f"{name}: {backend} {field}={str(result.get(field))[:60]!r} "
+                                    f"but html.parser {field}={str(value)[:60]!r}")
+    return problems
+
+
+def benchmark(plan, pages, backend, repeat):
+    """Pages per second for one backend (parse + extract all fields)"""
+    plan.extract(pages[0], backend)  # warm up: compiles the plan for this backend
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            plan.extract(page, backend)
+    elapsed = time.perf_counter() - start
+    return len(pages) * repeat / elapsed
+
+
+def run_site(site, html_dir, repeat):
+    """Check that every backend extracts the same fields, then time them; False if they differ"""
+    pages = load_pages(html_dir)
+    if not pages:
+        print(f"No .html files found in {html_dir}")
+        return False
+
+    plan = load_plan(site)
+    backends = available_backends()
+    print(f"\n{site}: {len(pages)} pages x {repeat} passes ({', '.join(backends)})")
+
+    problems = check_backends(plan, pages, [backend for backend in backends if backend != 'html.parser'])
+    if problems:
+        print("  Backends disagree, not timing them:")
+        for problem in problems:
+            print(f"    {problem}")
+        return False
+    print("  All backends extract identical fields")
+
+    results = {backend: benchmark(plan, list(pages.values()), backend, repeat) for backend in backends}
+    baseline = results['html.parser']
+    for backend, pages_per_second in results.items():
+        print(f"  {backend:<12} {pages_per_second:8.1f} pages/sec  ({pages_per_second / baseline:.1f}x html.parser)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on saved pages")
+    parser.add_argument('--site', choices=sorted(PLANS), action='append',
+                        help="Site to benchmark (repeatable; default: all)")
+    parser.add_argument('--html-dir', help="Directory of saved .html pages (default: fixtures/parsers/<site>)")
+    parser.add_argument('--repeat', type=int, default=20, help="Passes over the pages per backend")
+    args = parser.parse_args()
+
+    sites = args.site or sorted(PLANS)
+    if args.html_dir and len(sites) != 1:
+        parser.error("--html-dir needs exactly one --site")
+
+    ok = True
+    for site in sites:
+        ok = run_site(site, args.html_dir or os.path.join(FIXTURE_DIR, site), args.repeat) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,888 @@
+import csv
+import json
+import importlib
+import queue
+import re
+import threading
+import hashlib
+from urllib.parse import quote, urlparse, urlunparse
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from browser_pool import BrowserPool
+from html_parsing import BACKENDS, default_backend
+from selenium_waits import (AdaptiveTimeout, page_size, scroll_and_wait,
+                            wait_for_network_idle, wait_for_page_growth, wait_for_ready_state, wait_until)
+
+QUORA_HOME_URL = "https://www.quora.com/"
+QUORA_SEARCH_URL = "https://www.quora.com/search?q={query}"
+
+# Cookie Quora sets once a user has signed in
+QUORA_LOGIN_COOKIE = "m-login"
+
+# Shared by all sessions: how long Quora takes to render content after a scroll or a click
+SCROLL_TIMEOUT = AdaptiveTimeout(initial=6, maximum=15)
+CLICK_TIMEOUT = AdaptiveTimeout(initial=4, maximum=10)
+# How long a scraped question page takes to go quiet before the session moves on
+SETTLE_TIMEOUT = AdaptiveTimeout(initial=4, maximum=10)
+
+# Times a question page is retried after an error before it is given up for the run
+QUESTION_RETRIES = 2
+
+# Modules listing the search terms, fallback terms and listing URLs that main() runs together
+TERM_MODULES = ['quora1', 'quora2', 'quora3', 'quora4']
+
+def chrome_options(headless=False):
+    """Chrome options shared by every Quora session"""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")  # Run in headless mode
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--ignore-certificate-errors")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    
+    # Set language to English explicitly
+    chrome_options.add_argument("--lang=en-US")
+    chrome_options.add_experimental_option('prefs', {'intl.accept_languages': 'en-US,en'})
+    
+    # Add a realistic user agent
+    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36")
+    return chrome_options
+
+def setup_driver(headless=False):
+    """
+    Set up and return a Chrome WebDriver instance
+    
+    Args:
+        headless: Run without a window (manual login is then impossible)
+    """
+    try:
+        driver = webdriver.Chrome(options=chrome_options(headless))
+        return driver
+    except Exception as e:
+        print(f"Error setting up Chrome WebDriver: {str(e)}")
+        print("Make sure you have Chrome and ChromeDriver installed.")
+        return None
+
+def clean_text(text):
+    """Clean text by removing extra whitespace, user attribution patterns, and dates"""
+    if not text:
+        return ""
+    
+    # Remove user attribution patterns like "User's answer to..."
+    text = re.sub(r"[A-Za-z0-9\s]+'s answer to ", "", text)
+    
+    # Remove date patterns (various formats)
+    text = re.sub(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2}(?:,? \d{4})?', '', text)
+    text = re.sub(r'\d{1,2}/\d{1,2}/\d{2,4}', '', text)
+    text = re.sub(r'\d{4}-\d{2}-\d{2}', '', text)
+    
+    # Remove common author indicators
+    text = re.sub(r'(?:Written|Answered) by:? [A-Za-z\s\.]+', '', text)
+    text = re.sub(r'(?:Updated|Posted|Published):? [A-Za-z0-9\s,\.]+', '', text)
+    text = re.sub(r'(?:Author|Writer):? [A-Za-z\s\.]+', '', text)
+    
+    # Remove extra whitespace
+    text = re.sub(r'\s+', ' ', text).strip()
+    
+    return text
+
+def extract_clean_question(url):
+    """Extract clean question from URL or title"""
+    # Try to extract the question from the URL
+    match = re.search(r'/([^/]+)(?:/answer/|$)', url)
+    if match:
+        question = match.group(1)
+        # Replace hyphens with spaces and decode URL encoding
+        question = question.replace('-', ' ')
+        question = re.sub(r'\b[A-Z][a-z]*\b-\d+$', '', question)  # Remove username pattern at end
+        
+        # Clean up common URL patterns
+        question = question.replace('q ', '')
+        
+        # Replace URL encoding
+        question = question.replace('%20', ' ')
+        question = question.replace('%27', "'")
+        question = question.replace('%22', '"')
+        question = question.replace('%3F', '?')
+        
+        return question.strip()
+    return None
+
+def get_question_content(driver):
+    """Extract the question title and full content separately"""
+    title = ""
+    details = ""
+    
+    try:
+        # First try to get the question title (usually in h1)
+        title_element = None
+        try:
+            title_element = WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.TAG_NAME, "h1"))
+            )
+        except:
+            # Try other heading tags if h1 not found
+            for tag in ["h2", "h3"]:
+                try:
+                    title_element = driver.find_element(By.TAG_NAME, tag)
+                    break
+                except:
+                    pass
+        
+        if title_element:
+            title = title_element.text.strip()
+            
+            # Try to find question details/description that might follow the title
+            try:
+                # Look for question details container
+                details_element = None
+                
+                # Method 1: Look for elements with question-related classes
+                try:
+                    details_element = driver.find_element(By.CSS_SELECTOR, 
+                        "div[class*='question-details'], div[class*='question_text'], div[class*='question-text']")
+                except:
+                    pass
+                
+                # Method 2: Look for paragraphs near the title
+                if not details_element:
+                    try:
+                        # Find the parent of the title
+                        parent = driver.execute_script("return arguments[0].parentNode;", title_element)
+                        # Look for paragraphs within this parent or its next siblings
+                        paragraphs = parent.find_elements(By.TAG_NAME, "p")
+                        if paragraphs:
+                            details_text = " ".join([p.text.strip() for p in paragraphs if p.text.strip()])
+                            if details_text:
+                                details = details_text
+                    except:
+                        pass
+                
+                # If we found a details element, add its text
+                if details_element and details_element.text.strip():
+                    details = details_element.text.strip()
+                    
+            except Exception as e:
+                print(f"Error getting question details: {str(e)}")
+    
+    except Exception as e:
+        print(f"Error extracting question content: {str(e)}")
+    
+    return clean_text(title), clean_text(details)
+
+def clean_answer(answer_text):
+    """Clean answer text to remove author information, dates, and other metadata"""
+    if not answer_text:
+        return ""
+    
+    # Remove lines likely to contain author info or dates
+    lines = answer_text.split('\n')
+    cleaned_lines = []
+    
+    for line in lines:
+        # Skip lines that likely contain author info or dates
+        if (re.search(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2}(?:,? \d{4})?', line) or
+            re.search(r'\d{1,2}/\d{1,2}/\d{2,4}', line) or
+            re.search(r'\d{4}-\d{2}-\d{2}', line) or
+            re.search(r'(?:Written|Answered) by:? [A-Za-z\s\.]+', line) or
+            re.search(r'(?:Updated|Posted|Published):? [A-Za-z0-9\s,\.]+', line) or
+            re.search(r'(?:Author|Writer):? [A-Za-z\s\.]+', line) or
+            re.search(r'\d+ views', line, re.IGNORECASE) or
+            re.search(r'\d+ upvotes?', line, re.IGNORECASE) or
+            len(line.strip()) < 15):  # Skip very short lines that might be metadata
+            continue
+        
+        cleaned_lines.append(line)
+    
+    return '\n'.join(cleaned_lines).strip()
+
+def click_more_answers_button(driver):
+    """Try to click on 'More Answers' or similar buttons to load additional answers"""
+    try:
+        # Look for buttons that might load more answers
+        more_buttons = driver.find_elements(By.XPATH, 
+            "//button[contains(text(), 'More') or contains(text(), 'more') or contains(text(), 'Show') or contains(text(), 'Load')]")
+        
+        for button in more_buttons:
+            try:
+                if button.is_displayed() and button.is_enabled():
+                    print("  - Clicking button to load more answers...")
+                    before = page_size(driver)
+                    driver.execute_script("arguments[0].click();", button)
+                    CLICK_TIMEOUT.wait(wait_for_page_growth, driver, before)  # Wait for content to load
+            except:
+                pass
+                
+        # Also try clicking on "View more answers" links
+        more_links = driver.find_elements(By.XPATH, 
+            "//a[contains(text(), 'More') or contains(text(), 'more') or contains(text(), 'Show') or contains(text(), 'Load') or contains(text(), 'View')]")
+        
+        for link in more_links:
+            try:
+                if link.is_displayed():
+                    print("  - Clicking link to load more answers...")
+                    before = page_size(driver)
+                    driver.execute_script("arguments[0].click();", link)
+                    CLICK_TIMEOUT.wait(wait_for_page_growth, driver, before)  # Wait for content to load
+            except:
+                pass
+    except Exception as e:
+        print(f"  - Error clicking more answers button: {str(e)}")
+
+def extract_all_answers(driver):
+    """Extract all answers from the page using multiple methods"""
+    all_answers = []
+    
+    # Method 1: Look for answer containers with specific classes
+    try:
+        # First try to find elements with class containing "answer"
+        answer_elements = driver.find_elements(By.CSS_SELECTOR, 
+            "div[class*='Answer'], div[class*='answer'], div[class*='AnswerBase']")
+        
+        for element in answer_elements:
+            # Skip very small elements that might be UI components
+            if element.size['height'] < 50:
+                continue
+                
+            answer_text = clean_answer(element.text)
+            if answer_text and len(answer_text) > 50:  # Minimum length to be considered an answer
+                all_answers.append(answer_text)
+    except Exception as e:
+        print(f"Method 1 error: {str(e)}")
+    
+    # Method 2: Look for answer content by structure
+    try:
+        # Find all divs that might contain answers
+        potential_answers = driver.find_elements(By.XPATH, 
+            "//div[contains(@class, 'q-box') and contains(@class, 'qu-pt--medium')]")
+        
+        for div in potential_answers:
+            # Skip elements that are too small
+            if div.size['height'] < 100:
+                continue
+                
+            answer_text = clean_answer(div.text)
+            if answer_text and len(answer_text) > 100:  # More strict length requirement
+                if answer_text not in all_answers:  # Avoid duplicates
+                    all_answers.append(answer_text)
+    except Exception as e:
+        print(f"Method 2 error: {str(e)}")
+    
+    # Method 3: Look for substantial paragraphs
+    try:
+        # Find all paragraphs
+        paragraphs = driver.find_elements(By.TAG_NAME, "p")
+        
+        # Group consecutive paragraphs that might form a single answer
+        current_answer = []
+        
+        for p in paragraphs:
+            p_text = p.text.strip()
+            if p_text and len(p_text) > 30:  # Substantial paragraph
+                current_answer.append(p_text)
+            elif current_answer:  # End of an answer group
+                full_answer = " ".join(current_answer)
+                if len(full_answer) > 100:  # Minimum length for grouped paragraphs
+                    clean_full_answer = clean_answer(full_answer)
+                    if clean_full_answer not in all_answers:  # Avoid duplicates
+                        all_answers.append(clean_full_answer)
+                current_answer = []
+        
+        # Add the last answer if there is one
+        if current_answer:
+            full_answer = " ".join(current_answer)
+            if len(full_answer) > 100:
+                clean_full_answer = clean_answer(full_answer)
+                if clean_full_answer not in all_answers:  # Avoid duplicates
+                    all_answers.append(clean_full_answer)
+    except Exception as e:
+        print(f"Method 3 error: {str(e)}")
+    
+    # Method 4: Look for comments
+    try:
+        # Find comment sections
+        comment_sections = driver.find_elements(By.CSS_SELECTOR, 
+            "div[class*='comment'], div[class*='Comment']")
+        
+        for section in comment_sections:
+            comment_text = clean_answer(section.text)
+            if comment_text and len(comment_text) > 30:  # Comments can be shorter
+                if comment_text not in all_answers:  # Avoid duplicates
+                    all_answers.append(comment_text)
+    except Exception as e:
+        print(f"Method 4 error: {str(e)}")
+    
+    return all_answers
+
+def handle_login_wall(driver, disable_screenshots=False):
+    """Try to bypass or handle Quora's login wall"""
+    print("Attempting to handle login wall...")
+    
+    # Take a screenshot to help diagnose what's on the page
+    if not disable_screenshots:
+        driver.save_screenshot("current_page.png")
+        print("Saved screenshot to current_page.png for diagnosis")
+    
+    # More specific check for login elements
+    login_elements = False
+    try:
+        # Look for specific login-related elements
+        login_buttons = driver.find_elements(By.XPATH, 
+            "//button[contains(text(), 'Log In') or contains(text(), 'Sign Up') or contains(text(), 'Continue with Google')]")
+        login_inputs = driver.find_elements(By.XPATH, 
+            "//input[@type='email' or @type='password']")
+        
+        if login_buttons or login_inputs:
+            login_elements = True
+            print("Login elements detected on the page")
+    except:
+        pass
+    
+    # Check if we're on a login page
+    if (login_elements or 
+        "login" in driver.current_url.lower() or 
+        "signup" in driver.current_url.lower()):
+        
+        print("\n" + "="*50)
+        print("LOGIN PAGE DETECTED!")
+        print("Please log in manually in the browser window.")
+        print("The script will wait for 3 minutes (180 seconds) for you to complete the login.")
+        print("If this is NOT a login page, press Ctrl+C in the terminal to stop the script.")
+        print("="*50 + "\n")
+        
+        # Wait up to 180 seconds for manual login: done as soon as the login cookie is set or the URL changes
+        try:
+            print("Waiting for login... (press Ctrl+C to stop)")
+            wait_until(driver, lambda d: d.get_cookie(QUORA_LOGIN_COOKIE) or not (
+                "login" in d.current_url.lower() or "signup" in d.current_url.lower()), timeout=180, poll_frequency=1)
+            
+            # Check if still on login page
+            if "login" in driver.current_url.lower() or "signup" in driver.current_url.lower():
+                print("Still on login page. Login might not have been completed.")
+                return False
+            else:
+                print("URL changed. Login appears successful!")
+                wait_for_ready_state(driver)  # Let the page load after login
+                return True
+                
+        except Exception as e:
+            print(f"Error during manual login wait: {str(e)}")
+            return False
+    else:
+        print("No login page detected, continuing with scraping...")
+    
+    # If not on login page, try the automatic methods
+    # Method 1: Try to close any login modals
+    try:
+        close_buttons = driver.find_elements(By.XPATH, 
+            "//button[contains(@class, 'close') or contains(@aria-label, 'Close') or contains(@class, 'modal-close')]")
+        for button in close_buttons:
+            if button.is_displayed():
+                print("  Clicking close button on modal...")
+                driver.execute_script("arguments[0].click();", button)
+                wait_until(driver, lambda d: not button.is_displayed(), timeout=2)
+                return True
+    except:
+        pass
+    
+    # Method 2: Try to click "X" buttons
+    try:
+        x_buttons = driver.find_elements(By.XPATH, 
+            "//*[text()='×' or text()='X' or text()='x']")
+        for button in x_buttons:
+            if button.is_displayed():
+                print("  Clicking X button...")
+                driver.execute_script("arguments[0].click();", button)
+                wait_until(driver, lambda d: not button.is_displayed(), timeout=2)
+                return True
+    except:
+        pass
+    
+    # Method 3: Try pressing ESC key
+    try:
+        print("  Pressing ESC key...")
+        webdriver.ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+        wait_for_network_idle(driver, timeout=2)
+        return True
+    except:
+        pass
+    
+    # Method 4: Try to add "?share=1" to the URL which sometimes bypasses login walls
+    try:
+        current_url = driver.current_url
+        if "?share=1" not in current_url:
+            new_url = current_url + ("&" if "?" in current_url else "?") + "share=1"
+            print(f"  Trying URL with share parameter: {new_url}")
+            driver.get(new_url)
+            wait_for_ready_state(driver)
+            return True
+    except:
+        pass
+    
+    print("  Could not bypass login wall")
+    return False
+
+def is_question_link(href):
+    """Whether a link points at a Quora question or answer page"""
+    return bool(href) and ('/q/' in href or '/question/' in href or '/answer/' in href)
+
+class QuestionLinkPlan:
+    """
+    Question links of a listing page, with the selector compiled once per parser backend.
+
+    Same extract() interface as html_parsing.ExtractionPlan, so parser_benchmark can time it.
+    """
+
+    def __init__(self):
+        self.compiled = {}
+
+    def extract(self, html, backend_name=None):
+        """{'question_links': absolute question URLs in page order, without duplicates}"""
+        backend_name = backend_name or default_backend()
+        if backend_name not in self.compiled:
+            backend = BACKENDS[backend_name]()
+            self.compiled[backend_name] = (backend, backend.compile('a[href]'))
+        backend, selector = self.compiled[backend_name]
+
+        links = []
+        for node in backend.all(backend.parse(html), selector):
+            href = backend.attr(node, 'href')
+            if is_question_link(href):
+                # Make sure it's an absolute URL
+                if href.startswith('/'):
+                    href = 'https://www.quora.com' + href
+                if href not in links:
+                    links.append(href)
+        return {'question_links': links}
+
+QUESTION_LINKS = QuestionLinkPlan()
+
+def canonical_question_url(url):
+    """Question URL without query string, fragment or trailing /answer/<user> part"""
+    parsed = urlparse(url)
+    path = re.sub(r'/answers?/.*$', '', parsed.path).rstrip('/')
+    return urlunparse((parsed.scheme or 'https', parsed.netloc or 'www.quora.com', path, '', '', ''))
+
+def open_listing(driver, url):
+    """Load a topic or search page: switch to English, get past login walls and cookie dialogs"""
+    print(f"Accessing listing page: {url}")
+    driver.get(url)
+    
+    # Wait for the page and its first round of requests to finish
+    wait_for_ready_state(driver)
+    wait_for_network_idle(driver, timeout=10)
+    
+    # Check if we're on an English page or redirected
+    if "ar.quora.com" in driver.current_url:
+        print("Redirected to Arabic version. Trying to switch to English...")
+        try:
+            # Click on language selector
+            lang_buttons = driver.find_elements(By.XPATH, 
+                "//*[contains(text(), 'Languages') or contains(text(), 'اللغات')]")
+            for button in lang_buttons:
+                if button.is_displayed():
+                    before = page_size(driver)
+                    button.click()
+                    CLICK_TIMEOUT.wait(wait_for_page_growth, driver, before)
+                    
+                    # Try to find English option
+                    eng_options = driver.find_elements(By.XPATH, 
+                        "//*[contains(text(), 'English') or contains(text(), 'الإنجليزية')]")
+                    for option in eng_options:
+                        if option.is_displayed():
+                            option.click()
+                            wait_for_ready_state(driver)
+                            wait_for_network_idle(driver)
+                            break
+        except Exception as e:
+            print(f"Error switching language: {str(e)}")
+    
+    # Try to handle login wall
+    handle_login_wall(driver, disable_screenshots=True)
+    
+    # Accept cookies if the dialog appears
+    try:
+        cookie_buttons = driver.find_elements(By.XPATH, 
+            "//button[contains(text(), 'Accept') or contains(text(), 'accept') or contains(text(), 'Agree') or contains(text(), 'agree')]")
+        for button in cookie_buttons:
+            if button.is_displayed():
+                print("Accepting cookies...")
+                button.click()
+                wait_until(driver, lambda d: not button.is_displayed(), timeout=2)
+                break
+    except Exception as e:
+        print(f"No cookie dialog found or error: {str(e)}")
+    
+    # Scroll down several times to load more content, stopping once nothing new arrives
+    for _ in range(10):
+        if not SCROLL_TIMEOUT.wait(scroll_and_wait, driver):
+            break
+
+def find_question_links(driver):
+    """Question links on the currently loaded listing page"""
+    # Look for links containing question indicators in the rendered page
+    question_links = QUESTION_LINKS.extract(driver.page_source)['question_links']
+    
+    # If we still don't have links, try to find them directly in the driver
+    if not question_links:
+        print("Trying alternate method to find question links...")
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_all_elements_located((By.TAG_NAME, "a"))
+            )
+            for link in driver.find_elements(By.TAG_NAME, "a"):
+                try:
+                    href = link.get_attribute('href')
+                    if is_question_link(href) and href not in question_links:
+                        question_links.append(href)
+                except:
+                    continue
+        except Exception as e:
+            print(f"Error finding links: {str(e)}")
+    
+    # If still no links, walk up from question titles in search results to their links
+    if not question_links:
+        print("Trying search results specific approach...")
+        try:
+            question_elements = driver.find_elements(By.CSS_SELECTOR, 
+                "div.q-box span.qu-dynamicFontSize--large, div.q-text")
+            for element in question_elements:
+                try:
+                    parent = element
+                    for _ in range(5):  # Look up to 5 levels up
+                        parent = driver.execute_script("return arguments[0].parentNode;", parent)
+                        parent_links = parent.find_elements(By.TAG_NAME, "a")
+                        if parent_links:
+                            href = parent_links[0].get_attribute('href')
+                            if is_question_link(href) and href not in question_links:
+                                question_links.append(href)
+                            break
+                except:
+                    pass
+        except Exception as e:
+            print(f"Error with search approach: {str(e)}")
+    
+    return question_links
+
+def scrape_question(driver, question_url):
+    """Scrape one question page into {'title', 'details', 'answers', 'url'}"""
+    driver.get(question_url)
+    
+    # Wait for the page to load
+    wait_for_ready_state(driver)
+    
+    # Handle login wall if needed
+    handle_login_wall(driver, disable_screenshots=True)
+    
+    # Get the question title and details separately
+    question_title, question_details = get_question_content(driver)
+    
+    # If that fails, try to extract from URL
+    if not question_title:
+        question_title = extract_clean_question(question_url)
+        question_details = ""
+    
+    if not question_title:
+        # Last resort
+        question_title = f"Question from {question_url}"
+        question_details = ""
+    
+    # Scroll down multiple times to load more answers, stopping once nothing new arrives
+    for _ in range(8):
+        if not SCROLL_TIMEOUT.wait(scroll_and_wait, driver):
+            break
+    
+    # Try to click buttons that might load more answers - do this multiple times
+    for _ in range(3):
+        click_more_answers_button(driver)
+        # Scroll again after clicking buttons; the clicks already waited, so this mostly confirms the end
+        SCROLL_TIMEOUT.confirm_end(scroll_and_wait, driver)
+    
+    return {
+        'title': question_title,
+        'details': question_details,
+        'answers': extract_all_answers(driver),
+        'url': question_url
+    }
+
+class QuoraStore:
+    """Questions from every search term, deduplicated by question URL and answer text"""
+    
+    def __init__(self):
+        self.questions = {}
+        self.answer_hashes = {}
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def answer_hash(answer):
+        """Whitespace- and case-insensitive fingerprint of an answer"""
+        normalized = re.sub(r'\s+', ' ', answer).strip().lower()
+        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
+    
+    def add(self, question, search_term):
+        """Add a scraped question, merging answers into any copy already stored; returns new answer count"""
+        key = canonical_question_url(question['url'])
+        with self.lock:
+            if key not in self.questions:
+                self.questions[key] = {
+                    'title': question['title'],
+                    'details': question['details'],
+                    'answers': [],
+                    'url': key,
+                    'search_terms': [],
+                }
+                self.answer_hashes[key] = set()
+            
+            stored = self.questions[key]
+            if search_term not in stored['search_terms']:
+                stored['search_terms'].append(search_term)
+            
+            added = 0
+            for answer in question['answers']:
+                fingerprint = self.answer_hash(answer)
+                if answer and fingerprint not in self.answer_hashes[key]:
+                    self.answer_hashes[key].add(fingerprint)
+                    stored['answers'].append(answer)
+                    added += 1
+            return added
+    
+    def records(self):
+        """Stored questions as a list of dicts"""
+        with self.lock:
+            return [dict(question) for question in self.questions.values()]
+    
+    def __len__(self):
+        return len(self.questions)
+
+class QuoraEngine:
+    """
+    Runs search terms (or topic URLs) through a pool of browser sessions.
+    
+    Listing pages and question pages are both tasks on one work queue, so any free
+    session picks up the next page. Each question URL is scraped once however many
+    terms surface it, and all results land in one QuoraStore. Sessions come from a
+    BrowserPool, so a login saved by an earlier run is reused and they start headless.
+    """
+    
+    def __init__(self, search_terms=None, listing_urls=None, fallback_terms=None, num_sessions=2,
+                 max_questions_per_term=100, headless=False, login_url=None, login_wait=180):
+        self.search_terms = search_terms or []
+        # Searched only if the main terms and listings yield no questions at all
+        self.fallback_terms = fallback_terms or []
+        self.listing_urls = listing_urls or []
+        self.num_sessions = num_sessions
+        self.max_questions_per_term = max_questions_per_term
+        self.headless = headless
+        # Page opened for a manual login when no saved Quora session is available
+        self.login_url = login_url
+        self.login_wait = login_wait
+        self.pool = BrowserPool(
+            'quora', QUORA_HOME_URL, size=num_sessions,
+            login_url=login_url, login_cookie=QUORA_LOGIN_COOKIE if login_url else None,
+            login_timeout=login_wait, options_factory=chrome_options,
+            headless=True if headless else None,
+        )
+        self.store = QuoraStore()
+        self.tasks = queue.Queue()
+        self.claimed_urls = set()
+        self.claimed_lock = threading.Lock()
+    
+    def claim(self, question_url):
+        """True the first time a question URL is seen, so it is scraped by one session only"""
+        key = canonical_question_url(question_url)
+        with self.claimed_lock:
+            if key in self.claimed_urls:
+                return False
+            self.claimed_urls.add(key)
+            return True
+    
+    def release(self, question_url):
+        """Forget a claim whose question could not be scraped, so a later listing can queue it again"""
+        with self.claimed_lock:
+            self.claimed_urls.discard(canonical_question_url(question_url))
+    
+    def run_listing(self, driver, label, url):
+        """Queue the new question links found on a listing page"""
+        open_listing(driver, url)
+        question_links = find_question_links(driver)
+        
+        queued = 0
+        for question_url in question_links:
+            if queued >= self.max_questions_per_term:
+                break
+            if self.claim(question_url):
+                self.tasks.put(('question', label, question_url, 0))
+                queued += 1
+        
+        print(f"'{label}': {len(question_links)} question links, {queued} new")
+    
+    def run_question(self, driver, label, question_url):
+        """Scrape a question page into the store"""
+        question = scrape_question(driver, question_url)
+        added = self.store.add(question, label)
+        print(f"  - '{question['title'][:50]}...' with {len(question['answers'])} answers ({added} new)")
+        
+        # Let the page's last requests finish before the session navigates on
+        SETTLE_TIMEOUT.wait(wait_for_network_idle, driver)
+    
+    def worker(self, session_number):
+        """One pooled browser session taking tasks until the queue is drained"""
+        with self.pool.session() as driver:
+            while True:
+                task = self.tasks.get()
+                try:
+                    if task is None:
+                        return
+                    
+                    kind, label, url, attempt = task
+                    if kind == 'listing':
+                        self.run_listing(driver, label, url)
+                    else:
+                        self.run_question(driver, label, url)
+                except Exception as e:
+                    print(f"[session {session_number}] Error on {task}: {str(e)}")
+                    if task[0] == 'question':
+                        if attempt < QUESTION_RETRIES:
+                            # Queued before task_done(), so run() keeps waiting for the retry
+                            self.tasks.put(('question', label, url, attempt + 1))
+                        else:
+                            self.release(url)
+                finally:
+                    self.tasks.task_done()
+    
+    def queue_search(self, term):
+        """Queue the search results page of a term"""
+        self.tasks.put(('listing', term, QUORA_SEARCH_URL.format(query=quote(term)), 0))
+    
+    def run(self):
+        """Scrape every search term and listing URL, returning the deduplicated store"""
+        for term in self.search_terms:
+            self.queue_search(term)
+        for url in self.listing_urls:
+            self.tasks.put(('listing', url, url, 0))
+        
+        sessions = self.pool.start()
+        if not sessions:
+            print("No browser session could be started")
+            return self.store
+        
+        try:
+            workers = [threading.Thread(target=self.worker, args=(number + 1,), daemon=True)
+                       for number in range(sessions)]
+            for worker in workers:
+                worker.start()
+            
+            # Question tasks are queued by listing tasks, so wait until nothing is left at all
+            self.tasks.join()
+            
+            if not len(self.store) and self.fallback_terms:
+                print("No questions found, trying fallback searches...")
+                for term in self.fallback_terms:
+                    self.queue_search(term)
+                self.tasks.join()
+            
+            for _ in workers:
+                self.tasks.put(None)
+            for worker in workers:
+                worker.join()
+        finally:
+            self.pool.close()
+        
+        print(f"Scraped {len(self.store)} unique questions")
+        return self.store
+
+def save_to_csv(data, filename="uae_education_qa.csv"):
+    """
+    Save scraped questions and answers to CSV file
+    
+    Args:
+        data: List of dictionaries containing questions and answers
+        filename: Output CSV filename
+    """
+    with open(filename, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['Title', 'Question Details', 'Answer', 'URL'])
+        
+        for item in data:
+            title = item['title']
+            details = item['details']
+            answers = item['answers']
+            url = item['url']
+            
+            if answers:
+                # Write each answer as a separate row with the same question
+                for answer in answers:
+                    writer.writerow([title, details, answer, url])
+            else:
+                # Write question with empty answer if no answers found
+                writer.writerow([title, details, '', url])
+    
+    print(f"Data saved to {filename}")
+
+def save_to_json(data, filename="uae_education_qa.json"):
+    """
+    Save scraped questions and answers to JSON file
+    
+    Args:
+        data: List of dictionaries containing questions and answers
+        filename: Output JSON filename
+    """
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2, ensure_ascii=False)
+    
+    print(f"Data saved to {filename}")
+
+def run_and_save(engine, output_name):
+    """Run an engine and write its store to <output_name>.csv and .json"""
+    store = engine.run()
+    records = store.records()
+    
+    if records:
+        save_to_csv(records, filename=f"{output_name}.csv")
+        save_to_json(records, filename=f"{output_name}.json")
+    else:
+        print("No data was scraped. Check if the website structure has changed or if Selenium is properly installed.")
+    return records
+
+def load_terms(module_names=TERM_MODULES):
+    """
+    (search terms, fallback terms, listing URLs) of the term modules, each list deduplicated in order.
+    A module may define SEARCH_TERMS, FALLBACK_QUERIES and LISTING_URLS.
+    """
+    search_terms, fallback_terms, listing_urls = [], [], []
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for target, name in ((search_terms, 'SEARCH_TERMS'), (fallback_terms, 'FALLBACK_QUERIES'),
+                             (listing_urls, 'LISTING_URLS')):
+            target.extend(value for value in getattr(module, name, []) if value not in target)
+    fallback_terms = [term for term in fallback_terms if term not in search_terms]
+    return search_terms, fallback_terms, listing_urls
+
+def main():
+    search_terms, fallback_terms, listing_urls = load_terms()
+    engine = QuoraEngine(
+        search_terms=search_terms,
+        fallback_terms=fallback_terms,
+        listing_urls=listing_urls,
+        num_sessions=3,
+        login_url="https://ar.quora.com/"
+    )
+    
+    print("Starting Quora scraper for all UAE education search terms...")
+    run_and_save(engine, "uae_education_quora")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second with bursts of up to `capacity`"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self):
+        """Take a token and return how long the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            # Token is borrowed from the future; wait until it has been refilled
+            return -self.tokens / self.rate
+
+    def pause(self, seconds):
+        """Hold back the next request for at least `seconds` (e.g. after a 429 with Retry-After)"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # The next _reserve() takes one more token and waits until the balance is back to zero
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+    def acquire(self):
+        """Block the calling thread until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        """Wait (without blocking the event loop) until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """One token bucket per host, so each site is throttled independently"""
+
+    def __init__(self, rate, capacity=1, host_rates=None):
+        self.rate = rate
+        self.capacity = capacity
+        self.host_rates = host_rates or {}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket_for(self, url):
+        """Token bucket for the host of `url`"""
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            if host not in self.buckets:
+                rate = self.host_rates.get(host, self.rate)
+                self.buckets[host] = TokenBucket(rate, self.capacity)
+            return self.buckets[host]
+
+    def pause(self, url, seconds):
+        """Hold back requests to the host of `url` for at least `seconds`"""
+        self.bucket_for(url).pause(seconds)
+
+    def acquire(self, url):
+        """Block until a request to the host of `url` is allowed"""
+        return self.bucket_for(url).acquire()
+
+    async def acquire_async(self, url):
+        """Async wait until a request to the host of `url` is allowed"""
+        return await self.bucket_for(url).acquire_async()
@@ -1,14 +1,13 @@
-import praw
-import pandas as pd
 from datetime import datetime
-import time
 
-# Reddit API Setup
-reddit = praw.Reddit(
-    client_id="bpYCk-R5HBSM6ZrfkkXvFw",
-    client_secret="1JSX89z80Qb3XMlQD-lAktAP_vKKIQ",
-    user_agent="windows:UAE_EDUCATION_SCRAPER:v2.0 (by /u/Funny_Adogio2480)"
-)
+from reddit_harvester import RedditHarvester
+
+# Reddit API Setup (REDDIT_API_URL points the harvester at a local fake API instead)
+REDDIT_CREDENTIALS = {
+    "client_id": "bpYCk-R5HBSM6ZrfkkXvFw",
+    "client_secret": "1JSX89z80Qb3XMlQD-lAktAP_vKKIQ",
+    "user_agent": "windows:UAE_EDUCATION_SCRAPER:v2.0 (by /u/Funny_Adogio2480)"
+}
 
 # ===== EXPANDED KEYWORD LIST (CATEGORIZED) =====
 EDU_KEYWORDS = [
@@ -59,53 +58,11 @@ SUBREDDITS = [
     'parenting', 'Teachers', 'HigherEducation'
 ]
 
-def scrape_reddit_education(keywords, subreddits, limit_per_keyword=15):
-    posts_data = []
-    total_requests = 0
-    
-    for keyword in keywords:
-        for subreddit in subreddits:
-            try:
-                print(f"Scraping: '{keyword}' in r/{subreddit}...")
-                
-                # Search posts with error handling
-                for submission in reddit.subreddit(subreddit).search(
-                    query=keyword, 
-                    limit=limit_per_keyword, 
-                    time_filter="year"  # Focus on recent posts
-                ):
-                    # Avoid rate limits (pause every 10 requests)
-                    total_requests += 1
-                    if total_requests % 10 == 0:
-                        time.sleep(2)  # Respect API limits
-                    
-                    # Get top 3 comments (skip if comments are disabled)
-                    comments = []
-                    if not submission.comments_disabled:
-                        submission.comments.replace_more(limit=0)
-                        comments = [
-                            {"author": str(c.author), "text": c.body, "upvotes": c.score}
-                            for c in submission.comments[:3]
-                        ]
-                    
-                    # Store post data
-                    posts_data.append({
-                        "keyword": keyword,
-                        "subreddit": subreddit,
-                        "title": submission.title,
-                        "author": str(submission.author),
-                        "upvotes": submission.score,
-                        "url": submission.url,
-                        "created_utc": datetime.fromtimestamp(submission.created_utc),
-                        "text": submission.selftext,
-                        "comments": comments
-                    })
-                
-            except Exception as e:
-                print(f"ERROR in r/{subreddit} for '{keyword}': {str(e)}")
-                time.sleep(5)  # Pause on errors
-    
-    return pd.DataFrame(posts_data)
+def scrape_reddit_education(keywords, subreddits, limit_per_keyword=15, num_workers=4):
+    """Search all keyword/subreddit pairs concurrently and return one row per unique post"""
+    harvester = RedditHarvester(num_workers=num_workers, limit_per_keyword=limit_per_keyword,
+                                **REDDIT_CREDENTIALS)
+    return harvester.harvest(keywords, subreddits)
 
 # Run scraper
 print("Starting Reddit scrape...")
@@ -118,5 +75,6 @@ df.to_csv(filename, index=False)
 print(f"Saved {len(df)} posts to '{filename}'")
 
 # Preview
-print("\nSample Data:")
-print(df[['keyword', 'subreddit', 'title', 'upvotes']].head(10))
+if len(df):
+    print("\nSample Data:")
+    print(df[['keyword', 'subreddit', 'title', 'upvotes']].head(10))
@@ -0,0 +1,202 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+import praw
+import prawcore
+
+from rate_limiter import TokenBucket
+
+# Reddit allows 100 queries per minute per OAuth client; used until the first response reports limits
+DEFAULT_REQUESTS_PER_SECOND = 100 / 60
+
+# Requests kept in hand so other clients of the same app never hit a hard 429
+RESERVE_REQUESTS = 5
+
+# Rate-limit headers of the last API response on each thread (every thread has its own PRAW instance)
+_last_response = threading.local()
+
+
+class RateLimitRecorder(prawcore.Requestor):
+    """PRAW requestor that keeps the X-Ratelimit-* headers of each response for RateBudget"""
+
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        if 'x-ratelimit-remaining' in response.headers:
+            _last_response.limits = (float(response.headers['x-ratelimit-remaining']),
+                                     float(response.headers.get('x-ratelimit-reset', 0)))
+        return response
+
+
+class RateBudget:
+    """
+    Request budget shared by every worker thread, paced from Reddit's rate-limit headers.
+
+    After each request the remaining allowance (X-Ratelimit-Remaining, recorded by
+    RateLimitRecorder) is spread evenly over the seconds left until the window
+    resets (X-Ratelimit-Reset), so the run neither stalls early nor bursts into a
+    429 at the end of the window.
+    """
+
+    def __init__(self, requests_per_second=DEFAULT_REQUESTS_PER_SECOND, reserve=RESERVE_REQUESTS):
+        self.bucket = TokenBucket(requests_per_second, capacity=1)
+        self.reserve = reserve
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.waited = 0.0
+
+    def acquire(self):
+        """Block until the next API request may be sent"""
+        wait = self.bucket.acquire()
+        with self.lock:
+            self.requests += 1
+            self.waited += wait
+
+    def update(self, remaining, seconds_to_reset):
+        """Re-pace from a response's X-Ratelimit-Remaining and X-Ratelimit-Reset"""
+        seconds_left = max(seconds_to_reset, 1.0)
+        usable = max(remaining - self.reserve, 0)
+        # With nothing usable left, one request is allowed just after the window resets
+        rate = usable / seconds_left if usable else 1 / seconds_left
+        with self.bucket.lock:
+            self.bucket.rate = rate
+
+    def report(self):
+        """One-line summary of the budget use"""
+        return (f"Reddit API: {self.requests} requests, {self.waited:.1f}s spent waiting for the budget, "
+                f"pace now {self.bucket.rate * 60:.0f} requests/min")
+
+
+class RedditHarvester:
+    """
+    Searches keyword x subreddit pairs concurrently, then fetches comments once per unique post.
+
+    PRAW instances are not thread-safe, so every worker thread gets its own
+    (same credentials). Search results only carry post metadata; comments are
+    loaded lazily in a second phase, once per submission however many keywords
+    found it, and only for posts that have comments.
+
+    `api_url` points PRAW at another server (e.g. fixtures/fake_reddit_api.py)
+    for both the token endpoint and the API.
+    """
+
+    def __init__(self, client_id, client_secret, user_agent, api_url=None, num_workers=4,
+                 limit_per_keyword=15, comments_per_post=3, time_filter="year", budget=None):
+        self.credentials = {'client_id': client_id, 'client_secret': client_secret, 'user_agent': user_agent}
+        self.api_url = api_url or os.getenv('REDDIT_API_URL')
+        self.num_workers = num_workers
+        self.limit_per_keyword = limit_per_keyword
+        self.comments_per_post = comments_per_post
+        self.time_filter = time_filter
+        self.budget = budget or RateBudget()
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        # submission id -> post record, in first-seen order
+        self.posts = {}
+
+    def reddit(self):
+        """The calling thread's PRAW instance"""
+        if not hasattr(self.local, 'reddit'):
+            options = dict(self.credentials)
+            if self.api_url:
+                options.update(oauth_url=self.api_url, reddit_url=self.api_url)
+            # PRAW's own auth.limits no longer carries the reset time, so the headers are read directly
+            self.local.reddit = praw.Reddit(requestor_class=RateLimitRecorder, **options)
+        return self.local.reddit
+
+    def _request(self, call):
+        """Run one API call within the budget and re-pace from the limits it reports"""
+        self.budget.acquire()
+        _last_response.limits = None
+        try:
+            return call()
+        finally:
+            if _last_response.limits:
+                self.budget.update(*_last_response.limits)
+
+    def search(self, keyword, subreddit):
+        """Search one subreddit for one keyword; returns the number of posts not seen before"""
+        reddit = self.reddit()
+        results = self._request(lambda: list(reddit.subreddit(subreddit).search(
+            query=keyword,
+            limit=self.limit_per_keyword,
+            time_filter=self.time_filter  # Focus on recent posts
+        )))
+
+        new_posts = 0
+        with self.lock:
+            for submission in results:
+                if submission.id in self.posts:
+                    if keyword not in self.posts[submission.id]['keywords']:
+                        self.posts[submission.id]['keywords'].append(keyword)
+                    continue
+                self.posts[submission.id] = {
+                    "keyword": keyword,
+                    "keywords": [keyword],
+                    "subreddit": subreddit,
+                    "title": submission.title,
+                    "author": str(submission.author),
+                    "upvotes": submission.score,
+                    "url": submission.url,
+                    "created_utc": datetime.fromtimestamp(submission.created_utc),
+                    "text": submission.selftext,
+                    "comments": [],
+                    # Needed to decide whether fetching comments is worth a request
+                    "_num_comments": submission.num_comments,
+                    # vars(), not getattr(): a missing attribute makes PRAW fetch the whole post
+                    "_comments_disabled": vars(submission).get('comments_disabled', False),
+                }
+                new_posts += 1
+        return new_posts
+
+    def load_comments(self, submission_id):
+        """Top comments of one post (one request; 'load more' stubs are dropped, not fetched)"""
+        submission = self.reddit().submission(id=submission_id)
+        submission.comment_limit = self.comments_per_post
+
+        def fetch():
+            submission.comments.replace_more(limit=0)
+            return [
+                {"author": str(c.author), "text": c.body, "upvotes": c.score}
+                for c in submission.comments[:self.comments_per_post]
+            ]
+
+        return self._request(fetch)
+
+    def _run_all(self, function, jobs, describe):
+        """Run function(*job) for every job on the worker threads, logging failures"""
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = {executor.submit(function, *job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    results[job] = future.result()
+                except Exception as e:
+                    print(f"ERROR {describe(job)}: {str(e)}")
+        return results
+
+    def harvest(self, keywords, subreddits):
+        """Search every keyword in every subreddit, then load comments; returns a DataFrame"""
+        jobs = [(keyword, subreddit) for keyword in keywords for subreddit in subreddits]
+        print(f"Searching {len(jobs)} keyword/subreddit pairs on {self.num_workers} workers...")
+        found = self._run_all(self.search, jobs, lambda job: f"in r/{job[1]} for '{job[0]}'")
+        print(f"Found {len(self.posts)} unique posts ({sum(found.values())} new across all searches)")
+
+        with self.lock:
+            to_load = [(post_id,) for post_id, post in self.posts.items()
+                       if post['_num_comments'] and not post['_comments_disabled']]
+        print(f"Loading comments for {len(to_load)} posts...")
+        comments = self._run_all(self.load_comments, to_load, lambda job: f"loading comments of {job[0]}")
+        for (post_id,), post_comments in comments.items():
+            self.posts[post_id]['comments'] = post_comments
+
+        print(self.budget.report())
+        records = []
+        for post in self.posts.values():
+            record = {key: value for key, value in post.items() if not key.startswith('_')}
+            record['keywords'] = ", ".join(post['keywords'])
+            records.append(record)
+        return pd.DataFrame(records)
@@ -1,12 +1,23 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import time
+import asyncio
 import random
 from datetime import datetime
 import re
-import json
 from urllib.parse import urlparse, urlunparse
+from async_fetcher import AsyncFetcher
+from http_cache import HttpCache
+from html_parsing import ExtractionPlan, attr, joined, json_ld, text
+
+# Page requested once per run to pick up Reuters cookies before fetching articles
+REUTERS_HOME_URL = "https://www.reuters.com/"
+
+# Polite crawl limits: one request every 4 seconds per host, a few requests in flight
+REQUESTS_PER_SECOND = 0.25
+MAX_CONCURRENCY = 4
+
+# Published articles rarely change, so repeat runs revalidate them instead of re-downloading
+CACHE_PATH = ".http_cache/reuters.sqlite"
 
 # Updated headers with modern browser information
 HEADERS = {
@@ -48,210 +59,86 @@ def get_headers():
     headers['User-Agent'] = random.choice(USER_AGENTS)
     return headers
 
-def extract_json_ld(soup):
-    """Extract structured data from JSON-LD script tags"""
-    try:
-        script = soup.find('script', type='application/ld+json')
-        if script:
-            data = json.loads(script.string)
-            return data
-    except:
-        pass
-    return None
-
-def extract_title(soup, json_data=None):
-    """Extract article title with multiple fallback methods"""
-    # Try from JSON-LD first
-    if json_data and 'headline' in json_data:
-        return json_data['headline']
-    
-    # Method 1: Data attribute selector
-    title = soup.find('h1', attrs={'data-testid': re.compile('Heading|title', re.I)})
-    if title:
-        return title.get_text(strip=True)
-    
-    # Method 2: Class-based selector
-    title_selectors = [
-        'h1.article-header__title__3A1_h',
-        'h1.text__text__1FZLe',  # PLUS articles
-        'h1.heading__base__2T28j',
-        'h1.article-heading',  # New format
-        'h1.headline__heading',  # Alternate format
-        'h1.company-profile__company-name__1H1u4'  # Company profiles
-    ]
-    
-    for selector in title_selectors:
-        title = soup.select_one(selector)
-        if title:
-            return title.get_text(strip=True)
-    
-    # Method 3: Generic h1 as last resort
-    title = soup.find('h1')
-    return title.get_text(strip=True) if title else "Title not found"
-
-def extract_date(soup, json_data=None):
-    """Extract article date with multiple fallback methods"""
-    # Try from JSON-LD first
-    if json_data and 'datePublished' in json_data:
-        return json_data['datePublished']
-    
-    # Method 1: Time element with datetime attribute
-    time_tag = soup.find('time', attrs={'datetime': True})
-    if time_tag:
-        return time_tag['datetime']
-    
-    # Method 2: DateLine element
-    date_selectors = [
-        'div[data-testid="DateLine"]',
-        'div.date-line__date__23Ge-',
-        'div.article-header__date__1r1v9',
-        'div.date__date__1th6T',  # PLUS articles
-        'div.ArticleHeader_date',
-        'div.article-date',  # New format
-        'div.date-line__date',  # Alternate format
-        'span.article-date'  # Some articles
-    ]
-    
-    for selector in date_selectors:
-        date_div = soup.select_one(selector)
-        if date_div:
-            return date_div.get_text(strip=True)
-    
-    # Method 3: Meta tags
-    meta_tags = [
-        {'property': 'article:published_time'},
-        {'name': 'pub_date'},
-        {'name': 'date'},
-        {'itemprop': 'datePublished'}
-    ]
-    
-    for meta in meta_tags:
-        meta_date = soup.find('meta', meta)
-        if meta_date and meta_date.get('content'):
-            return meta_date['content']
-    
-    return "Date not found"
-
-def extract_author(soup, json_data=None):
-    """Extract author information with multiple fallback methods"""
-    # Try from JSON-LD first
-    if json_data and 'author' in json_data:
-        if isinstance(json_data['author'], list) and len(json_data['author']) > 0:
-            return json_data['author'][0].get('name', '')
-        elif isinstance(json_data['author'], dict):
-            return json_data['author'].get('name', '')
-    
-    # Method 1: Author byline
-    author_selectors = [
-        'div[data-testid="AuthorByline"]',
-        'div.article-header__author-name__3F3Qp',
-        'a.author-name',
-        'span.author',
-        'div.byline__byline__1rqDg',
-        'div.author',  # New format
-        'span.author-name',  # Alternate format
-        'div.byline__author'  # Some articles
-    ]
-    
-    for selector in author_selectors:
-        author_div = soup.select_one(selector)
-        if author_div:
-            return author_div.get_text(strip=True)
-    
-    # Method 2: Meta author tag
-    meta_tags = [
-        {'name': 'author'},
-        {'property': 'article:author'},
-        {'name': 'byl'},
-        {'itemprop': 'author'}
-    ]
-    
-    for meta in meta_tags:
-        meta_author = soup.find('meta', meta)
-        if meta_author and meta_author.get('content'):
-            return meta_author['content']
-    
-    return "Author not found"
-
-def extract_summary(soup, json_data=None):
-    """Extract article summary/description"""
-    # Try from JSON-LD first
-    if json_data and 'description' in json_data:
-        return json_data['description']
-    
-    # Method 1: Standfirst/description element
-    summary_selectors = [
-        'p[data-testid="paragraph-1"]',  # First paragraph often serves as summary
-        'div.article-header__description__2XART',
-        'div.standfirst',
-        'div.article-body__intro__2zlsF',
-        'div.summary',
-        'div.article-summary',  # New format
-        'p.article-dek'  # Alternate format
-    ]
-    
-    for selector in summary_selectors:
-        summary_div = soup.select_one(selector)
-        if summary_div:
-            return summary_div.get_text(strip=True)
-    
-    # Method 2: Meta description
-    meta_tags = [
-        {'name': 'description'},
-        {'property': 'og:description'},
-        {'name': 'twitter:description'}
-    ]
-    
-    for meta in meta_tags:
-        meta_desc = soup.find('meta', meta)
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc['content']
-    
-    # Method 3: First meaningful paragraph
-    first_paragraph = soup.select_one('div[data-testid="article-body"] p')
-    if first_paragraph:
-        return first_paragraph.get_text(strip=True)[:300] + "..."
-    
-    return "Summary not found"
+# Reuters field extraction: fallback chains in priority order (JSON-LD, selectors, meta tags),
+# compiled once per parser backend
+REUTERS_PLAN = ExtractionPlan({
+    'title': [
+        json_ld('headline'),
+        text('h1[data-testid*="Heading"], h1[data-testid*="heading"], h1[data-testid*="title"], h1[data-testid*="Title"]'),
+        text('h1.article-header__title__3A1_h'),
+        text('h1.text__text__1FZLe'),  # PLUS articles
+        text('h1.heading__base__2T28j'),
+        text('h1.article-heading'),  # New format
+        text('h1.headline__heading'),  # Alternate format
+        text('h1.company-profile__company-name__1H1u4'),  # Company profiles
+        text('h1'),  # Generic h1 as last resort
+    ],
+    'date': [
+        json_ld('datePublished'),
+        attr('time[datetime]', 'datetime'),
+        text('div[data-testid="DateLine"]'),
+        text('div.date-line__date__23Ge-'),
+        text('div.article-header__date__1r1v9'),
+        text('div.date__date__1th6T'),  # PLUS articles
+        text('div.ArticleHeader_date'),
+        text('div.article-date'),  # New format
+        text('div.date-line__date'),  # Alternate format
+        text('span.article-date'),  # Some articles
+        attr('meta[property="article:published_time"]', 'content'),
+        attr('meta[name="pub_date"]', 'content'),
+        attr('meta[name="date"]', 'content'),
+        attr('meta[itemprop="datePublished"]', 'content'),
+    ],
+    'author': [
+        json_ld('author', 'name'),
+        text('div[data-testid="AuthorByline"]'),
+        text('div.article-header__author-name__3F3Qp'),
+        text('a.author-name'),
+        text('span.author'),
+        text('div.byline__byline__1rqDg'),
+        text('div.author'),  # New format
+        text('span.author-name'),  # Alternate format
+        text('div.byline__author'),  # Some articles
+        attr('meta[name="author"]', 'content'),
+        attr('meta[property="article:author"]', 'content'),
+        attr('meta[name="byl"]', 'content'),
+        attr('meta[itemprop="author"]', 'content'),
+    ],
+    'summary': [
+        json_ld('description'),
+        text('p[data-testid="paragraph-1"]'),  # First paragraph often serves as summary
+        text('div.article-header__description__2XART'),
+        text('div.standfirst'),
+        text('div.article-body__intro__2zlsF'),
+        text('div.summary'),
+        text('div.article-summary'),  # New format
+        text('p.article-dek'),  # Alternate format
+        attr('meta[name="description"]', 'content'),
+        attr('meta[property="og:description"]', 'content'),
+        attr('meta[name="twitter:description"]', 'content'),
+        text('div[data-testid="article-body"] p', max_length=300),  # First meaningful paragraph
+    ],
+    'content': [
+        joined('div[data-testid="article-body"]', 'p, h2, h3, h4'),  # Primary selector
+        joined('div.article-body', 'p, h2, h3, h4'),  # New format
+        joined('div.article-content', 'p, h2, h3, h4'),  # Alternate format
+        joined('div.body', 'p, h2, h3, h4'),  # Generic
+        joined('div.article-body__content__17Yit', 'p, h2, h3, h4'),  # PLUS articles
+        joined('div.company-profile__body__1ZzC6', 'p, h2, h3, h4'),  # Company profiles
+        joined('main', 'p, h2, h3, h4'),  # Generic fallback: main content area
+        joined('article', 'p, h2, h3, h4'),
+    ],
+})
 
-def extract_content(soup):
-    """Extract article content with multiple fallback methods"""
-    # Standard news articles
-    body_selectors = [
-        'div[data-testid="article-body"]',  # Primary selector
-        'div.article-body',  # New format
-        'div.article-content',  # Alternate format
-        'div.body',  # Generic
-        'div.article-body__content__17Yit',  # PLUS articles
-        'div.company-profile__body__1ZzC6'  # Company profiles
-    ]
-    
-    for selector in body_selectors:
-        body = soup.select_one(selector)
-        if body:
-            # Extract paragraphs
-            paragraphs = body.find_all(['p', 'h2', 'h3', 'h4'])
-            content = []
-            for p in paragraphs:
-                # Skip empty paragraphs
-                if p.get_text(strip=True):
-                    content.append(p.get_text(strip=True))
-            return '\n\n'.join(content)
-    
-    # Generic fallback: Try to get all paragraphs in main content area
-    main_content = soup.find('main') or soup.find('article')
-    if main_content:
-        paragraphs = main_content.find_all(['p', 'h2', 'h3', 'h4'])
-        if paragraphs:
-            content = []
-            for p in paragraphs:
-                if p.get_text(strip=True):
-                    content.append(p.get_text(strip=True))
-            return '\n\n'.join(content)
-    
-    return "Content not found"
+NOT_FOUND = {
+    'title': "Title not found",
+    'date': "Date not found",
+    'author': "Author not found",
+    'summary': "Summary not found",
+    'content': "Content not found",
+}
 
-def scrape_reuters_article(url):
+def scrape_reuters_article(url, cache=None):
     """Scrape individual Reuters article with enhanced error handling"""
     clean_url = normalize_url(url)
     print(f"Scraping: {clean_url}")
@@ -261,41 +148,51 @@ def scrape_reuters_article(url):
         session = requests.Session()
         session.headers.update(get_headers())
         
-        # First request to get cookies
-        session.get("https://www.reuters.com/", timeout=5)
-        
-        # Request article with cookies
-        response = session.get(clean_url, timeout=15)
+        if cache:
+            # Cookies are only needed if the article actually has to be requested
+            status, body, _ = cache.fetch(session, clean_url, timeout=15,
+                                          before_request=lambda: session.get(REUTERS_HOME_URL, timeout=5))
+        else:
+            # First request to get cookies
+            session.get(REUTERS_HOME_URL, timeout=5)
+            
+            # Request article with cookies
+            response = session.get(clean_url, timeout=15)
+            status, body = response.status_code, response.content
         
-        if response.status_code != 200:
-            print(f"Failed to retrieve {clean_url} - Status code: {response.status_code}")
+        if status != 200:
+            print(f"Failed to retrieve {clean_url} - Status code: {status}")
             return None
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        json_data = extract_json_ld(soup)
         
-        # Extract each field with error handling
-        title = extract_title(soup, json_data)
-        date = extract_date(soup, json_data)
-        author = extract_author(soup, json_data)
-        summary = extract_summary(soup, json_data)
-        content = extract_content(soup)
+        return parse_reuters_article(body, clean_url)
+        
+    except Exception as e:
+        print(f"Error scraping {clean_url}: {str(e)}")
+        return None
+
+def parse_reuters_article(html, clean_url, backend=None):
+    """Extract article fields from a downloaded Reuters page"""
+    try:
+        fields = REUTERS_PLAN.extract(html, backend)
+        for field, fallback in NOT_FOUND.items():
+            if not fields[field]:
+                fields[field] = fallback
         
         # Clean date format
-        date_match = re.search(r'\d{4}-\d{2}-\d{2}', date)
-        clean_date = date_match.group(0) if date_match else date
+        date_match = re.search(r'\d{4}-\d{2}-\d{2}', fields['date'])
+        clean_date = date_match.group(0) if date_match else fields['date']
         
         return {
-            'title': title,
+            'title': fields['title'],
             'url': clean_url,
             'date': clean_date,
-            'summary': summary,
-            'content': content[:100000],  # Limit content length
-            'author': author
+            'summary': fields['summary'],
+            'content': fields['content'][:100000],  # Limit content length
+            'author': fields['author']
         }
         
     except Exception as e:
-        print(f"Error scraping {clean_url}: {str(e)}")
+        print(f"Error parsing {clean_url}: {str(e)}")
         return None
 
 # List of specific UAE education articles to scrape
@@ -313,44 +210,64 @@ ARTICLE_URLS = [
     "https://www.reuters.com/business/abu-dhabis-mubadala-buy-600-million-stake-uk-school-operator-nord-anglia-2025-04-17/"
 ]
 
-def scrape_all_articles():
-    """Scrape all articles from the predefined list"""
-    scraped_articles = []
+async def fetch_articles(urls, prime_url=REUTERS_HOME_URL, requests_per_second=REQUESTS_PER_SECOND,
+                         max_concurrency=MAX_CONCURRENCY, cache=None):
+    """Fetch and parse articles concurrently, returning (articles, failed_urls)"""
+    articles = []
     failed_urls = []
+    prime_urls = {urlparse(prime_url).netloc.lower(): prime_url} if prime_url else {}
+    
+    async with AsyncFetcher(headers=get_headers(), requests_per_second=requests_per_second,
+                            max_concurrency=max_concurrency, prime_urls=prime_urls, cache=cache) as fetcher:
+        async for url, status, body in fetcher.fetch_all(urls):
+            if status != 200:
+                print(f"Failed to retrieve {url} - Status code: {status}")
+                failed_urls.append(url)
+                continue
+            
+            article = parse_reuters_article(body, url)
+            if article:
+                articles.append(article)
+                print(f"Scraped: {article['title'][:60]}...")
+            else:
+                failed_urls.append(url)
+                print(f"Failed to scrape: {url}")
+    
+    return articles, failed_urls
+
+def scrape_all_articles(urls=None, prime_url=REUTERS_HOME_URL, requests_per_second=REQUESTS_PER_SECOND,
+                        max_concurrency=MAX_CONCURRENCY, cache_path=CACHE_PATH):
+    """Scrape all articles from the predefined list (or `urls`, e.g. a local test server)"""
+    urls = [normalize_url(url) for url in (urls or ARTICLE_URLS)]
+    cache = HttpCache(path=cache_path) if cache_path else None
+    options = {
+        'prime_url': prime_url,
+        'requests_per_second': requests_per_second,
+        'max_concurrency': max_concurrency,
+        'cache': cache,
+    }
     
     print(f"\n{'='*50}")
-    print(f"Scraping {len(ARTICLE_URLS)} UAE education articles")
+    print(f"Scraping {len(urls)} UAE education articles")
     print(f"{'='*50}")
     
-    for idx, url in enumerate(ARTICLE_URLS):
-        print(f"\nProcessing article {idx+1}/{len(ARTICLE_URLS)}")
-        article = scrape_reuters_article(url)
-        if article:
-            scraped_articles.append(article)
-            print(f"Scraped: {article['title'][:60]}...")
-        else:
-            failed_urls.append(url)
-            print(f"Failed to scrape: {url}")
-        
-        # Random delay to avoid detection
-        if idx < len(ARTICLE_URLS) - 1:
-            delay = random.uniform(3, 8)
-            print(f"Waiting {delay:.1f} seconds before next request...")
-            time.sleep(delay)
+    scraped_articles, failed_urls = asyncio.run(fetch_articles(urls, **options))
     
     # Retry failed URLs once
     if failed_urls:
-        print("\nRetrying failed URLs...")
+        print(f"\nRetrying {len(failed_urls)} failed URLs...")
+        retried, failed_urls = asyncio.run(fetch_articles(failed_urls, **options))
+        scraped_articles.extend(retried)
         for url in failed_urls:
-            print(f"\nRetrying: {url}")
-            article = scrape_reuters_article(url)
-            if article:
-                scraped_articles.append(article)
-                print(f"Successfully scraped on retry: {article['title'][:60]}...")
-                failed_urls.remove(url)
-            else:
-                print(f"Still failed: {url}")
-            time.sleep(5)
+            print(f"Still failed: {url}")
+    
+    # Articles complete in any order; keep the output in list order
+    url_order = {url: idx for idx, url in enumerate(urls)}
+    scraped_articles.sort(key=lambda article: url_order.get(article['url'], len(urls)))
+    
+    if cache:
+        print(cache.report())
+        cache.close()
     
     return scraped_articles
 
@@ -0,0 +1,137 @@
+import json
+import os
+import threading
+
+
+class ScrapeJournal:
+    """
+    Append-only JSONL journal of scraped records, grouped by key (e.g. a search keyword).
+
+    Every record is written and flushed as soon as it is scraped, so a crash or
+    Ctrl+C loses at most the line being written. Each attempt at a key starts
+    with a 'start' line and a finished key gets a 'done' line, so a rerun can
+    skip finished keys and redo the rest; records of an abandoned attempt are
+    dropped when the journal is read back or compacted.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.file = self._open()
+
+    def _open(self):
+        """Open the journal for appending, first cutting off a line torn by a crash"""
+        if os.path.exists(self.path):
+            with open(self.path, 'r+b') as f:
+                size = f.seek(0, os.SEEK_END)
+                end = size
+                # Walk back to the last complete line
+                while end > 0:
+                    chunk_start = max(end - 4096, 0)
+                    f.seek(chunk_start)
+                    newline = f.read(end - chunk_start).rfind(b'\n')
+                    if newline >= 0:
+                        end = chunk_start + newline + 1
+                        break
+                    end = chunk_start
+                if end < size:
+                    f.truncate(end)
+        return open(self.path, 'a', encoding='utf-8')
+
+    def _write(self, entry, sync=False):
+        """Append one line and hand it to the OS (fsync'd at the end of a key)"""
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+            if sync:
+                os.fsync(self.file.fileno())
+
+    def start(self, key):
+        """Begin a (new) attempt at `key`; records from earlier attempts are superseded"""
+        self._write({'event': 'start', 'key': key})
+
+    def append(self, key, record):
+        """Journal one scraped record"""
+        self._write({'event': 'item', 'key': key, 'data': record})
+
+    def finish(self, key, count):
+        """Mark `key` as complete"""
+        self._write({'event': 'done', 'key': key, 'count': count}, sync=True)
+
+    def _entries(self):
+        """(line number, entry) for every readable line; a torn last line is skipped"""
+        with self.lock:
+            self.file.flush()
+        with open(self.path, encoding='utf-8') as f:
+            for number, line in enumerate(f):
+                try:
+                    yield number, json.loads(line)
+                except ValueError:
+                    continue
+
+    def completed(self):
+        """Keys whose latest attempt finished"""
+        done = set()
+        for _, entry in self._entries():
+            if entry['event'] == 'start':
+                done.discard(entry['key'])
+            elif entry['event'] == 'done':
+                done.add(entry['key'])
+        return done
+
+    def records(self):
+        """
+        Stream the records of each key's latest attempt, in journal order.
+
+        Two passes over the file instead of buffering records, so memory stays flat.
+        """
+        latest_start = {}
+        for number, entry in self._entries():
+            if entry['event'] == 'start':
+                latest_start[entry['key']] = number
+
+        for number, entry in self._entries():
+            if entry['event'] == 'item' and number > latest_start.get(entry['key'], -1):
+                yield entry['key'], entry['data']
+
+    def compact(self):
+        """Rewrite the journal without superseded attempts; returns the number of records kept"""
+        done = self.completed()
+        temp_path = self.path + '.compact'
+        kept = 0
+        counts = {}
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for key, record in self.records():
+                if key not in counts:
+                    f.write(json.dumps({'event': 'start', 'key': key}, ensure_ascii=False) + '\n')
+                    counts[key] = 0
+                f.write(json.dumps({'event': 'item', 'key': key, 'data': record}, ensure_ascii=False) + '\n')
+                counts[key] += 1
+                kept += 1
+            for key in done:
+                if key not in counts:
+                    f.write(json.dumps({'event': 'start', 'key': key}, ensure_ascii=False) + '\n')
+                f.write(json.dumps({'event': 'done', 'key': key, 'count': counts.get(key, 0)}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        with self.lock:
+            self.file.close()
+            os.replace(temp_path, self.path)
+            self.file = self._open()
+        return kept
+
+    def archive(self, path):
+        """Close the journal and move it to `path`, so the next run starts a fresh one"""
+        self.close()
+        os.replace(self.path, path)
+        return path
+
+    def close(self):
+        """Close the journal file"""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
@@ -0,0 +1,142 @@
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Scroll height and element count of the document, the cheapest signal that new content arrived
+PAGE_SIZE_SCRIPT = "return [document.body ? document.body.scrollHeight : 0, document.getElementsByTagName('*').length];"
+
+# Resource entries finished so far; the count stops changing once the page goes quiet
+RESOURCE_COUNT_SCRIPT = "return window.performance ? performance.getEntriesByType('resource').length : 0;"
+
+
+class AdaptiveTimeout:
+    """
+    Timeout that follows how long a wait actually takes on this site.
+
+    Starts at `initial` seconds; once waits have been observed it becomes
+    `multiplier` x the slow end (90th percentile) of the recent durations,
+    clamped to [minimum, maximum]. Only waits that saw new content are
+    learned from: a wait that ends with nothing new usually means the feed
+    ended or the post has no comments, not that the site is slow, so it is
+    counted in `ended` instead. Waits where nothing new is the likely outcome
+    go through confirm_end(), which never waits longer than `end_cap`.
+    """
+
+    def __init__(self, initial=10, minimum=1, maximum=30, multiplier=3, window=20, end_cap=2):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.window = window
+        self.end_cap = end_cap
+        self.samples = []
+        self.ended = 0
+        self.lock = threading.Lock()
+
+    @property
+    def current(self):
+        """Timeout to use for the next wait, in seconds"""
+        with self.lock:
+            if not self.samples:
+                return self.initial
+            ordered = sorted(self.samples)
+            slow = ordered[int(0.9 * (len(ordered) - 1))]
+        return min(self.maximum, max(self.minimum, slow * self.multiplier))
+
+    def observe(self, elapsed):
+        """Record how long it took for new content to arrive"""
+        with self.lock:
+            self.samples.append(elapsed)
+            del self.samples[:-self.window]
+
+    def _run(self, timeout, wait_function, args, kwargs):
+        """Run a wait, learning from it only if new content arrived"""
+        start = time.monotonic()
+        result = wait_function(*args, timeout=timeout, **kwargs)
+        if result:
+            self.observe(time.monotonic() - start)
+        else:
+            with self.lock:
+                self.ended += 1
+        return result
+
+    def wait(self, wait_function, *args, **kwargs):
+        """Run one of the wait_* functions below with the current timeout"""
+        return self._run(self.current, wait_function, args, kwargs)
+
+    def confirm_end(self, wait_function, *args, **kwargs):
+        """Like wait(), for a check that usually finds nothing new (capped at `end_cap` seconds)"""
+        return self._run(min(self.current, self.end_cap), wait_function, args, kwargs)
+
+
+def wait_until(driver, condition, timeout=10, poll_frequency=0.25):
+    """Condition's first truthy result, or None if `timeout` seconds pass first"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
+    except TimeoutException:
+        return None
+
+
+def wait_for_ready_state(driver, timeout=15):
+    """Wait until the document has finished loading"""
+    return bool(wait_until(
+        driver, lambda d: d.execute_script("return document.readyState") == "complete", timeout
+    ))
+
+
+def page_size(driver):
+    """(scroll height, element count) of the current page"""
+    try:
+        return tuple(driver.execute_script(PAGE_SIZE_SCRIPT))
+    except WebDriverException:
+        return (0, 0)
+
+
+def wait_for_page_growth(driver, previous_size, timeout=10):
+    """Wait until the page's height or element count differs from `previous_size`"""
+    return bool(wait_until(driver, lambda d: page_size(d) != tuple(previous_size), timeout))
+
+
+def wait_for_count_increase(root, css_selector, previous_count, timeout=10):
+    """
+    Wait until more than `previous_count` elements match `css_selector`.
+
+    `root` is the driver or an element to search under. Returns the new count,
+    or 0 on timeout.
+    """
+    def more_elements(_):
+        count = len(root.find_elements(By.CSS_SELECTOR, css_selector))
+        return count if count > previous_count else False
+
+    driver = getattr(root, 'parent', root)
+    return wait_until(driver, more_elements, timeout) or 0
+
+
+def wait_for_network_idle(driver, idle_time=0.5, timeout=10):
+    """Wait until the page has loaded and no resource has finished for `idle_time` seconds"""
+    state = {'count': -1, 'since': time.monotonic()}
+
+    def idle(d):
+        count = d.execute_script(RESOURCE_COUNT_SCRIPT)
+        now = time.monotonic()
+        if count != state['count']:
+            state['count'], state['since'] = count, now
+            return False
+        return d.execute_script("return document.readyState") == "complete" and now - state['since'] >= idle_time
+
+    return bool(wait_until(driver, idle, timeout, poll_frequency=min(0.25, idle_time / 2)))
+
+
+def wait_for_cookie(driver, name, timeout=180, poll_frequency=1):
+    """Wait until the browser holds cookie `name` (e.g. a session cookie set at login); returns it or None"""
+    return wait_until(driver, lambda d: d.get_cookie(name), timeout, poll_frequency)
+
+
+def scroll_and_wait(driver, timeout=10):
+    """Scroll to the bottom and wait for more content; False if nothing new loaded in time"""
+    before = page_size(driver)
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    return wait_for_page_growth(driver, before, timeout)
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('aiohttp')
+pytest.importorskip('requests')
+
+from async_fetcher import AsyncFetcher, fetch_urls
+from fixtures.fake_news_site import start_server
+from http_cache import HttpCache
+
+
+@pytest.fixture
+def site():
+    servers = []
+
+    def start(**options):
+        server, stats, url = start_server(**options)
+        servers.append(server)
+        return stats, url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+def article_urls(base_url, count):
+    return [f"{base_url}/article/{number}" for number in range(count)]
+
+
+def host_of(base_url):
+    return base_url.split('://', 1)[1]
+
+
+def test_concurrency_is_bounded(site):
+    stats, url = site(delay=0.2)
+    results = asyncio.run(fetch_urls(article_urls(url, 12), requests_per_second=100, burst=12,
+                                     max_concurrency=3))
+
+    counters = stats.snapshot()[host_of(url)]
+    assert all(status == 200 for status, _ in results.values())
+    assert counters['max_in_flight'] == 3
+
+
+def test_requests_are_paced_per_host(site):
+    stats, url = site()
+    other_url = url.replace('127.0.0.1', 'localhost')
+    urls = article_urls(url, 5) + article_urls(other_url, 5)
+    asyncio.run(fetch_urls(urls, requests_per_second=5, burst=1, max_concurrency=10))
+
+    snapshot = stats.snapshot()
+    for base in (url, other_url):
+        times = snapshot[host_of(base)]['article_times']
+        assert len(times) == 5
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        assert min(gaps) > 0.15
+    # The two hosts have their own buckets, so they were fetched side by side
+    first = [snapshot[host_of(base)]['article_times'][0] for base in (url, other_url)]
+    assert abs(first[0] - first[1]) < 0.15
+
+
+def test_cookies_are_primed_once_per_host(site):
+    stats, url = site(delay=0.05)
+    asyncio.run(fetch_urls(article_urls(url, 8), requests_per_second=100, burst=8, max_concurrency=4,
+                           prime_urls={host_of(url): f"{url}/"}))
+
+    counters = stats.snapshot()[host_of(url)]
+    assert counters['primes'] == 1
+    assert counters['articles'] == 8
+    assert counters['without_cookie'] == 0
+
+
+def test_throttled_requests_are_reported(site):
+    stats, url = site(throttle_every=2)
+    results = asyncio.run(fetch_urls(article_urls(url, 6), requests_per_second=100, burst=6, max_retries=0))
+
+    statuses = sorted(status for status, _ in results.values())
+    assert statuses.count(429) == 3
+    assert statuses.count(200) == 3
+
+
+def test_retry_after_pauses_the_host(site):
+    stats, url = site(throttle_every=3)
+    started = time.monotonic()
+    results = asyncio.run(fetch_urls(article_urls(url, 4), requests_per_second=100, burst=4))
+    elapsed = time.monotonic() - started
+
+    counters = stats.snapshot()[host_of(url)]
+    assert counters['throttled'] == 1
+    assert all(status == 200 for status, _ in results.values())
+    # The fake site sends Retry-After: 1
+    assert elapsed >= 0.9
+    assert counters['article_times'][-1] - counters['article_times'][2] >= 0.9
+
+
+def test_stale_entries_are_revalidated(site, tmp_path):
+    stats, url = site()
+    urls = article_urls(url, 4)
+
+    async def run():
+        cache = HttpCache(path=str(tmp_path / 'cache.sqlite'), freshness={'article': 0})
+        try:
+            async with AsyncFetcher(requests_per_second=100, burst=4, cache=cache) as fetcher:
+                return [result async for result in fetcher.fetch_all(urls)]
+        finally:
+            cache.close()
+
+    first = asyncio.run(run())
+    second = asyncio.run(run())
+
+    counters = stats.snapshot()[host_of(url)]
+    assert counters['not_modified'] == 4
+    assert {u: body for u, _, body in first} == {u: body for u, _, body in second}
@@ -0,0 +1,45 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('bs4')
+
+from html_parsing import ExtractionPlan, available_backends, joined, json_ld, text
+from parser_benchmark import FIXTURE_DIR, PLANS, check_backends, load_pages, load_plan
+
+
+def plan_or_skip(site):
+    try:
+        return load_plan(site)
+    except ImportError as e:
+        pytest.skip(f"{site} scraper dependencies not installed: {e}")
+
+
+@pytest.mark.parametrize('site', sorted(PLANS))
+def test_backends_agree_on_fixture_pages(site):
+    plan = plan_or_skip(site)
+    pages = load_pages(os.path.join(FIXTURE_DIR, site))
+    assert pages
+
+    backends = [backend for backend in available_backends() if backend != 'html.parser']
+    assert check_backends(plan, pages, backends) == []
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_fallback_rules(backend):
+    plan = ExtractionPlan({
+        'title': [json_ld('headline'), text('h1')],
+        'author': [json_ld('author', 'name'), text('.byline')],
+        'body': [joined('.missing', 'p', ' '), joined('.story', 'p', ' ')],
+        'date': [text('time')],
+    })
+    html = ('<html><head><script type="application/ld+json">{"author": [{"name": "A. Writer"}]}</script>'
+            '</head><body><h1> Schools reopen </h1><div class="story"><p>One.</p><p></p><p>Two.</p></div>'
+            '</body></html>')
+
+    assert plan.extract(html, backend) == {
+        'title': 'Schools reopen', 'author': 'A. Writer', 'body': 'One. Two.', 'date': None,
+    }
@@ -0,0 +1,87 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+requests = pytest.importorskip('requests')
+
+from fixtures.fake_news_site import start_server
+from http_cache import HttpCache
+
+
+@pytest.fixture
+def site():
+    server, stats, url = start_server()
+    yield stats, url
+    server.shutdown()
+
+
+def article_requests(stats, url):
+    return stats.snapshot().get(url.split('://', 1)[1], {}).get('articles', 0)
+
+
+def test_fresh_entries_skip_the_network(site, tmp_path):
+    stats, url = site
+    cache = HttpCache(path=str(tmp_path / 'cache.sqlite'))
+    session = requests.Session()
+
+    first = cache.fetch(session, f"{url}/article/1")
+    second = cache.fetch(session, f"{url}/article/1")
+
+    assert first[0] == 200 and second == first
+    assert article_requests(stats, url) == 1
+    assert cache.stats['fresh_hits'] == 1 and cache.stats['misses'] == 1
+    cache.close()
+
+
+def test_stale_entries_are_revalidated_with_the_server_etag(site, tmp_path):
+    stats, url = site
+    cache = HttpCache(path=str(tmp_path / 'cache.sqlite'), freshness={'article': 0})
+    session = requests.Session()
+
+    first = cache.fetch(session, f"{url}/article/2")
+    second = cache.fetch(session, f"{url}/article/2")
+
+    assert second == first
+    assert stats.snapshot()[url.split('://', 1)[1]]['not_modified'] == 1
+    assert cache.stats['revalidated'] == 1
+    entry = cache.lookup(f"{url}/article/2")
+    assert entry['etag'] == '"article-2-v1"'
+    # The fake site sends no Last-Modified, so none is invented
+    assert entry['last_modified'] is None
+    cache.close()
+
+
+def test_listing_pages_expire_sooner(tmp_path):
+    cache = HttpCache(path=str(tmp_path / 'cache.sqlite'), listing_patterns=[r'/news/?$'],
+                      freshness={'listing': 0})
+    cache.store('http://example.test/news', 200, {}, b'listing')
+    cache.store('http://example.test/article/1', 200, {}, b'article')
+
+    assert not cache.lookup('http://example.test/news')['is_fresh']
+    assert cache.lookup('http://example.test/article/1')['is_fresh']
+    cache.close()
+
+
+def test_only_successful_responses_are_stored(tmp_path):
+    cache = HttpCache(path=str(tmp_path / 'cache.sqlite'))
+    cache.store('http://example.test/missing', 404, {}, b'not found')
+
+    assert cache.lookup('http://example.test/missing') is None
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    body = os.urandom(4000)  # incompressible, so each entry takes ~4 KB
+    cache = HttpCache(path=str(tmp_path / 'cache.sqlite'), max_bytes=10000)
+    cache.store('http://example.test/a', 200, {}, body)
+    cache.store('http://example.test/b', 200, {}, body)
+    cache.mark_accessed('http://example.test/a')
+    cache.store('http://example.test/c', 200, {}, body)
+
+    assert cache.lookup('http://example.test/b') is None
+    assert cache.lookup('http://example.test/a') is not None
+    assert cache.lookup('http://example.test/c') is not None
+    cache.close()
@@ -0,0 +1,71 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Dashboard'))
+
+pytest.importorskip('dotenv')
+
+from database import prompt_builder
+from database.prompt_builder import PromptBuilder, TokenCounter
+
+
+@pytest.fixture
+def counter(monkeypatch):
+    """The ~4 characters per token estimate, so sizes do not depend on tiktoken being installed"""
+    monkeypatch.setattr(prompt_builder, 'tiktoken', None)
+    return TokenCounter()
+
+
+def prompt_tokens(counter, messages):
+    return sum(counter.message(message) for message in messages)
+
+
+def post(number):
+    return f"[{number}] " + "parents discuss school fees " * 3
+
+
+def test_posts_fill_the_budget_without_exceeding_it(counter):
+    builder = PromptBuilder(max_prompt_tokens=300, counter=counter)
+    messages, sizes = builder.build("You answer questions about posts.", "What about fees?",
+                                    posts=[post(n) for n in range(50)])
+
+    assert 0 < sizes['posts_included'] < 50
+    assert prompt_tokens(counter, messages) <= 300
+    assert prompt_tokens(counter, messages) <= sizes['total']
+    # One more post would not have fitted
+    assert sizes['total'] + counter.count(post(0)) + counter.count('\n') > 300
+
+
+def test_posts_are_kept_whole_and_best_first(counter):
+    builder = PromptBuilder(max_prompt_tokens=300, counter=counter)
+    posts = [post(n) for n in range(50)]
+    messages, sizes = builder.build("System.", "Question?", posts=posts)
+
+    listed = messages[0]['content'].split("RELEVANT POSTS FOUND:\n", 1)[1].split('\n')
+    assert listed == posts[:sizes['posts_included']]
+
+
+def test_history_and_summary_stay_within_budget(counter):
+    builder = PromptBuilder(max_prompt_tokens=400, posts_share=0.5, summary_tokens=40, counter=counter)
+    history = []
+    for n in range(10):
+        history.append({'role': 'user', 'content': f"Question {n} about school transport and fees?"})
+        history.append({'role': 'assistant', 'content': "A fairly long answer about the posts. " * 4})
+    messages, sizes = builder.build("System.", "And now?", posts=[post(n) for n in range(20)], history=history)
+
+    assert prompt_tokens(counter, messages) <= 400
+    assert sizes['history_kept'] + sizes['history_summarized'] + sizes['history_dropped'] == len(history)
+    kept = [message for message in messages[1:-1] if message['role'] != 'system']
+    assert kept and kept[0]['role'] == 'user'
+    assert messages[-1] == {'role': 'user', 'content': "And now?"}
+
+
+def test_long_question_is_cut_to_its_share(counter):
+    builder = PromptBuilder(max_prompt_tokens=200, user_share=0.25, counter=counter)
+    messages, sizes = builder.build("System.", "why " * 500)
+
+    assert sizes['user'] <= 50
+    assert messages[-1]['content'].endswith('...')
+    assert prompt_tokens(counter, messages) <= 200
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Dashboard'))
+
+pytest.importorskip('pandas')
+
+from database.query_planner import QueryPlanner
+
+QUESTIONS = [
+    # Analytics questions
+    ("How has sentiment changed over the last 3 months?", 'sentiment_trend'),
+    ("Show the daily trend of negative posts", 'sentiment_trend'),
+    ("How many posts per week about Reddit?", 'sentiment_trend'),
+    ("What is the sentiment breakdown on LinkedIn?", 'sentiment_breakdown'),
+    ("How many positive posts are there?", 'sentiment_breakdown'),
+    ("Which platform has the most negative posts?", 'platform_comparison'),
+    ("What platforms are most active?", 'platform_comparison'),
+    ("How does Reddit compare to Quora?", 'platform_comparison'),
+    ("Show sentiment by platform", 'platform_comparison'),
+    ("How many posts are in the database?", 'post_count'),
+    ("What is the total number of posts in 2024?", 'post_count'),
+    # Ordinary questions that only share a word with the analytics cues
+    ("How can I change the date filter?", None),
+    ("What platform is this chatbot running on?", None),
+    ("Which platform do you run on?", None),
+    ("Can I change the theme to light mode?", None),
+    ("Find posts about school fees", None),
+    ("Summarize posts mentioning teachers", None),
+    ("Hello, what can you do?", None),
+]
+
+
+@pytest.mark.parametrize('question, intent', QUESTIONS)
+def test_detect_intent(question, intent):
+    assert QueryPlanner().detect_intent(question) == intent
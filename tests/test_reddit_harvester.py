@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('praw')
+pytest.importorskip('pandas')
+
+from fixtures.fake_reddit_api import POOL_SIZE, post_id, start_server
+from reddit_harvester import RateBudget, RedditHarvester
+
+
+@pytest.fixture
+def api():
+    servers = []
+
+    def start(**options):
+        server, stats, url = start_server(**options)
+        servers.append(server)
+        return stats, url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+def harvester(url, **options):
+    return RedditHarvester('client-id', 'client-secret', 'test harvester', api_url=url, num_workers=2,
+                           budget=RateBudget(requests_per_second=100), **options)
+
+
+def test_posts_found_by_several_keywords_get_one_row(api):
+    # A one-second window with a large limit keeps the budget from pacing the test
+    stats, url = api(limit=1000, window=1)
+    keywords = ['schools', 'fees', 'teachers']
+    df = harvester(url).harvest(keywords, ['dubai'])
+
+    assert stats.searches == len(keywords)
+    assert df['url'].is_unique
+    assert len(df) < 15 * len(keywords)
+    shared = df[df['keywords'].str.contains(', ')]
+    assert not shared.empty
+    for row in shared.itertuples():
+        assert set(row.keywords.split(', ')) <= set(keywords)
+
+
+def test_comments_are_loaded_once_per_post_with_comments(api):
+    stats, url = api(limit=1000, window=1)
+    df = harvester(url).harvest(['schools', 'fees'], ['dubai'])
+
+    numbers = [number for number in range(POOL_SIZE) if post_id(number) in
+               {u.rstrip('/').rsplit('/', 1)[-1] for u in df['url']}]
+    with_comments = {post_id(number) for number in numbers if number % 5}
+    assert stats.comment_requests == {submission_id: 1 for submission_id in with_comments}
+    for row in df.itertuples():
+        number = int(row.url.rstrip('/').rsplit('/', 1)[-1][len('fake'):])
+        assert len(row.comments) == min(number % 5, 3)
+
+
+def test_budget_slows_down_when_few_requests_remain(api):
+    stats, url = api(limit=8, window=60)
+    reddit = harvester(url)
+    reddit.search('schools', 'dubai')
+
+    # 7 requests left, 5 of them held in reserve: 2 spread over the rest of the minute
+    assert reddit.budget.bucket.rate < 3 / 59
+    assert reddit.budget.bucket.rate > 1 / 61
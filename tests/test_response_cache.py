@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Dashboard'))
+
+pytest.importorskip('dotenv')
+pytest.importorskip('pandas')
+pytest.importorskip('sqlalchemy')
+
+from database import response_cache
+from database.response_cache import ResponseCache
+
+MODEL = 'together/test-model'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the cache, without the embedding fallback"""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, 'time', lambda: now[0])
+    monkeypatch.setattr(response_cache, 'get_encoder', lambda: None)
+    return now
+
+
+def test_normalized_questions_share_an_entry(clock):
+    cache = ResponseCache()
+    cache.put("What do parents think about fees?", 'All Platforms', 3, MODEL, 'answer')
+
+    assert cache.get("what do parents think about FEES 🤔", 'All Platforms', 3, MODEL) == 'answer'
+    assert cache.stats()['hits'] == 1
+
+
+def test_key_includes_platform_data_version_and_model(clock):
+    cache = ResponseCache()
+    cache.put("fees", 'Reddit', 3, MODEL, 'answer')
+
+    assert cache.get("fees", 'Quora', 3, MODEL) is None
+    assert cache.get("fees", 'Reddit', 4, MODEL) is None
+    assert cache.get("fees", 'Reddit', 3, 'openai/other-model') is None
+    assert cache.get("fees", 'Reddit', 3, MODEL) == 'answer'
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(ttl=60)
+    cache.put("fees", 'All Platforms', 1, MODEL, 'answer')
+
+    clock[0] += 60
+    assert cache.get("fees", 'All Platforms', 1, MODEL) == 'answer'
+    clock[0] += 1
+    assert cache.get("fees", 'All Platforms', 1, MODEL) is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(max_entries=2)
+    cache.put("first", 'All Platforms', 1, MODEL, 'one')
+    cache.put("second", 'All Platforms', 1, MODEL, 'two')
+    # Reading the first entry makes the second one the least recently used
+    assert cache.get("first", 'All Platforms', 1, MODEL) == 'one'
+    cache.put("third", 'All Platforms', 1, MODEL, 'three')
+
+    assert cache.get("second", 'All Platforms', 1, MODEL) is None
+    assert cache.get("first", 'All Platforms', 1, MODEL) == 'one'
+    assert cache.get("third", 'All Platforms', 1, MODEL) == 'three'
+    assert cache.stats()['entries'] == 2
@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Dashboard'))
+
+pytest.importorskip('dotenv')
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+pytest.importorskip('sqlalchemy')
+
+from database import retrieval
+from database.retrieval import SearchIndex, tokenize
+
+
+class StoredEmbeddings:
+    """Stands in for DatabaseManager.execute_query, returning the search_embeddings rows asked for"""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def execute_query(self, query, params=None):
+        rows = [(post_id, self.vectors[post_id].astype(np.float32).tobytes())
+                for post_id in params['ids'] if post_id in self.vectors]
+        return pd.DataFrame(rows, columns=['post_id', 'embedding'])
+
+
+def test_tokenize_drops_stopwords_short_words_and_punctuation():
+    assert tokenize("What do parents think about the School-Fees in Dubai?!") == \
+        ['do', 'parents', 'think', 'school', 'fees', 'dubai']
+    assert tokenize("I am a K 12 teacher") == ['am', '12', 'teacher']
+    assert tokenize(None) == []
+
+
+def test_tokenize_keeps_arabic_words():
+    assert tokenize("رسوم المدارس in UAE") == ['رسوم', 'المدارس', 'uae']
+
+
+def test_rerank_blends_bm25_and_embedding_similarity(monkeypatch):
+    monkeypatch.setitem(retrieval.RETRIEVAL_CONFIG, 'embedding_weight', 0.5)
+    monkeypatch.setattr(retrieval, 'encode', lambda texts: np.array([[1.0, 0.0]], dtype=np.float32))
+    # Post 2 has the lower BM25 score but matches the question's meaning
+    index = SearchIndex(StoredEmbeddings({1: np.array([0.0, 1.0]), 2: np.array([1.0, 0.0])}))
+    results = pd.DataFrame({'id': [1, 2, 3], 'score': [4.0, 3.0, 2.0]})
+
+    reranked = index._rerank("school fees", results)
+
+    assert list(reranked['id']) == [2, 1, 3]
+    assert reranked['score'].tolist() == pytest.approx([0.875, 0.5, 0.25])
+
+
+def test_rerank_keeps_bm25_order_without_stored_embeddings(monkeypatch):
+    monkeypatch.setattr(retrieval, 'encode', lambda texts: np.array([[1.0, 0.0]], dtype=np.float32))
+    index = SearchIndex(StoredEmbeddings({}))
+    results = pd.DataFrame({'id': [1, 2], 'score': [4.0, 3.0]})
+
+    assert index._rerank("school fees", results) is results
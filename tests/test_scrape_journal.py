@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrape_journal import ScrapeJournal
+
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_torn_last_line_is_cut_on_open(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = ScrapeJournal(path)
+    journal.start('a')
+    journal.append('a', {'n': 1})
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"event": "item", "key": "a", "da')
+
+    journal = ScrapeJournal(path)
+    journal.start('b')
+    journal.close()
+
+    assert [entry['event'] for entry in read_lines(path)] == ['start', 'item', 'start']
+
+
+def test_journal_of_one_torn_line_starts_empty(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"event": "sta')
+
+    journal = ScrapeJournal(path)
+    journal.start('a')
+    journal.close()
+
+    assert read_lines(path) == [{'event': 'start', 'key': 'a'}]
+
+
+def test_restarted_key_is_not_completed(tmp_path):
+    journal = ScrapeJournal(str(tmp_path / 'journal.jsonl'))
+    journal.start('a')
+    journal.finish('a', 0)
+    journal.start('b')
+    journal.finish('b', 0)
+    journal.start('a')
+
+    assert journal.completed() == {'b'}
+    journal.close()
+
+
+def test_records_come_from_the_latest_attempt(tmp_path):
+    journal = ScrapeJournal(str(tmp_path / 'journal.jsonl'))
+    journal.start('a')
+    journal.append('a', {'n': 1})
+    journal.start('b')
+    journal.append('b', {'n': 2})
+    journal.start('a')
+    journal.append('a', {'n': 3})
+
+    assert list(journal.records()) == [('b', {'n': 2}), ('a', {'n': 3})]
+    journal.close()
+
+
+def test_compact_keeps_unfinished_keys_unfinished(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = ScrapeJournal(path)
+    journal.start('done')
+    journal.append('done', {'n': 1})
+    journal.start('done')
+    journal.append('done', {'n': 2})
+    journal.finish('done', 1)
+    journal.start('partial')
+    journal.append('partial', {'n': 3})
+
+    assert journal.compact() == 2
+    assert journal.completed() == {'done'}
+    assert list(journal.records()) == [('done', {'n': 2}), ('partial', {'n': 3})]
+    assert {'event': 'done', 'key': 'partial', 'count': 1} not in read_lines(path)
+
+    # Still appendable after the rewrite
+    journal.append('partial', {'n': 4})
+    assert list(journal.records())[-1] == ('partial', {'n': 4})
+    journal.close()
@@ -0,0 +1,91 @@
+import argparse
+import os
+import time
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+from quora_engine import setup_driver
+from selenium_waits import AdaptiveTimeout, page_size, scroll_and_wait, wait_for_page_growth, wait_for_ready_state
+
+FIXTURE = Path(__file__).resolve().parent / 'fixtures' / 'scroll_feed.html'
+
+# The Quora scrapers' old fixed-sleep schedule for one question page:
+# scrolls, then rounds of "more answers" clicks each followed by another scroll
+FIXED_SCROLLS = 8
+FIXED_SCROLL_SLEEP = 2
+FIXED_CLICKS = 3
+FIXED_CLICK_SLEEP = 2
+
+
+def item_count(driver):
+    """Items rendered on the fixture page"""
+    return len(driver.find_elements(By.CSS_SELECTOR, '.item'))
+
+
+def run_fixed(driver):
+    """Replay a question page with the old fixed sleeps"""
+    for _ in range(FIXED_SCROLLS):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(FIXED_SCROLL_SLEEP)
+    for _ in range(FIXED_CLICKS):
+        driver.execute_script("arguments[0].click();", driver.find_element(By.ID, 'more'))
+        time.sleep(FIXED_CLICK_SLEEP)
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(FIXED_SCROLL_SLEEP)
+
+
+def run_event(driver, scroll_timeout, click_timeout):
+    """Replay a question page as quora_engine.scrape_question does, waiting only until new content appears"""
+    for _ in range(FIXED_SCROLLS):
+        if not scroll_timeout.wait(scroll_and_wait, driver):
+            break
+    for _ in range(FIXED_CLICKS):
+        before = page_size(driver)
+        driver.execute_script("arguments[0].click();", driver.find_element(By.ID, 'more'))
+        click_timeout.wait(wait_for_page_growth, driver, before)
+        scroll_timeout.confirm_end(scroll_and_wait, driver)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fixed sleeps with event-driven waits on a local fixture page")
+    parser.add_argument('--pages', type=int, default=10,
+                        help="Page loads per strategy (the adaptive timeouts carry over between them)")
+    parser.add_argument('--delay', type=int, default=400, help="Milliseconds the fixture takes to render new content")
+    parser.add_argument('--batches', type=int, default=4, help="Batches the fixture loads on scroll before it ends")
+    args = parser.parse_args()
+
+    url = f"{FIXTURE.as_uri()}?delay={args.delay}&batches={args.batches}"
+    driver = setup_driver(headless=True)
+    if not driver:
+        return
+
+    # One set of adaptive timeouts for all page loads, as in the scrapers
+    scroll_timeout = AdaptiveTimeout(initial=6, maximum=15)
+    click_timeout = AdaptiveTimeout(initial=4, maximum=10)
+    strategies = {
+        'fixed sleeps': run_fixed,
+        'event waits': lambda d: run_event(d, scroll_timeout, click_timeout),
+    }
+
+    try:
+        print(f"Fixture: {os.path.relpath(FIXTURE)} (delay {args.delay} ms, {args.batches} scroll batches)")
+        for name, strategy in strategies.items():
+            timings = []
+            for _ in range(args.pages):
+                driver.get(url)
+                wait_for_ready_state(driver)
+                start = time.perf_counter()
+                strategy(driver)
+                timings.append(time.perf_counter() - start)
+                items = item_count(driver)
+            print(f"  {name:<13} {sum(timings) / len(timings):6.2f} s/page "
+                  f"(first {timings[0]:.2f}, last {timings[-1]:.2f}, max {max(timings):.2f}), {items} items loaded")
+        print(f"  Adaptive timeouts after {args.pages} pages: scroll {scroll_timeout.current:.1f}s "
+              f"({scroll_timeout.ended} ended), click {click_timeout.current:.1f}s ({click_timeout.ended} ended)")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()